@@ -0,0 +1,23 @@
+"""Benchmark chart downsampling on a long series."""
+
+import json
+import time
+import numpy as np
+from ui_mcp_server.charts import DOWNSAMPLERS
+
+
+def main(length: int = 1_000_000, max_points: int = 1000) -> None:
+    """Time every downsampling algorithm and report the payload size."""
+    values = np.cumsum(np.random.default_rng(0).standard_normal(length))
+    full_size = len(json.dumps(values.tolist()))
+    print(f"{length:,} points, {full_size / 1e6:.1f} MB as JSON")
+    for name, downsampler in DOWNSAMPLERS.items():
+        start = time.perf_counter()
+        index, sampled = downsampler(values, max_points)
+        elapsed = time.perf_counter() - start
+        size = len(json.dumps({"data": sampled.tolist(), "index": index.tolist()}))
+        print(f"{name:>7}: {elapsed * 1e3:6.1f} ms, {size / 1e3:6.1f} kB")
+
+
+if __name__ == "__main__":
+    main()
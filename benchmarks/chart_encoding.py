@@ -0,0 +1,44 @@
+"""Benchmark binary chart encodings against plain JSON."""
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+import numpy as np
+from ui_mcp_server.charts import decode_array, render
+from ui_mcp_server.models import Chart, EncodedArray
+
+
+def best_of(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the fastest of several runs in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e3
+
+
+def main(length: int = 100_000) -> None:
+    """Compare payload size and client decode time of every encoding."""
+    values = np.cumsum(np.random.default_rng(0).standard_normal(length)).tolist()
+    print(f"{length:,} points")
+    for encoding in ("json", "float32", "float64"):
+        params = Chart(
+            type="line", data=values, x_label="X", y_label="Y", encoding=encoding
+        )
+        payload = render(params).model_dump_json()
+
+        def decode(payload: str = payload) -> None:
+            data = json.loads(payload)
+            if data["encoded_data"] is not None:
+                decode_array(EncodedArray.model_validate(data["encoded_data"]))
+
+        print(
+            f"{encoding:>7}: {len(payload) / 1e3:8.1f} kB, "
+            f"decode {best_of(decode):6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
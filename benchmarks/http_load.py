@@ -0,0 +1,143 @@
+"""Load test of the streamable HTTP transport against the stdio baseline."""
+
+import asyncio
+import itertools
+import json
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+import httpx
+
+
+SERVER = [
+    sys.executable,
+    "-c",
+    "from ui_mcp_server import main; main()",
+    "--log-level=WARNING",
+]
+ARGUMENTS = {"params": {"type": "slider", "label": "Load", "max_value": 10}}
+REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {"name": "number_input", "arguments": ARGUMENTS},
+}
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "load-test", "version": "0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+HEADERS = {"Accept": "application/json, text/event-stream"}
+
+
+async def measure(
+    call: Callable[[], Awaitable[object]], requests: int, concurrency: int
+) -> float:
+    """Run `requests` calls with the given concurrency and return requests/sec."""
+    await call()  # Warm up, e.g. to register the tools.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited() -> None:
+        async with semaphore:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited() for _ in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def stdio(requests: int, concurrency: int) -> float:
+    """Measure a single client talking JSON-RPC to its own stdio server."""
+    process = await asyncio.create_subprocess_exec(
+        *SERVER, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    )
+    assert process.stdin is not None and process.stdout is not None
+    stdin, stdout = process.stdin, process.stdout
+
+    async def send(message: dict[str, Any]) -> None:
+        stdin.write(json.dumps(message).encode() + b"\n")
+        await stdin.drain()
+
+    await send(INITIALIZE)
+    await stdout.readline()
+    await send(INITIALIZED)
+
+    pending: dict[int, asyncio.Future] = {}
+
+    async def read() -> None:
+        while line := await stdout.readline():
+            response = json.loads(line)
+            pending.pop(response["id"]).set_result(response)
+
+    reader = asyncio.create_task(read())
+    ids = itertools.count(1)
+
+    async def call() -> None:
+        request_id = next(ids)
+        pending[request_id] = asyncio.get_running_loop().create_future()
+        await send(REQUEST | {"id": request_id})
+        await pending[request_id]
+
+    try:
+        return await measure(call, requests, concurrency)
+    finally:
+        reader.cancel()
+        stdin.close()
+        await process.wait()
+
+
+async def http(requests: int, concurrency: int, workers: int, port: int) -> float:
+    """Measure concurrent clients against a stateless streamable HTTP server."""
+    process = subprocess.Popen(
+        SERVER
+        + [
+            "--transport=streamable-http",
+            "--stateless",
+            "--json-response",
+            f"--port={port}",
+            f"--workers={workers}",
+        ]
+    )
+    url = f"http://127.0.0.1:{port}/mcp"
+    limits = httpx.Limits(max_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(
+            headers=HEADERS, limits=limits, timeout=30
+        ) as client:
+            while True:
+                try:
+                    await client.post(url, json=REQUEST)
+                    break
+                except httpx.ConnectError:
+                    await asyncio.sleep(0.1)
+
+            async def call() -> None:
+                response = await client.post(url, json=REQUEST)
+                response.raise_for_status()
+
+            return await measure(call, requests, concurrency)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def main(requests: int = 1000, concurrency: int = 16) -> None:
+    """Print requests/sec of every transport."""
+    print(f"{requests} tool calls, concurrency {concurrency}")
+    rate = await stdio(requests, concurrency)
+    print(f"stdio:                        {rate:7.0f} req/s")
+    for workers in (1, 2, 4):
+        rate = await http(requests, concurrency, workers, port=8900 + workers)
+        print(f"streamable-http, {workers} worker(s): {rate:7.0f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
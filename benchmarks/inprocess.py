@@ -0,0 +1,68 @@
+"""Benchmark tool call latency in-process against the stdio transport."""
+
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+
+os.environ["FASTMCP_LOG_LEVEL"] = "WARNING"  # Set before creating the server.
+
+import anyio  # noqa: E402
+from mcp import ClientSession, StdioServerParameters  # noqa: E402
+from mcp.client.stdio import stdio_client  # noqa: E402
+from ui_mcp_server.inprocess import connect, langchain_tools  # noqa: E402
+from ui_mcp_server.models import NumberInput  # noqa: E402
+from ui_mcp_server.server import number_input  # noqa: E402
+
+
+ARGUMENTS = {"params": {"type": "slider", "label": "Latency", "max_value": 10}}
+SERVER = StdioServerParameters(
+    command=sys.executable,
+    args=["-c", "from ui_mcp_server import main; main()", "--log-level=WARNING"],
+)
+
+
+async def median_latency(call: Callable[[], Awaitable[object]], calls: int) -> float:
+    """Return the median latency of sequential calls in microseconds."""
+    await call()  # Warm up, e.g. to register the tools.
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+async def session_latency(session: ClientSession, calls: int) -> float:
+    """Measure tool calls through an MCP client session."""
+    return await median_latency(
+        lambda: session.call_tool("number_input", ARGUMENTS), calls
+    )
+
+
+async def main(calls: int = 500) -> None:
+    """Print the median latency of a tool call through every path."""
+    async with stdio_client(SERVER) as streams, ClientSession(*streams) as session:
+        await session.initialize()
+        stdio = await session_latency(session, calls)
+    async with connect() as session:
+        memory = await session_latency(session, calls)
+    tool = next(tool for tool in langchain_tools() if tool.name == "number_input")
+    langchain = await median_latency(lambda: tool.ainvoke(ARGUMENTS), calls)
+
+    async def direct() -> None:
+        number_input(NumberInput.model_validate(ARGUMENTS["params"]))
+
+    function = await median_latency(direct, calls)
+
+    print(f"median latency of {calls} sequential number_input calls")
+    print(f"stdio subprocess:        {stdio:8.0f} us")
+    print(f"in-process MCP session:  {memory:8.0f} us")
+    print(f"LangChain tool:          {langchain:8.0f} us")
+    print(f"validate and call:       {function:8.0f} us")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,95 @@
+"""Benchmark the tools/call handler for every component type against FastMCP's."""
+
+import os
+import statistics
+import time
+from typing import Any
+
+
+os.environ["FASTMCP_LOG_LEVEL"] = "WARNING"  # Set before creating the server.
+
+import anyio  # noqa: E402
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from mcp.types import CallToolRequest, CallToolRequestParams  # noqa: E402
+from ui_mcp_server.server import server  # noqa: E402
+
+
+CALLS = {
+    "number_input": {"type": "slider", "label": "Age", "max_value": 100},
+    "choice": {"type": "radio", "label": "Size", "options": ["S", "M", "L"]},
+    "chart": {
+        "type": "line",
+        "data": [i % 17 / 3 for i in range(500)],
+        "x_label": "t",
+        "y_label": "v",
+    },
+    "color_picker": {"type": "color_picker", "label": "Color", "value": "#ff0000"},
+    "date_input": {
+        "type": "date_input",
+        "label": "Day",
+        "format": "YYYY/MM/DD",
+        "min_value": "2024-01-01",
+        "value": "2024-02-29",
+    },
+    "time_input": {"type": "time_input", "label": "At", "value": "12:30:00"},
+    "audio_input": {"type": "audio_input", "label": "Record"},
+    "camera_input": {"type": "camera_input", "label": "Photo"},
+    "audio_output": {"type": "audio", "url": "sounds/bell.wav", "format": "audio/wav"},
+    "video_output": {"type": "video", "url": "videos/clip.mp4", "format": "video/mp4"},
+    "image_output": {
+        "type": "image",
+        "url": "images/cat.png",
+        "channels": "RGB",
+        "output_format": "PNG",
+    },
+}
+"""Parameters of a typical component for each of the eleven component tools."""
+
+
+def baseline() -> FastMCP:
+    """Create a plain FastMCP server with the same tools."""
+    plain = FastMCP("baseline")
+    for tool in server.enabled_tools():
+        plain.add_tool(tool.fn, name=tool.name, description=tool.description)
+    return plain
+
+
+async def median_latency(mcp: FastMCP, name: str, calls: int) -> tuple[float, int]:
+    """Return the median latency of a tool call in microseconds and its size."""
+    handler = mcp._mcp_server.request_handlers[CallToolRequest]
+    params: dict[str, Any] = {"params": CALLS[name]}
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=params),
+    )
+    result = await handler(request)  # Warm up, e.g. to cache the tool list.
+    assert not result.root.isError, result  # type: ignore[union-attr]
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await handler(request)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6, len(result.model_dump_json())
+
+
+async def main(calls: int = 300) -> None:
+    """Print the median latency and result size of every component tool."""
+    plain = baseline()
+    print(f"median of {calls} tools/call requests, handler only")
+    print(f"{'tool':<14} {'FastMCP':>9} {'bytes':>6} {'once':>9} {'bytes':>6}")
+    totals = [0.0, 0.0]
+    for name in CALLS:
+        before, before_size = await median_latency(plain, name, calls)
+        after, after_size = await median_latency(server, name, calls)
+        totals = [totals[0] + before, totals[1] + after]
+        print(
+            f"{name:<14} {before:7.0f}us {before_size:6} {after:7.0f}us {after_size:6}"
+        )
+    print(
+        f"{'total':<14} {totals[0]:7.0f}us {'':6} {totals[1]:7.0f}us "
+        f"({totals[0] / totals[1]:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,54 @@
+"""Benchmark write throughput of the component state stores."""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+from ui_mcp_server.models import NumberInput
+from ui_mcp_server.state import MemoryStateStore, StateStore
+from ui_mcp_server.state_sqlite import SQLiteStateStore
+
+
+def run_sessions(store: StateStore, sessions: int, writes: int) -> float:
+    """Write from concurrent sessions and return writes per second.
+
+    Every session generates components and submits a value for each, so half
+    of the writes also append to the value history.
+    """
+
+    def session(name: str) -> None:
+        for value in range(writes // 2):
+            component = NumberInput(type="slider", label="Value")
+            store.remember(name, component)
+            store.set_value(name, component.key, value)
+
+    threads = [
+        threading.Thread(target=session, args=(str(i),)) for i in range(sessions)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if isinstance(store, SQLiteStateStore):
+        store.flush()
+    return sessions * writes / (time.perf_counter() - start)
+
+
+def main(sessions: int = 16, writes: int = 1000) -> None:
+    """Compare the in-memory store with SQLite, per-write and grouped commits."""
+    print(f"{sessions} concurrent sessions, {writes} writes each")
+    rate = run_sessions(MemoryStateStore(sessions, 2**30, 3600), sessions, writes)
+    print(f"memory:                  {rate:9.0f} writes/s")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, batch_size in (("commit per write", 1), ("grouped commits", 256)):
+            store = SQLiteStateStore(
+                Path(directory) / f"{batch_size}.db", ttl=3600, batch_size=batch_size
+            )
+            rate = run_sessions(store, sessions, writes)
+            store.close()
+            print(f"sqlite, {name + ':':<17}{rate:9.0f} writes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Report the size of every tool in `tools/list`, full and compact."""
+
+import anyio
+from ui_mcp_server.server import server
+
+
+BYTES_PER_TOKEN = 4
+"""Rough average of common tokenizers on JSON, used to estimate tokens."""
+
+
+async def main() -> None:
+    """Print bytes and estimated tokens per tool before and after compaction."""
+    full = await server.list_tools(compact=False)
+    compact = await server.list_tools(compact=True)
+    print(f"{'tool':<16} {'bytes':>7} {'compact':>8} {'tokens':>7} {'compact':>8}")
+    totals = [0, 0]
+    for before, after in zip(full, compact, strict=True):
+        sizes = [
+            len(tool.model_dump_json(by_alias=True, exclude_none=True))
+            for tool in (before, after)
+        ]
+        totals = [total + size for total, size in zip(totals, sizes, strict=True)]
+        print(
+            f"{before.name:<16} {sizes[0]:7} {sizes[1]:8} "
+            f"{sizes[0] // BYTES_PER_TOKEN:7} {sizes[1] // BYTES_PER_TOKEN:8}"
+        )
+    print(
+        f"{'total':<16} {totals[0]:7} {totals[1]:8} "
+        f"{totals[0] // BYTES_PER_TOKEN:7} {totals[1] // BYTES_PER_TOKEN:8} "
+        f"({1 - totals[1] / totals[0]:.0%} smaller)"
+    )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -1,20 +1,32 @@
 """Backend Agent."""
 
+import asyncio
+import json
 import os
-from typing import Annotated, Literal
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, Literal
+import anyio
 from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, StructuredTool
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.sessions import Connection
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
 from langgraph.prebuilt import create_react_agent
-from pydantic import BaseModel, Field
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, TextResourceContents, Tool
+from pydantic import AnyUrl, BaseModel, Field
 
 
 DEFAULT_PROMPT = """You are an intelligent assistant that can operate the file 
 system and generate UI components.
 
 ## How to react to user requests
-- When the user asks for available files, you should first retrieve 
-the files, and display them in a single choice component.
+- When the user asks for available media files, display them with the 
+`list_media` tool, which lists them in a single choice component. Retrieve 
+other files from the file system and display them in a single choice 
+component.
 - When the user asks for displaying a media file, you should first 
 retrieve the full path of the file and then display the file in the 
 UI.
@@ -55,6 +67,184 @@ def get_model(model_name: str) -> str | ChatGoogleGenerativeAI:
     return model_name
 
 
+def connections() -> dict[str, Connection]:
+    """Get the MCP servers the agent uses."""
+    file_system_path = os.environ.get("FILE_SYSTEM_PATH") or "/home/"
+    return {
+        "ui-mcp-server": {
+            "command": "uvx",
+            "args": ["ui-mcp-server"],
+            "transport": "stdio",
+            # Stdio servers only inherit a few variables like PATH, so the
+            # settings are passed explicitly. `list_media` needs `data_dirs`.
+            "env": {
+                "UI_MCP_DATA_DIRS": json.dumps([file_system_path]),
+                **{
+                    name: value
+                    for name, value in os.environ.items()
+                    if name.startswith("UI_MCP_")
+                },
+            },
+        },
+        "file-system": {
+            "command": "npx",
+            "args": [
+                "-y",
+                "@modelcontextprotocol/server-filesystem",
+                file_system_path,
+            ],
+            "transport": "stdio",
+        },
+        "tavily-search": {
+            "url": "https://mcp.tavily.com/mcp/?tavilyApiKey="
+            + os.environ.get("TAVILY_API_KEY", ""),
+            "transport": "streamable_http",
+        },
+    }
+
+
+TOOLS_DIGEST = "ui://tools/digest"
+"""Resource of `ui-mcp-server` with the digest of its tool list."""
+
+CLOSED_SESSION_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, McpError)
+"""Errors of calls on a closed session. MCP errors only count when their code
+is `CONNECTION_CLOSED`, as servers also report e.g. invalid arguments with them."""
+
+
+class SessionPool:
+    """Live MCP sessions and their tools, shared by all agents of the process.
+
+    Every server is connected once, by a background task that keeps its session
+    open, and its tools are listed once per connection. Servers publishing a
+    digest of their tool list, like `ui-mcp-server`, are not even listed again
+    on reconnection while the digest is unchanged.
+
+    When a tool call finds its session closed, e.g. because the server died,
+    the pool is reset and the call is retried once on the new sessions.
+    """
+
+    def __init__(self, connections: dict[str, Connection]) -> None:
+        """Initialize the pool without connecting."""
+        self.client = MultiServerMCPClient(connections)
+        self.connections = connections
+        self.tools: list[BaseTool] | None = None
+        self.definitions: dict[str, tuple[str, list[Tool]]] = {}
+        """Tool definitions by server, with the digest they were listed at."""
+        self._lock = asyncio.Lock()
+        self._closed = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._calls: dict[str, Callable[..., Awaitable[Any]]] = {}
+        """Calls of the tools of the open sessions, by tool name."""
+        self._generation = 0
+        """Number of times the sessions were closed."""
+
+    async def get_tools(self) -> list[BaseTool]:
+        """Get the tools of all servers, connecting on first use."""
+        if self.tools is not None:
+            return self.tools
+        async with self._lock:
+            if self.tools is None:
+                connecting = [
+                    asyncio.create_task(self._connect(name))
+                    for name in self.connections
+                ]
+                try:
+                    tools = await asyncio.gather(*connecting)
+                except BaseException:
+                    # Stop the servers still connecting and close the open ones.
+                    for task in connecting + self._tasks:
+                        task.cancel()
+                    await asyncio.gather(*connecting, return_exceptions=True)
+                    await self.reset()
+                    raise
+                self.tools = [
+                    self._reconnecting(tool)
+                    for server_tools in tools
+                    for tool in server_tools
+                ]
+        return self.tools
+
+    async def reset(self) -> None:
+        """Close all sessions, e.g. after a server died, keeping the definitions."""
+        self._closed.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._closed = asyncio.Event()
+        self.tools = None
+        self._generation += 1
+
+    def _reconnecting(self, tool: BaseTool) -> BaseTool:
+        """Make a tool reconnect and retry once if its session was closed."""
+        if not isinstance(tool, StructuredTool) or tool.coroutine is None:
+            return tool
+        name, call, generation = tool.name, tool.coroutine, self._generation
+        self._calls[name] = call
+
+        async def reconnecting(**arguments: Any) -> Any:
+            try:
+                return await call(**arguments)
+            except CLOSED_SESSION_ERRORS as error:
+                if (
+                    isinstance(error, McpError)
+                    and error.error.code != CONNECTION_CLOSED
+                ):
+                    raise
+            async with self._lock:
+                # Other calls may have found their sessions closed as well.
+                if self._generation == generation:
+                    await self.reset()
+            await self.get_tools()
+            return await self._calls[name](**arguments)
+
+        tool.coroutine = reconnecting
+        return tool
+
+    async def _connect(self, name: str) -> list[BaseTool]:
+        """Open a session kept alive in the background and get its tools."""
+        opened: asyncio.Future[ClientSession] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._tasks.append(asyncio.create_task(self._keep_open(name, opened)))
+        session = await opened
+        digest = await self._digest(session)
+        cached = self.definitions.get(name)
+        if digest and cached and cached[0] == digest:
+            definitions = cached[1]
+        else:
+            definitions = (await session.list_tools()).tools
+            self.definitions[name] = (digest, definitions)
+        return [
+            convert_mcp_tool_to_langchain_tool(session, definition)
+            for definition in definitions
+        ]
+
+    async def _keep_open(
+        self, name: str, opened: asyncio.Future[ClientSession]
+    ) -> None:
+        """Keep a session open until the pool is reset."""
+        try:
+            async with self.client.session(name) as session:
+                opened.set_result(session)
+                await self._closed.wait()
+        except Exception as error:
+            if not opened.done():
+                opened.set_exception(error)
+            raise
+
+    @staticmethod
+    async def _digest(session: ClientSession) -> str:
+        """Get the digest of the tool list, or an empty string if unavailable."""
+        try:
+            result = await session.read_resource(AnyUrl(TOOLS_DIGEST))
+        except McpError:
+            return ""
+        content = result.contents[0]
+        return content.text if isinstance(content, TextResourceContents) else ""
+
+
+pool = SessionPool(connections())
+
+
 async def agent(config: RunnableConfig):
     """Create a backend agent."""
     configurable = config.get("configurable", {})
@@ -62,30 +252,7 @@ async def agent(config: RunnableConfig):
     model = get_model(configurable.get("model", "google:gemini-2.5-flash"))
     prompt = configurable.get("system_prompt", DEFAULT_PROMPT)
 
-    client = MultiServerMCPClient(
-        {
-            "ui-mcp-server": {
-                "command": "uvx",
-                "args": ["ui-mcp-server"],
-                "transport": "stdio",
-            },
-            "file-system": {
-                "command": "npx",
-                "args": [
-                    "-y",
-                    "@modelcontextprotocol/server-filesystem",
-                    os.environ.get("FILE_SYSTEM_PATH", "/home/"),
-                ],
-                "transport": "stdio",
-            },
-            "tavily-search": {
-                "url": "https://mcp.tavily.com/mcp/?tavilyApiKey="
-                + os.environ.get("TAVILY_API_KEY"),
-                "transport": "streamable_http",
-            },
-        }
-    )
-    tools = await client.get_tools()
+    tools = await pool.get_tools()
 
     return create_react_agent(
         model,
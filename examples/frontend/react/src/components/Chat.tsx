@@ -159,7 +159,16 @@ export const Chat: React.FC = () => {
     if (!message) return;
 
     const component: UIComponent = JSON.parse(message.content as string);
-    const updatedComponent = { ...component, value };
+    // A batch submits the values of its inputs by key
+    const updatedComponent =
+      component.type === 'batch'
+        ? {
+            ...component,
+            components: component.components.map((child) =>
+              child.key in value ? { ...child, value: value[child.key] } : child
+            ),
+          }
+        : { ...component, value };
 
     const updatedMessage = {
       ...message,
@@ -173,7 +182,14 @@ export const Chat: React.FC = () => {
 
     // Send follow-up message about the input immediately
     const componentLabel = (component as any).label || 'component';
-    const followUpContent = `My input to ${componentLabel} is ${value}`;
+    const followUpContent =
+      component.type === 'batch'
+        ? 'My inputs are ' +
+          component.components
+            .filter((child) => child.key in value)
+            .map((child) => `${(child as any).label}: ${value[child.key]}`)
+            .join(', ')
+        : `My input to ${componentLabel} is ${value}`;
 
     // Add follow-up message to UI immediately
     const followUpMessage: Message = {
@@ -57,6 +57,7 @@ export const ChatMessage: React.FC<ChatMessageProps> = ({
           'image',
           'audio',
           'video',
+          'batch',
         ];
 
         const isValidComponent =
@@ -17,7 +17,7 @@ import {
   ResponsiveContainer,
 } from 'recharts';
 import { ChevronDown, Check, Folder, AlertCircle } from 'lucide-react';
-import { UIComponent } from '../types/ui-components';
+import { Batch, UIComponent } from '../types/ui-components';
 import { Button } from './ui/Button';
 import { Input } from './ui/Input';
 import { Label } from './ui/Label';
@@ -112,6 +112,55 @@ const LocalFileAccessor: React.FC<{
   return null;
 };
 
+// Types of the input components
+const INPUT_TYPES = [
+  'number_input',
+  'slider',
+  'radio',
+  'multiselect',
+  'color_picker',
+  'date_input',
+  'time_input',
+  'audio_input',
+  'camera_input',
+];
+
+// Component for a batch, whose inputs are submitted together
+const BatchRenderer: React.FC<{
+  batch: Batch;
+  onSubmit?: (values: Record<string, any>) => void;
+  onRequestDirectoryAccess?: () => void;
+}> = ({ batch, onSubmit, onRequestDirectoryAccess }) => {
+  const inputs = batch.components.filter((child) =>
+    INPUT_TYPES.includes(child.type)
+  );
+  const [values, setValues] = useState<Record<string, any>>(() =>
+    Object.fromEntries(inputs.map((child) => [child.key, (child as any).value]))
+  );
+
+  return (
+    <div className="space-y-4">
+      {batch.components.map((child) => (
+        <UIComponentRenderer
+          key={child.key}
+          component={child}
+          onValueChange={(value) =>
+            setValues((prev) => ({ ...prev, [child.key]: value }))
+          }
+          onRequestDirectoryAccess={onRequestDirectoryAccess}
+        />
+      ))}
+      {inputs.length > 0 && onSubmit && (
+        <div className="flex justify-start">
+          <Button onClick={() => onSubmit(values)} size="sm">
+            Submit
+          </Button>
+        </div>
+      )}
+    </div>
+  );
+};
+
 interface UIComponentRendererProps {
   component: UIComponent;
   onValueChange?: (value: any) => void;
@@ -487,17 +536,7 @@ export const UIComponentRenderer: React.FC<UIComponentRendererProps> = ({
     }
   };
 
-  const isInputComponent = [
-    'number_input',
-    'slider',
-    'radio',
-    'multiselect',
-    'color_picker',
-    'date_input',
-    'time_input',
-    'audio_input',
-    'camera_input',
-  ].includes(component.type);
+  const isInputComponent = INPUT_TYPES.includes(component.type);
 
   const isOutputComponent = [
     'line',
@@ -508,6 +547,16 @@ export const UIComponentRenderer: React.FC<UIComponentRendererProps> = ({
     'video',
   ].includes(component.type);
 
+  if (component.type === 'batch') {
+    return (
+      <BatchRenderer
+        batch={component}
+        onSubmit={onSubmit}
+        onRequestDirectoryAccess={onRequestDirectoryAccess}
+      />
+    );
+  }
+
   if (isInputComponent) {
     return (
       <Card className="p-4 space-y-4">
@@ -88,6 +88,11 @@ export interface ImageOutput extends OutputComponent {
   output_format: 'auto' | 'JPEG' | 'PNG' | 'WEBP';
 }
 
+export interface Batch extends BaseComponent {
+  type: 'batch';
+  components: UIComponent[];
+}
+
 export type UIComponent =
   | NumberInput
   | Choice
@@ -99,7 +104,8 @@ export type UIComponent =
   | Chart
   | AudioOutput
   | VideoOutput
-  | ImageOutput;
+  | ImageOutput
+  | Batch;
 
 export interface MessageContent {
   type: 'text' | 'image_url';
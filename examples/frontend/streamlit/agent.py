@@ -1,10 +1,29 @@
 """Agent for the Streamlit demo."""
 
 import json
+import time
 import uuid
+from collections import Counter
+from collections.abc import Iterator
+from functools import cache
 from pprint import pprint
 from langchain_core.messages import HumanMessage
-from langgraph_sdk import get_client
+from langgraph_sdk import get_sync_client
+from langgraph_sdk.client import SyncLangGraphClient
+
+
+KNOWN_THREADS: set[str] = set()
+"""Threads known to exist, shared by all sessions of the process."""
+
+
+@cache
+def shared_client() -> SyncLangGraphClient:
+    """Get the client shared by all sessions, reusing its connection pool.
+
+    The client is synchronous: an async client is bound to the event loop it
+    first ran on, while each script run of a session uses a new one.
+    """
+    return get_sync_client(url="http://localhost:2024")
 
 
 class Agent:
@@ -13,61 +32,78 @@ class Agent:
     def __init__(self, thread_id: str) -> None:
         """Initialize the agent."""
         self.thread_id = thread_id
-        self.client = get_client(url="http://localhost:2024")
-
-    async def maybe_create_thread(self) -> None:
-        """Create a thread if it doesn't exist."""
-        try:
-            await self.client.threads.get(self.thread_id)
-        except Exception:
-            await self.client.threads.create(
-                thread_id=self.thread_id, if_exists="do_nothing"
-            )
-
-    async def get_past_messages(self) -> list[dict]:
+        self.client = shared_client()
+        self.round_trips: Counter[str] = Counter()
+        """Requests sent to the agent server since the last user turn, by call."""
+
+    def take_round_trips(self) -> Counter[str]:
+        """Get the requests sent since the last call, e.g. for a user turn."""
+        round_trips, self.round_trips = self.round_trips, Counter()
+        return round_trips
+
+    def maybe_create_thread(self) -> None:
+        """Create a thread if it doesn't exist, at most once per process."""
+        if self.thread_id in KNOWN_THREADS:
+            return
+        self.round_trips["threads.create"] += 1
+        self.client.threads.create(thread_id=self.thread_id, if_exists="do_nothing")
+        KNOWN_THREADS.add(self.thread_id)
+
+    def get_past_messages(self) -> list[dict]:
         """Get past messages from an existing agent."""
-        await self.maybe_create_thread()
-        past_state = await self.client.threads.get_history(self.thread_id)
+        self.maybe_create_thread()
+        self.round_trips["threads.get_history"] += 1
+        past_state = self.client.threads.get_history(self.thread_id)
         if len(past_state) > 0:
             return past_state[0]["values"]["messages"]
         return []
 
-    async def update_message(self, message: dict) -> None:
+    def update_message(self, message: dict) -> None:
         """Update a message.
 
         Old message will be replaced according to the message id.
         If the message id is not found, the message will be appended to the end
         of the messages.
 
+        Only the changed message is sent: the `add_messages` reducer of the
+        agent state replaces messages by id, so the cost does not grow with the
+        length of the conversation.
+
         Args:
             message: The message to update.
         """
-        past_messages = await self.get_past_messages()
-        await self.client.threads.update_state(
+        self.round_trips["threads.update_state"] += 1
+        self.client.threads.update_state(
             self.thread_id,
-            values={"messages": past_messages + [message]},
+            values={"messages": [message]},
         )
 
-    async def get_response(
+    def stream_response(
         self,
         user_input: HumanMessage,
-    ) -> list[dict]:
-        """Get response from an existing agent and return new messages."""
-        past_messages = await self.get_past_messages()
-        response = await self.client.runs.wait(
+    ) -> Iterator[dict]:
+        """Stream the new messages of a response from an existing agent.
+
+        Messages are yielded as soon as the step producing them finishes, e.g.
+        every tool result as soon as its tool call returns, instead of after
+        the whole run. The thread is created by the run if it doesn't exist.
+        """
+        self.round_trips["runs.stream"] += 1
+        for chunk in self.client.runs.stream(
             self.thread_id,
             "ui_agent",  # Name of assistant. Defined in langgraph.json.
-            input={
-                "messages": [
-                    user_input.model_dump(),
-                ],
-            },
-        )
-        return response["messages"][len(past_messages) :]
+            input={"messages": [user_input.model_dump()]},
+            stream_mode="updates",
+            if_not_exists="create",
+        ):
+            if chunk.event != "updates":
+                continue
+            for update in (chunk.data or {}).values():
+                yield from (update or {}).get("messages", [])
+        KNOWN_THREADS.add(self.thread_id)
 
 
 if __name__ == "__main__":
-    import asyncio
     from dotenv import load_dotenv
 
     load_dotenv()
@@ -79,34 +115,28 @@ if __name__ == "__main__":
         message["content"] = json.dumps(data)
         return message
 
-    async def main():
+    def main():
         """Run the demo agent."""
         agent = Agent(thread_id=str(uuid.uuid4()))
 
-        result = await agent.get_response(
-            "Generate a number input between 0 and 100",
-        )
-        pprint(result)
-
-        updated_tool_message = None
-        for msg in result:
+        start = time.perf_counter()
+        tool_messages = []
+        for msg in agent.stream_response(
+            HumanMessage("Generate a number input between 0 and 100"),
+        ):
+            pprint(msg)
             if msg["type"] == "tool":
-                updated_tool_message = update_tool_data(msg)
-                await agent.update_message(updated_tool_message)
-
-        result = await agent.get_response(
-            "What is the value of the number input?",
-        )
-        pprint(result)
+                print(f"Component after {time.perf_counter() - start:.2f} s")
+                tool_messages.append(msg)
+        for msg in tool_messages:
+            agent.update_message(update_tool_data(msg))
 
-        # result = await agent.get_response(
-        #     "What did I just ask?",
-        # )
-        # pprint(result)
+        print(f"Round trips of the first turn: {dict(agent.take_round_trips())}")
 
-        # result = await agent.get_response(
-        #     "What is the value of the number input?",
-        # )
-        # pprint(result)
+        for msg in agent.stream_response(
+            HumanMessage("What is the value of the number input?"),
+        ):
+            pprint(msg)
+        print(f"Round trips of the second turn: {dict(agent.take_round_trips())}")
 
-    asyncio.run(main())
+    main()
@@ -1,10 +1,10 @@
 """Chat with the agent."""
 
-import asyncio
 import base64
 import json
 import uuid
 from typing import Any
+import numpy as np
 import streamlit as st
 from agent import Agent
 from dotenv import load_dotenv
@@ -15,6 +15,18 @@ from streamlit.runtime.uploaded_file_manager import UploadedFile
 
 load_dotenv()
 
+INPUT_TYPES = {
+    "number_input",
+    "slider",
+    "radio",
+    "multiselect",
+    "color_picker",
+    "date_input",
+    "time_input",
+    "audio_input",
+    "camera_input",
+}
+
 
 class ChatPage:
     """Chat page."""
@@ -109,24 +121,41 @@ class ChatPage:
                 user_input = None
         return user_input
 
+    def decode_array(self, encoded: dict[str, Any]) -> np.ndarray:
+        """Decode a base64 little-endian typed array."""
+        dtype = np.dtype(encoded["dtype"]).newbyteorder("<")
+        return np.frombuffer(base64.b64decode(encoded["data"]), dtype=dtype)
+
+    def chart_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Get chart arguments, keeping the x positions of downsampled data."""
+        values = data["data"]
+        index = data.get("index")
+        if data.get("encoded_data") is not None:
+            values = self.decode_array(data["encoded_data"])
+        if data.get("encoded_index") is not None:
+            index = self.decode_array(data["encoded_index"])
+        if index is None:
+            return {"data": values}
+        return {"data": {"x": index, "y": values}, "x": "x", "y": "y"}
+
     def display_output_component(self, data: dict[str, Any]) -> None:
         """Display the output component."""
         match data["type"]:
             case "line":
                 st.line_chart(
-                    data["data"],
+                    **self.chart_data(data),
                     x_label=data["x_label"],
                     y_label=data["y_label"],
                 )
             case "bar":
                 st.bar_chart(
-                    data["data"],
+                    **self.chart_data(data),
                     x_label=data["x_label"],
                     y_label=data["y_label"],
                 )
             case "scatter":
                 st.scatter_chart(
-                    data["data"],
+                    **self.chart_data(data),
                     x_label=data["x_label"],
                     y_label=data["y_label"],
                 )
@@ -160,7 +189,7 @@ class ChatPage:
                 st.write("Unable to display the UI component.")
                 st.write(data)
 
-    async def display_ui_component(self, message: dict) -> None:
+    def display_ui_component(self, message: dict) -> None:
         """Display the UI component."""
         data = json.loads(message["content"])
         match data["type"]:
@@ -179,54 +208,98 @@ class ChatPage:
                     user_input = self.display_input_form(data)
                     submit_button = st.form_submit_button("Submit")
                     if submit_button:
-                        await self.update_ui_input(message, user_input)
-                        await self.get_agent_response(
+                        self.update_ui_input(message, user_input)
+                        self.get_agent_response(
                             f"My input to {data['label']} is {user_input}"
                         )
             case "line" | "bar" | "scatter" | "image" | "audio" | "video":
                 self.display_output_component(data)
+            case "batch":
+                self.display_batch(message, data)
             case _:
                 st.write("Unable to display the UI component.")
                 st.write(data)
 
-    async def update_ui_input(self, message: dict, user_input: Any) -> None:
+    def display_batch(self, message: dict, data: dict[str, Any]) -> None:
+        """Display a batch of components, submitting all inputs together."""
+        components = data["components"]
+        if not any(component["type"] in INPUT_TYPES for component in components):
+            for component in components:
+                self.display_output_component(component)
+            return
+
+        with st.form(key=message["tool_call_id"]):
+            user_inputs = {}
+            for component in components:
+                if component["type"] in INPUT_TYPES:
+                    user_inputs[component["key"]] = self.display_input_form(component)
+                else:
+                    self.display_output_component(component)
+            if st.form_submit_button("Submit"):
+                for component in components:
+                    if component["key"] in user_inputs:
+                        component["value"] = user_inputs[component["key"]]
+                message["content"] = json.dumps(data)
+                self.agent.update_message(message)
+                self.get_agent_response(
+                    "My inputs are "
+                    + ", ".join(
+                        f"{component['label']}: {user_inputs[component['key']]}"
+                        for component in components
+                        if component["key"] in user_inputs
+                    )
+                )
+
+    def update_ui_input(self, message: dict, user_input: Any) -> None:
         """Update the user input."""
         data = json.loads(message["content"])
         data["value"] = user_input
         message["content"] = json.dumps(data)
-        await self.agent.update_message(message)
+        self.agent.update_message(message)
 
-    async def display_messages(self) -> None:
+    def display_messages(self) -> None:
         """Display the messages."""
         for message in self.messages:
-            message_type = (
-                message["type"] if message["type"] != "tool" else "assistant"
-            )  # display tool messages as assistant messages
-            if not message["content"]:
-                continue
-            with st.chat_message(message_type):
-                if message["type"] == "tool":
-                    await self.display_ui_component(message)
+            self.display_message(message)
+
+    def display_message(self, message: dict) -> None:
+        """Display a message."""
+        message_type = (
+            message["type"] if message["type"] != "tool" else "assistant"
+        )  # display tool messages as assistant messages
+        if not message["content"]:
+            return
+        with st.chat_message(message_type):
+            if message["type"] == "tool":
+                self.display_ui_component(message)
+            else:
+                msg_content = message["content"]
+                if isinstance(msg_content, str):
+                    st.write(msg_content)
                 else:
-                    msg_content = message["content"]
-                    if isinstance(msg_content, str):
-                        st.write(msg_content)
-                    else:
-                        for content in msg_content:
-                            content_type = content["type"]
-                            if content_type == "text":
-                                st.write(content["text"])
-                            elif content_type == "image_url":
-                                st.image(content["image_url"]["url"])
+                    for content in msg_content:
+                        content_type = content["type"]
+                        if content_type == "text":
+                            st.write(content["text"])
+                        elif content_type == "image_url":
+                            st.image(content["image_url"]["url"])
 
     def image_to_base64(self, image: UploadedFile) -> str:
         """Convert the image to base64."""
         return base64.b64encode(image.read()).decode("utf-8")
 
-    async def get_agent_response(self, user_input: ChatInputValue) -> None:
-        """Get the agent response."""
+    def get_agent_response(self, user_input: ChatInputValue | str) -> None:
+        """Get the agent response.
+
+        Args:
+            user_input: Chat input, or plain text, e.g. describing submitted values.
+        """
+        if isinstance(user_input, str):
+            text, files = user_input, []
+        else:
+            text, files = user_input.text, user_input.files
         user_message = HumanMessage(
-            content=[{"type": "text", "text": user_input.text}]
+            content=[{"type": "text", "text": text}]
             + [
                 {
                     "type": "image_url",
@@ -234,16 +307,26 @@ class ChatPage:
                         "url": f"data:{file.type};base64,{self.image_to_base64(file)}"
                     },
                 }
-                for file in user_input.files
+                for file in files
             ]
         )
-        self.messages.extend(await self.agent.get_response(user_message))
+        # Updates only carry the messages of the agent, not the user turn.
+        self.messages.append(user_message.model_dump())
+        for message in self.agent.stream_response(user_message):
+            self.messages.append(message)
+            self.display_message(message)  # Render each step right away.
+        st.session_state.round_trips = self.agent.take_round_trips()
         st.rerun()
 
-    async def main(self) -> None:
+    def main(self) -> None:
         """Entry point."""
         st.title("Chat with `ui-mcp-server`")
-        await self.display_messages()
+        if round_trips := st.session_state.get("round_trips"):
+            st.sidebar.caption(
+                f"Round trips of the last turn: {round_trips.total()} "
+                f"({', '.join(f'{call}: {n}' for call, n in round_trips.items())})"
+            )
+        self.display_messages()
 
         if user_input := st.chat_input(
             "Input your message...",
@@ -255,7 +338,7 @@ class ChatPage:
                     st.write(user_input.text)
                     for file in user_input.files:
                         st.image(file)
-                await self.get_agent_response(user_input)
+                self.get_agent_response(user_input)
             else:
                 st.write(f"Unknown user input type: {type(user_input)}")
                 st.chat_message("user").write(user_input)
@@ -263,4 +346,4 @@ class ChatPage:
 
 if "page" not in st.session_state:
     st.session_state.page = ChatPage()
-asyncio.run(st.session_state.page.main())
+st.session_state.page.main()
@@ -0,0 +1,149 @@
+"""Tests for audio waveforms."""
+
+import os
+import wave
+from pathlib import Path
+import anyio
+import numpy as np
+import pytest
+from ui_mcp_server import audio
+from ui_mcp_server.audio import CACHE, analyze_file, peaks
+from ui_mcp_server.models import AudioOutput
+from ui_mcp_server.server import audio_output, server
+
+
+RATE = 8000
+
+
+def write_wave(path: Path, samples: np.ndarray, width: int = 2) -> Path:
+    scale = 2 ** (8 * width - 1) - 1
+    integers = np.round(samples * scale).astype("<i4")
+    if width == 1:
+        data = (integers + 128).astype(np.uint8).tobytes()
+    else:
+        data = (
+            integers.view(np.uint8).reshape(*integers.shape, 4)[..., :width].tobytes()
+        )
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(samples.shape[1])
+        file.setsampwidth(width)
+        file.setframerate(RATE)
+        file.writeframes(data)
+    return path
+
+
+def expected(samples: np.ndarray, buckets: int) -> tuple[list, list]:
+    edges = np.linspace(0, len(samples), buckets + 1).astype(int)
+    parts = [samples[a:b] for a, b in zip(edges[:-1], edges[1:], strict=True)]
+    return [part.min() for part in parts], [part.max() for part in parts]
+
+
+@pytest.fixture
+def samples() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.uniform(-1, 1, size=(1001, 2)).astype(np.float32)
+
+
+@pytest.mark.parametrize("chunk", [7, 100, 5000])
+def test_peaks(samples, chunk):
+    chunks = (samples[i : i + chunk] for i in range(0, len(samples), chunk))
+
+    waveform = peaks(len(samples), chunks, 37)
+
+    lows, highs = expected(samples, 37)
+    assert waveform.bucket_size == 27
+    np.testing.assert_allclose(waveform.min, lows, atol=1e-4)
+    np.testing.assert_allclose(waveform.max, highs, atol=1e-4)
+
+
+def test_peaks_with_wrong_frame_count(samples):
+    longer = peaks(500, [samples], 10)
+    shorter = peaks(2000, [samples], 10)
+
+    assert longer.max[-1] == pytest.approx(samples[450:].max(), abs=1e-4)
+    assert shorter.max[-1] == shorter.min[-1] == 0
+    assert len(peaks(5, [samples[:5]], 100).max) == 5
+
+
+@pytest.mark.parametrize("width", [1, 2, 3, 4])
+def test_analyze_wave(tmp_path, samples, width, monkeypatch):
+    monkeypatch.setattr(audio, "CHUNK_FRAMES", 64)
+    path = write_wave(tmp_path / "noise.wav", samples, width)
+
+    analysis = analyze_file(path, 20)
+
+    lows, highs = expected(samples, 20)
+    assert analysis.sample_rate == RATE
+    assert analysis.duration == pytest.approx(1001 / RATE)
+    tolerance = 2e-2 if width == 1 else 1e-4
+    np.testing.assert_allclose(analysis.waveform.min, lows, atol=tolerance)
+    np.testing.assert_allclose(analysis.waveform.max, highs, atol=tolerance)
+
+
+def test_analyze_caches_by_mtime(tmp_path, samples):
+    path = write_wave(tmp_path / "noise.wav", samples)
+
+    first = analyze_file(path, 20)
+    assert analyze_file(path, 20) is first
+    os.utime(path, ns=(0, 0))
+    assert analyze_file(path, 20) is not first
+    assert len(CACHE) >= 2
+
+
+def test_analyze_missing_file(tmp_path):
+    assert analyze_file(tmp_path / "missing.wav", 20) is None
+
+
+def test_analyze_other_formats(tmp_path, samples):
+    soundfile = pytest.importorskip("soundfile")
+    path = tmp_path / "noise.flac"
+    soundfile.write(path, samples, RATE)
+
+    analysis = analyze_file(path, 20)
+
+    assert analysis.duration == pytest.approx(1001 / RATE)
+    np.testing.assert_allclose(
+        analysis.waveform.max, expected(samples, 20)[1], atol=1e-3
+    )
+
+
+def test_audio_output(tmp_path, samples):
+    path = write_wave(tmp_path / "noise.wav", samples)
+    params = AudioOutput(
+        type="audio", url=path, format="audio/wav", waveform_buckets=50
+    )
+
+    result = anyio.run(audio_output, params)
+
+    assert result.sample_rate == RATE
+    assert len(result.waveform.max) == 50
+    assert result.duration == pytest.approx(1001 / RATE)
+
+
+def test_audio_output_of_missing_file(tmp_path):
+    params = AudioOutput(
+        type="audio",
+        url=tmp_path / "missing.wav",
+        format="audio/wav",
+        waveform_buckets=50,
+    )
+
+    result = anyio.run(audio_output, params)
+
+    assert (result.duration, result.waveform) == (None, None)
+
+
+def test_call_tool_analyzes_path_strings(tmp_path, samples):
+    path = write_wave(tmp_path / "noise.wav", samples)
+    arguments = {
+        "type": "audio",
+        "url": path.as_posix(),
+        "format": "audio/wav",
+        "waveform_buckets": 50,
+    }
+
+    _, result = anyio.run(server.call_tool, "audio_output", {"params": arguments})
+
+    assert result["sample_rate"] == RATE
+    assert result["duration"] == pytest.approx(1001 / RATE)
+    assert len(result["waveform"]["max"]) == 50
@@ -0,0 +1,44 @@
+"""Tests for caches."""
+
+from ui_mcp_server.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_lru_cache_bounded_by_size():
+    cache: LRUCache[str, str] = LRUCache(10, sizeof=len)
+    cache.put("a", "x" * 6)
+    cache.put("b", "x" * 6)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "x" * 6
+    assert cache.size == 6
+
+    cache.put("c", "x" * 11)
+
+    assert "c" not in cache
+
+
+def test_lru_cache_pop_and_clear():
+    cache: LRUCache[str, int] = LRUCache(3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.size == 0
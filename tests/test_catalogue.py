@@ -0,0 +1,111 @@
+"""Tests for the index of media files."""
+
+import functools
+import os
+import shutil
+from pathlib import Path
+import anyio
+import pytest
+from ui_mcp_server import catalogue
+from ui_mcp_server.catalogue import MediaIndex, media_type
+from ui_mcp_server.server import list_media
+
+
+def touch(path: Path) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    return str(path)
+
+
+@pytest.fixture
+def media(tmp_path: Path) -> Path:
+    for name in ("b.mp3", "A.wav", "clips/c.mp4", "clips/d/photo.PNG", "notes.txt"):
+        touch(tmp_path / name)
+    return tmp_path
+
+
+def test_media_type():
+    assert media_type("a.mp3") == "audio/mpeg"
+    assert media_type("a.JPG") == "image/jpeg"
+    assert media_type("a.txt") is None
+    assert media_type("a") is None
+
+
+def test_query(media: Path):
+    index = MediaIndex([media], interval=0)
+    assert index.query() == [
+        str(media / "A.wav"),
+        str(media / "b.mp3"),
+        str(media / "clips/c.mp4"),
+        str(media / "clips/d/photo.PNG"),
+    ]
+    assert index.query(kind="audio") == [str(media / "A.wav"), str(media / "b.mp3")]
+    assert index.query(kind="audio/mpeg") == [str(media / "b.mp3")]
+    assert index.query(extensions=["png", ".MP4"]) == [
+        str(media / "clips/c.mp4"),
+        str(media / "clips/d/photo.PNG"),
+    ]
+    assert index.query(kind="video", extensions=["mp3"]) == []
+    assert index.query(prefix="PH") == [str(media / "clips/d/photo.PNG")]
+    assert index.query(kind="audio", prefix="a") == [str(media / "A.wav")]
+    assert index.query(kind="image", prefix="a") == []
+
+
+def test_query_pages(media: Path):
+    index = MediaIndex([media], interval=0)
+    every = index.query()
+    assert index.query(offset=1, limit=2) == every[1:3]
+    assert index.query(offset=3, limit=2) == every[3:]
+    assert index.query(kind="audio", offset=1, limit=5) == every[1:2]
+
+
+def test_update(media: Path):
+    index = MediaIndex([media], interval=0)
+    assert len(index.query()) == 4
+    added = touch(media / "clips/d/e/new.webm")
+    os.remove(media / "b.mp3")
+    (media / "A.wav").rename(media / "z.wav")
+    assert index.query(kind="audio") == [str(media / "z.wav")]
+    assert index.query(kind="video") == [str(media / "clips/c.mp4"), added]
+    shutil.rmtree(media / "clips/d")
+    assert index.query(extensions=["png", "webm"]) == []
+    assert len(index) == 2
+
+
+def test_update_skips_unchanged_directories(media: Path, monkeypatch):
+    index = MediaIndex([media], interval=0)
+    index.query()
+    scans = []
+    scan = index._scan
+    monkeypatch.setattr(index, "_scan", lambda *args: scans.append(args) or scan(*args))
+    touch(media / "clips/f.ogg")
+    assert str(media / "clips/f.ogg") in index.query()
+    assert [directory for directory, _ in scans] == [str(media / "clips")]
+
+
+def test_update_interval(media: Path):
+    index = MediaIndex([media], interval=3600)
+    assert len(index.query()) == 4
+    touch(media / "g.gif")
+    assert len(index.query()) == 4
+    index.update()
+    assert len(index.query()) == 5
+
+
+def test_list_media(media: Path, monkeypatch):
+    monkeypatch.setattr(catalogue, "index", MediaIndex([media], interval=0))
+    result = anyio.run(
+        functools.partial(list_media, "Songs", kind="audio", multiselect=True)
+    )
+    assert result.type == "multiselect"
+    assert result.label == "Songs"
+    assert result.options == [str(media / "A.wav"), str(media / "b.mp3")]
+    result = anyio.run(functools.partial(list_media, "Videos", kind="video"))
+    assert result.type == "radio"
+    assert result.options == [str(media / "clips/c.mp4")]
+
+
+def test_list_media_without_data_dirs(monkeypatch):
+    monkeypatch.setattr(catalogue, "index", MediaIndex([], interval=0))
+    with pytest.raises(ValueError, match="data_dirs"):
+        anyio.run(list_media, "Files")
@@ -0,0 +1,238 @@
+"""Tests for chart helpers."""
+
+import threading
+import anyio
+import numpy as np
+import pytest
+from ui_mcp_server import charts
+from ui_mcp_server.charts import (
+    PYRAMIDS,
+    Pyramid,
+    decode_array,
+    encode_array,
+    lttb,
+    mean,
+    min_max,
+    render,
+)
+from ui_mcp_server.models import Chart
+from ui_mcp_server.server import chart, chart_window, server
+from ui_mcp_server.settings import settings
+
+
+@pytest.fixture
+def series() -> np.ndarray:
+    return np.cumsum(np.random.default_rng(0).standard_normal(100_003))
+
+
+def test_lttb_keeps_endpoints(series):
+    index, values = lttb(series, 500)
+
+    assert len(index) == 500
+    assert index[0] == 0
+    assert index[-1] == len(series) - 1
+    assert np.all(np.diff(index) > 0)
+    assert np.array_equal(values, series[index])
+
+
+def test_lttb_picks_spike():
+    values = np.zeros(1000)
+    values[500] = 10.0
+
+    index, _ = lttb(values, 10)
+
+    assert 500 in index
+
+
+def test_min_max_keeps_extremes(series):
+    index, values = min_max(series, 400)
+
+    assert len(index) <= 400
+    assert np.all(np.diff(index) > 0)
+    assert values.max() == series.max()
+    assert values.min() == series.min()
+
+
+def test_mean_averages_buckets():
+    index, values = mean(np.arange(12, dtype=np.float64), 4)
+
+    assert index.tolist() == [1, 4, 7, 10]
+    assert values.tolist() == [1.0, 4.0, 7.0, 10.0]
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax", "mean"])
+def test_downsample_chart(series, method):
+    params = Chart(
+        type="line",
+        data=series.tolist(),
+        x_label="X",
+        y_label="Y",
+        max_points=1000,
+        downsample=method,
+    )
+
+    result = anyio.run(chart, params)
+
+    assert result.key == params.key
+    assert len(result.data) <= 1000
+    assert len(result.index) == len(result.data)
+    assert result.original_length == len(series)
+
+
+def test_chart_renders_in_a_thread(monkeypatch):
+    threads = []
+
+    def render(params):
+        threads.append(threading.current_thread())
+        return params
+
+    monkeypatch.setattr(charts, "render", render)
+    params = Chart(type="line", data=[1, 2, 3], x_label="X", y_label="Y")
+
+    anyio.run(chart, params)
+
+    assert threads != [threading.main_thread()]
+    assert len(threads) == 1
+
+
+def test_render_short_chart_unchanged():
+    params = Chart(type="bar", data=[1, 2, 3], x_label="X", y_label="Y", max_points=5)
+
+    assert render(params) is params
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64", "int32", "int64"])
+def test_encode_array_round_trip(dtype):
+    values = [0, 1, -2, 3, 1000]
+
+    encoded = encode_array(values, dtype)
+
+    assert encoded.length == 5
+    assert decode_array(encoded).tolist() == values
+
+
+def test_encode_chart(series):
+    params = Chart(
+        type="line",
+        data=series.tolist(),
+        x_label="X",
+        y_label="Y",
+        max_points=1000,
+        encoding="float32",
+    )
+
+    result = anyio.run(chart, params)
+
+    assert result.data == []
+    assert result.index is None
+    assert result.encoded_data.dtype == "float32"
+    assert result.encoded_index.dtype == "int32"
+    index = decode_array(result.encoded_index)
+    assert np.allclose(decode_array(result.encoded_data), series[index])
+    json_params = params.model_copy(update={"encoding": "json"})
+    assert len(result.model_dump_json()) < len(render(json_params).model_dump_json())
+
+
+def test_chart_from_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dirs", [tmp_path])
+    path = tmp_path / "series.npy"
+    np.save(path, np.arange(100, dtype=np.float64))
+    params = Chart(
+        type="line",
+        source={"path": path, "start": 10, "stop": 20, "group_size": 5},
+        x_label="X",
+        y_label="Y",
+    )
+
+    result = anyio.run(chart, params)
+
+    assert result.data == [12.0, 17.0]
+
+
+def test_render_batch_renders_charts(tmp_path, series, monkeypatch):
+    monkeypatch.setattr(settings, "data_dirs", [tmp_path])
+    path = tmp_path / "series.npy"
+    np.save(path, np.arange(100, dtype=np.float64))
+    components = [
+        {"type": "radio", "label": "Size", "options": ["S", "M"]},
+        {"type": "line", "source": {"path": str(path)}, "x_label": "X", "y_label": "Y"},
+        {
+            "type": "line",
+            "data": series.tolist(),
+            "x_label": "X",
+            "y_label": "Y",
+            "max_points": 100,
+            "encoding": "float32",
+            "pyramid": True,
+        },
+    ]
+
+    _, result = anyio.run(
+        server.call_tool, "render_batch", {"params": {"components": components}}
+    )
+
+    _, source, downsampled = result["components"]
+    assert source["data"] == list(range(100))
+    assert downsampled["original_length"] == len(series)
+    assert downsampled["encoded_data"]["dtype"] == "float32"
+    window = chart_window(downsampled["key"], 0, len(series), 10)
+    assert window.end == len(series)
+
+
+def test_chart_data_and_source_exclusive(tmp_path):
+    with pytest.raises(ValueError, match="either"):
+        Chart(
+            type="line",
+            data=[1],
+            source={"path": tmp_path / "series.npy"},
+            x_label="X",
+            y_label="Y",
+        )
+
+
+def test_pyramid_window(series):
+    pyramid = Pyramid(series)
+
+    bucket_size, index, mins, maxs = pyramid.window(1000, 51_000, 100)
+
+    assert bucket_size == 512
+    assert len(index) <= 102
+    assert index[0] <= 1000 < index[0] + bucket_size
+    first = slice(index[0], index[0] + bucket_size)
+    assert mins[0] == series[first].min()
+    assert maxs[0] == series[first].max()
+
+
+def test_pyramid_full_resolution():
+    values = np.arange(10.0)
+
+    bucket_size, index, mins, maxs = Pyramid(values).window(2, 5, 100)
+
+    assert bucket_size == 1
+    assert index.tolist() == [2, 3, 4]
+    assert mins.tolist() == maxs.tolist() == [2.0, 3.0, 4.0]
+
+
+def test_chart_window(series):
+    params = Chart(
+        type="line",
+        data=series.tolist(),
+        x_label="X",
+        y_label="Y",
+        max_points=100,
+        pyramid=True,
+    )
+    result = anyio.run(chart, params)
+
+    window = chart_window(result.key, 0, 10**9, 50)
+
+    assert params.key in PYRAMIDS
+    assert window.end == len(series)
+    assert len(window.min) <= 51
+    assert min(window.min) == series.min()
+    assert max(window.max) == series.max()
+
+
+def test_chart_window_unknown_key():
+    with pytest.raises(ValueError, match="No pyramid"):
+        chart_window("unknown", 0, 10, 10)
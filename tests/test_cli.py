@@ -0,0 +1,99 @@
+"""Tests for the command line interface."""
+
+import os
+from pathlib import Path
+import pytest
+from ui_mcp_server.cli import configure, parse_args
+
+
+def test_parse_args_defaults():
+    args = parse_args([])
+
+    assert args.transport == "stdio"
+    assert args.workers == 1
+    assert not args.stateless
+
+
+def test_parse_args_http(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("UI_MCP_STATE_DATABASE", str(tmp_path / "state.db"))
+    args = parse_args(
+        [
+            "--transport=streamable-http",
+            "--host=0.0.0.0",
+            "--port=9000",
+            "--stateless",
+            "--json-response",
+            "--workers=4",
+        ]
+    )
+
+    assert args.transport == "streamable-http"
+    assert args.host == "0.0.0.0"
+    assert args.port == 9000
+    assert args.stateless
+    assert args.json_response
+    assert args.workers == 4
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--workers=2"],
+        ["--workers=0"],
+        ["--transport=sse", "--workers=2"],
+        ["--transport=streamable-http", "--workers=2"],
+        ["--transport=streamable-http", "--stateless", "--workers=2"],
+    ],
+)
+def test_parse_args_invalid_workers(argv, monkeypatch):
+    monkeypatch.delenv("UI_MCP_STATE_DATABASE", raising=False)
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+@pytest.fixture
+def environ(monkeypatch):
+    for name in ("HOST", "PORT", "STATELESS_HTTP", "JSON_RESPONSE", "LOG_LEVEL"):
+        monkeypatch.setenv(f"FASTMCP_{name}", "")  # Restored after the test.
+    monkeypatch.setenv("UI_MCP_COMPACT_SCHEMAS", "")
+    monkeypatch.setenv("UI_MCP_SINGLE_TOOL", "")
+    monkeypatch.delenv("UI_MCP_MEDIA_URL", raising=False)
+    monkeypatch.delenv("UI_MCP_MEDIA_SECRET", raising=False)
+    return monkeypatch
+
+
+def test_configure(environ):
+    configure(
+        parse_args(
+            [
+                "--transport=streamable-http",
+                "--port=9000",
+                "--stateless",
+                "--compact-schemas",
+            ]
+        )
+    )
+
+    assert os.environ["FASTMCP_PORT"] == "9000"
+    assert os.environ["FASTMCP_STATELESS_HTTP"] == "true"
+    assert os.environ["FASTMCP_JSON_RESPONSE"] == "false"
+    assert os.environ["UI_MCP_COMPACT_SCHEMAS"] == "true"
+    assert os.environ["UI_MCP_SINGLE_TOOL"] == "false"
+
+
+def test_configure_shares_a_media_secret(environ):
+    environ.setenv("UI_MCP_MEDIA_URL", "http://localhost:8000")
+    args = parse_args(["--transport=streamable-http"])
+
+    configure(args)
+    secret = os.environ["UI_MCP_MEDIA_SECRET"]
+    configure(args)
+
+    assert len(secret) >= 32
+    assert os.environ["UI_MCP_MEDIA_SECRET"] == secret
+
+
+def test_configure_without_media_url(environ):
+    configure(parse_args([]))
+
+    assert "UI_MCP_MEDIA_SECRET" not in os.environ
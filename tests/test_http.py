@@ -0,0 +1,48 @@
+"""Tests for the HTTP apps."""
+
+import logging
+import os
+import anyio
+from starlette.testclient import TestClient
+from ui_mcp_server.http import quiet_stateless_errors, sse_app, streamable_http_app
+from ui_mcp_server.media import ROUTE
+
+
+def record(error: Exception) -> logging.LogRecord:
+    return logging.LogRecord(
+        "mcp.server.streamable_http",
+        logging.ERROR,
+        __file__,
+        0,
+        "Error in message router",
+        None,
+        (type(error), error, None),
+    )
+
+
+def test_quiet_stateless_errors():
+    logger = logging.getLogger("mcp.server.streamable_http")
+    quiet_stateless_errors()
+    quiet_stateless_errors()
+
+    assert len(logger.filters) == 1
+    assert not logger.filter(record(anyio.ClosedResourceError()))
+    assert logger.filter(record(RuntimeError()))
+
+
+def test_streamable_http_app():
+    app = streamable_http_app()
+
+    assert [route.path for route in app.routes] == ["/mcp", "/health", ROUTE]
+
+
+def test_health():
+    client = TestClient(sse_app())
+
+    first = client.get("/health").json()
+    second = client.get("/health").json()
+
+    assert first["status"] == "ok"
+    assert first["pid"] == os.getpid()
+    assert first["in_flight"] == 1
+    assert second["requests"] == first["requests"] + 1
@@ -0,0 +1,148 @@
+"""Tests for image derivatives."""
+
+import os
+from pathlib import Path
+import anyio
+import pytest
+from ui_mcp_server import images
+from ui_mcp_server.images import (
+    DerivativeCache,
+    Derivatives,
+    create_derivative,
+    derivative_name,
+)
+from ui_mcp_server.models import Batch, ImageOutput
+from ui_mcp_server.server import image_output, server
+
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def photo(tmp_path: Path) -> Path:
+    path = tmp_path / "photo.png"
+    Image.new("RGBA", (200, 100), (255, 0, 0, 128)).save(path)
+    return path
+
+
+@pytest.fixture
+def derivatives(tmp_path: Path) -> Derivatives:
+    return Derivatives(DerivativeCache(tmp_path / "cache", 2**20), workers=2)
+
+
+def output(path: Path, width: int | None = 50, output_format="auto") -> ImageOutput:
+    return ImageOutput(
+        url=path, width=width, channels="RGBA", output_format=output_format
+    )
+
+
+def test_create_derivative(photo: Path, tmp_path: Path):
+    target = tmp_path / "small.jpg"
+
+    assert create_derivative(photo, target, 50, "JPEG")
+
+    with Image.open(target) as image:
+        assert (image.format, image.size, image.mode) == ("JPEG", (50, 25), "RGB")
+
+
+def test_create_derivative_skips_matching_images(photo: Path, tmp_path: Path):
+    target = tmp_path / "same.png"
+
+    assert not create_derivative(photo, target, 400, "PNG")
+    assert not create_derivative(photo, target, None, "PNG")
+    assert not target.exists()
+
+
+def test_derivative_name_changes_with_source(photo: Path):
+    name = derivative_name(photo, 50, "WEBP")
+
+    assert name.endswith(".webp")
+    assert derivative_name(photo, 60, "WEBP") != name
+    os.utime(photo, ns=(0, 0))
+    assert derivative_name(photo, 50, "WEBP") != name
+
+
+def test_get_caches_derivatives(photo: Path, derivatives: Derivatives):
+    path = derivatives.get(photo, 50, "WEBP")
+
+    assert path.parent == derivatives.cache.directory
+    assert derivatives.get(photo, 50, "WEBP") == path
+    assert len(derivatives.cache) == 1
+    assert derivatives.get(photo, None, "PNG") == photo
+
+
+def test_get_skips_missing_images(tmp_path: Path, derivatives: Derivatives):
+    missing = tmp_path / "missing.png"
+
+    assert derivatives.get(missing, 50, "WEBP") == missing
+    assert len(derivatives.cache) == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    for name in ("a.webp", "b.webp", "c.webp"):
+        (directory / name).write_bytes(b"x" * 10)
+    cache = DerivativeCache(directory, max_bytes=25)
+    cache.get("a.webp")
+
+    (directory / "d.webp").write_bytes(b"x" * 10)
+    cache.add("d.webp")
+
+    assert sorted(path.name for path in directory.iterdir()) == ["a.webp", "d.webp"]
+    assert cache.size == 20
+
+
+def test_derive_batch(photo: Path, derivatives: Derivatives):
+    batch = Batch(components=[output(photo), output(photo, 20, "JPEG")])
+
+    anyio.run(derivatives.derive, batch)
+
+    urls = [component.url for component in batch.components]
+    assert [url.suffix for url in urls] == [".webp", ".jpg"]
+    with Image.open(urls[1]) as image:
+        assert image.width == 20
+
+
+def test_derive_batch_repeating_an_image(photo: Path, derivatives: Derivatives):
+    batch = Batch(components=[output(photo) for _ in range(8)])
+
+    anyio.run(derivatives.derive, batch)
+
+    assert len({component.url for component in batch.components}) == 1
+    assert [path.name for path in derivatives.cache.directory.iterdir()] == [
+        batch.components[0].url.name
+    ]
+
+
+def test_image_output(photo: Path, derivatives: Derivatives, monkeypatch):
+    monkeypatch.setattr(images, "derivatives", derivatives)
+
+    result = anyio.run(image_output, output(photo))
+
+    assert result.url.parent == derivatives.cache.directory
+    assert anyio.run(image_output, output("https://example.com/a.png")).url == (
+        "https://example.com/a.png"
+    )
+    missing = photo.with_name("missing.png")
+    assert anyio.run(image_output, output(missing)).url == missing
+
+
+@pytest.mark.parametrize("url", ["{path}", "file://{path}"])
+def test_call_tool_derives_path_strings(
+    photo: Path, derivatives: Derivatives, monkeypatch, url
+):
+    monkeypatch.setattr(images, "derivatives", derivatives)
+    arguments = {
+        "url": url.format(path=photo.as_posix()),
+        "width": 50,
+        "channels": "RGBA",
+        "output_format": "auto",
+    }
+
+    _, result = anyio.run(server.call_tool, "image_output", {"params": arguments})
+
+    path = Path(result["url"])
+    assert path.parent == derivatives.cache.directory
+    with Image.open(path) as image:
+        assert (image.format, image.width) == ("WEBP", 50)
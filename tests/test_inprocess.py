@@ -0,0 +1,58 @@
+"""Tests for using the server in-process."""
+
+import json
+import anyio
+import pytest
+from pydantic import ValidationError
+from ui_mcp_server.inprocess import connect, langchain_tools
+from ui_mcp_server.server import server
+
+
+ARGUMENTS = {"params": {"type": "slider", "label": "Age", "max_value": 10}}
+
+
+def test_connect():
+    async def call() -> tuple[list[str], dict]:
+        async with connect() as session:
+            tools = await session.list_tools()
+            result = await session.call_tool("number_input", ARGUMENTS)
+        return [tool.name for tool in tools.tools], json.loads(result.content[0].text)
+
+    names, data = anyio.run(call)
+
+    assert "number_input" in names
+    assert data["label"] == "Age"
+
+
+def test_langchain_tools_match_listed_tools():
+    listed = anyio.run(server.list_tools)
+
+    tools = langchain_tools()
+
+    assert [tool.name for tool in tools] == [tool.name for tool in listed]
+    assert [tool.description for tool in tools] == [tool.description for tool in listed]
+
+
+def test_langchain_tool_invoke():
+    tool = next(tool for tool in langchain_tools() if tool.name == "number_input")
+
+    data = json.loads(tool.invoke(ARGUMENTS))
+    adata = json.loads(anyio.run(tool.ainvoke, ARGUMENTS))
+
+    assert data["max_value"] == adata["max_value"] == 10
+    assert data["key"] != adata["key"]
+
+
+def test_langchain_tool_validates_arguments():
+    tool = next(tool for tool in langchain_tools() if tool.name == "number_input")
+
+    with pytest.raises(ValidationError):
+        tool.invoke({"params": {"type": "unknown"}})
+
+
+def test_langchain_async_tool_invoke():
+    tool = next(tool for tool in langchain_tools() if tool.name == "image_output")
+    arguments = {"params": {"url": "a.png", "channels": "RGB", "output_format": "PNG"}}
+
+    assert json.loads(tool.invoke(arguments))["url"] == "a.png"
+    assert json.loads(anyio.run(tool.ainvoke, arguments))["url"] == "a.png"
@@ -0,0 +1,160 @@
+"""Tests for serving local media files."""
+
+from pathlib import Path
+import anyio
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from ui_mcp_server.media import ROUTE, publish, serve_media, sign, verify
+from ui_mcp_server.models import Batch, ImageOutput, VideoOutput
+from ui_mcp_server.server import server
+from ui_mcp_server.settings import settings
+
+
+CONTENT = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def video(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr(settings, "media_url", "http://testserver/")
+    monkeypatch.setattr(settings, "data_dirs", [tmp_path])
+    path = tmp_path / "clip one.mp4"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(Starlette(routes=[Route(ROUTE, serve_media)]))
+
+
+def test_sign_and_verify(video: Path):
+    url = sign(video)
+
+    assert url.startswith("http://testserver/media/")
+    assert url.endswith("/clip%20one.mp4")
+    assert verify(url.split("/")[-2]) == video.resolve()
+
+
+def test_verify_rejects_tampered_tokens(video: Path, tmp_path: Path):
+    token = sign(video).split("/")[-2]
+    other = sign(tmp_path / "other.mp4").split("/")[-2]
+
+    path, expires, signature = token.split(".")
+
+    with pytest.raises(ValueError, match="signature"):
+        verify(f"{other.split('.')[0]}.{expires}.{signature}")
+    with pytest.raises(ValueError, match="signature"):
+        verify(f"{path}.{int(expires) + 60}.{signature}")
+    with pytest.raises(ValueError, match="Malformed"):
+        verify("a.b")
+
+
+def test_verify_rejects_expired_tokens(video: Path, monkeypatch):
+    monkeypatch.setattr(settings, "media_token_ttl", -1)
+
+    with pytest.raises(ValueError, match="Expired"):
+        verify(sign(video).split("/")[-2])
+
+
+def test_sign_rejects_paths_outside_data_dirs(video: Path):
+    with pytest.raises(ValueError, match="outside"):
+        sign(Path("/etc/passwd"))
+
+
+def test_sign_requires_data_dirs(video: Path, monkeypatch):
+    token = sign(video).split("/")[-2]
+    monkeypatch.setattr(settings, "data_dirs", [])
+
+    with pytest.raises(ValueError, match="data_dirs"):
+        sign(video)
+    with pytest.raises(ValueError, match="data_dirs"):
+        verify(token)
+
+
+def test_publish(video: Path):
+    image = ImageOutput(type="image", url=video, channels="RGB", output_format="PNG")
+    remote = VideoOutput(
+        type="video", url="https://example.com/a.mp4", format="video/mp4"
+    )
+
+    batch = Batch(components=[image, remote])
+
+    published = publish(batch)
+
+    assert published.components[0].url == sign(video)
+    assert published.components[1].url == "https://example.com/a.mp4"
+    assert image.url == video
+    assert publish(remote) is remote
+
+
+@pytest.mark.parametrize("url", ["{path}", "file://{path}"])
+def test_call_tool_publishes_path_strings(video: Path, client: TestClient, url):
+    arguments = {"url": url.format(path=video.as_posix()), "format": "video/mp4"}
+
+    _, result = anyio.run(server.call_tool, "video_output", {"params": arguments})
+
+    assert result["url"].startswith("http://testserver/media/")
+    assert client.get(result["url"]).content == CONTENT
+
+
+def test_memoized_components_are_signed_again(video: Path, client, monkeypatch):
+    monkeypatch.setattr(settings, "content_keys", True)
+    monkeypatch.setattr(server, "session_id", lambda: "a")
+    monkeypatch.setattr(settings, "media_token_ttl", -1)
+    arguments = {"params": {"url": str(video), "format": "video/mp4"}}
+
+    _, expired = anyio.run(server.call_tool, "video_output", arguments)
+    monkeypatch.setattr(settings, "media_token_ttl", 3600)
+    _, cached = anyio.run(server.call_tool, "video_output", arguments)
+
+    assert cached["key"] == expired["key"]
+    assert client.get(expired["url"]).status_code == 403
+    assert client.get(cached["url"]).content == CONTENT
+
+
+def test_publish_without_media_url(video: Path, monkeypatch):
+    monkeypatch.setattr(settings, "media_url", None)
+    component = VideoOutput(type="video", url=video, format="video/mp4")
+
+    assert publish(component).url == video
+
+
+def test_serve(video: Path, client: TestClient):
+    response = client.get(sign(video))
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["content-type"] == "video/mp4"
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+def test_serve_range(video: Path, client: TestClient):
+    response = client.get(sign(video), headers={"range": "bytes=100-199"})
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(CONTENT)}"
+
+
+def test_serve_revalidation(video: Path, client: TestClient):
+    url = sign(video)
+    headers = client.get(url).headers
+
+    etag = client.get(url, headers={"if-none-match": headers["etag"]})
+    since = client.get(url, headers={"if-modified-since": headers["last-modified"]})
+    changed = client.get(url, headers={"if-none-match": '"other"'})
+
+    assert etag.status_code == since.status_code == 304
+    assert etag.content == b""
+    assert changed.status_code == 200
+
+
+def test_serve_errors(video: Path, client: TestClient):
+    url = sign(video)
+    token = url.split("/")[-2]
+
+    assert client.get(url.replace(token, token[:-2])).status_code == 403
+    video.unlink()
+    assert client.get(url).status_code == 404
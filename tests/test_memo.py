@@ -0,0 +1,112 @@
+"""Tests for content-addressed keys and memoized rendering."""
+
+from pathlib import Path
+import numpy as np
+from ui_mcp_server import server as tools
+from ui_mcp_server.memo import Memo, content_key
+from ui_mcp_server.models import Batch, Chart, Choice, DataSource, NumberInput
+from ui_mcp_server.settings import settings
+from ui_mcp_server.state import store
+
+
+def slider() -> NumberInput:
+    return NumberInput(type="slider", label="Age", max_value=10)
+
+
+def test_content_key():
+    assert content_key("a", slider()) == content_key("a", slider())
+    assert content_key("a", slider()) != content_key("b", slider())
+    assert content_key("a", slider()) != content_key(
+        "a", NumberInput(type="slider", label="Age", max_value=11)
+    )
+
+
+def test_render_reuses_identical_components():
+    memo = Memo(2**20)
+    renders = []
+
+    def render(component):
+        renders.append(component)
+        return component
+
+    first = memo.render("a", slider(), render)
+    second = memo.render("a", slider(), render)
+    other = memo.render("b", slider(), render)
+
+    assert second is first
+    assert first.key == content_key("a", slider())
+    assert other.key != first.key
+    assert len(renders) == 2
+
+
+def test_render_sets_batch_keys():
+    memo = Memo(2**20)
+    batch = Batch(components=[slider(), slider()])
+
+    rendered = memo.render("a", batch, lambda batch: batch)
+
+    keys = [component.key for component in rendered.components]
+    assert len({rendered.key, *keys}) == 3
+    again = memo.render("a", Batch(components=[slider(), slider()]), lambda b: b)
+    assert [component.key for component in again.components] == keys
+
+
+def test_render_evicts_least_recently_used():
+    size = len(slider().model_dump_json())
+    memo = Memo(2 * size)
+    components = [
+        NumberInput(type="slider", label="Age", max_value=i) for i in range(3)
+    ]
+
+    for component in components:
+        memo.render("a", component, lambda component: component)
+
+    assert len(memo) == 2
+
+
+def test_render_skips_charts_with_source(tmp_path: Path):
+    path = tmp_path / "values.npy"
+    np.save(path, np.arange(10.0))
+    chart = Chart(type="line", source=DataSource(path=path), x_label="X", y_label="Y")
+    memo = Memo(2**20)
+
+    memo.render("a", chart, lambda chart: chart)
+
+    assert len(memo) == 0
+
+
+def test_render_skips_batches_with_source(tmp_path: Path):
+    path = tmp_path / "values.npy"
+    np.save(path, np.arange(10.0))
+    chart = Chart(type="line", source=DataSource(path=path), x_label="X", y_label="Y")
+    memo = Memo(2**20)
+
+    memo.render("a", Batch(components=[chart]), lambda batch: batch)
+
+    assert len(memo) == 0
+
+
+def test_tools_with_content_keys(monkeypatch):
+    monkeypatch.setattr(settings, "content_keys", True)
+    monkeypatch.setattr(tools.server, "session_id", lambda: "a")
+    tools.memo.clear()
+    params = {"type": "radio", "label": "Size", "options": ["S", "M"]}
+
+    first = tools.choice(Choice.model_validate(params))
+    tools.set_component_value(first.key, "M")
+    second = tools.choice(Choice.model_validate(params))
+
+    assert second.key == first.key
+    assert store.get("a", first.key).value == "M"
+
+
+def test_tools_without_session_id_use_random_keys(monkeypatch):
+    monkeypatch.setattr(settings, "content_keys", True)
+    tools.memo.clear()
+    params = {"type": "radio", "label": "Size", "options": ["S", "M"]}
+
+    first = tools.choice(Choice.model_validate(params))
+    second = tools.choice(Choice.model_validate(params))
+
+    assert second.key != first.key
+    assert len(tools.memo) == 0
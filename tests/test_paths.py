@@ -0,0 +1,49 @@
+"""Tests for local files referenced by components."""
+
+from pathlib import Path
+import pytest
+from ui_mcp_server.models import AudioOutput, Batch, ImageOutput, VideoOutput
+from ui_mcp_server.paths import local_media, local_path, resolve_media
+from ui_mcp_server.settings import settings
+
+
+@pytest.mark.parametrize(
+    ("url", "path"),
+    [
+        (Path("images/cat.png"), Path("images/cat.png")),
+        ("/srv/media/cat.png", Path("/srv/media/cat.png")),
+        ("file:///srv/media/a%20cat.png", Path("/srv/media/a cat.png")),
+        ("file://localhost/srv/cat.png", Path("/srv/cat.png")),
+        ("file://example.com/srv/cat.png", None),
+        ("https://example.com/cat.png", None),
+        ("data:image/png;base64,AAAA", None),
+        ("images/cat.png", None),
+    ],
+)
+def test_local_path(url, path):
+    assert local_path(url) == path
+
+
+def test_local_media():
+    image = ImageOutput(url="/srv/a.png", channels="RGB", output_format="PNG")
+    remote = ImageOutput(url="https://a.png", channels="RGB", output_format="PNG")
+    audio = AudioOutput(type="audio", url="file:///srv/a.wav", format="audio/wav")
+    video = VideoOutput(url=Path("/srv/a.mp4"), format="video/mp4")
+    batch = Batch(components=[image, remote, audio, video])
+
+    assert local_media(batch, ImageOutput) == [(image, Path("/srv/a.png"))]
+    assert local_media(batch, (AudioOutput, VideoOutput)) == [
+        (audio, Path("/srv/a.wav")),
+        (video, Path("/srv/a.mp4")),
+    ]
+    assert local_media(image, AudioOutput) == []
+
+
+def test_resolve_media(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dirs", [tmp_path / "data"])
+    monkeypatch.setattr(settings, "image_cache_dir", tmp_path / "cache")
+
+    assert resolve_media(tmp_path / "cache/a.webp") == tmp_path / "cache/a.webp"
+    assert resolve_media(tmp_path / "data/a.png") == tmp_path / "data/a.png"
+    with pytest.raises(ValueError, match="outside"):
+        resolve_media(tmp_path / "a.png")
@@ -0,0 +1,120 @@
+"""Tests for image dimensions and placeholders."""
+
+from pathlib import Path
+import anyio
+import numpy as np
+import pytest
+from ui_mcp_server import images
+from ui_mcp_server.images import DerivativeCache, Derivatives
+from ui_mcp_server.models import ImageOutput
+from ui_mcp_server.placeholders import CACHE, blurhash, describe, image_size
+from ui_mcp_server.server import image_output, server
+from ui_mcp_server.settings import settings
+
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def save(path: Path, size=(40, 30), **kwargs) -> Path:
+    y, x = np.mgrid[0 : size[1], 0 : size[0]]
+    pixels = np.stack([x * 6, y * 8, (x + y) * 3], -1).astype(np.uint8)
+    Image.fromarray(pixels).save(path, **kwargs)
+    return path
+
+
+@pytest.mark.parametrize(
+    ("name", "options"),
+    [
+        ("a.png", {}),
+        ("a.gif", {}),
+        ("a.bmp", {}),
+        ("a.jpg", {}),
+        ("a.webp", {}),
+        ("lossless.webp", {"lossless": True}),
+        ("extended.webp", {"exif": b"Exif\0\0"}),
+    ],
+)
+def test_image_size(tmp_path: Path, name, options):
+    assert image_size(save(tmp_path / name, **options)) == (40, 30)
+
+
+def test_image_size_jpeg_orientation(tmp_path: Path):
+    exif = Image.Exif()
+    exif[0x0112] = 6
+
+    assert image_size(save(tmp_path / "a.jpg", exif=exif)) == (30, 40)
+
+
+def test_image_size_unknown_or_truncated(tmp_path: Path):
+    unknown = tmp_path / "a.txt"
+    unknown.write_text("not an image")
+    truncated = tmp_path / "a.jpg"
+    truncated.write_bytes(save(tmp_path / "b.jpg").read_bytes()[:40])
+
+    assert image_size(unknown) is None
+    assert image_size(truncated) is None
+
+
+def test_blurhash():
+    y, x = np.mgrid[0:12, 0:16]
+    pixels = np.stack([x * 16, y * 20, (x + y) * 7], -1).astype(np.uint8)
+
+    assert blurhash(pixels, 4, 3) == "LsGuU32+wyoxqeR.jue:f~fkfQfj"
+    assert blurhash(pixels, 1, 1) == "00GuU3"
+
+
+def test_describe(tmp_path: Path):
+    path = save(tmp_path / "a.jpg", size=(300, 200))
+
+    info = describe(path)
+
+    assert (info.width, info.height) == (300, 200)
+    assert len(info.blurhash) == 28
+    assert describe(path) is info
+    assert describe(tmp_path / "missing.jpg") == (None, None, None)
+    assert len(CACHE) >= 1
+
+
+def test_image_output(tmp_path: Path):
+    params = ImageOutput(
+        url=save(tmp_path / "a.png"), channels="RGB", output_format="auto"
+    )
+
+    result = anyio.run(image_output, params)
+
+    assert (result.image_width, result.image_height) == (40, 30)
+    assert result.blurhash is not None
+
+
+def test_call_tool_measures_path_strings(tmp_path: Path):
+    arguments = {
+        "url": save(tmp_path / "a.png").as_posix(),
+        "channels": "RGB",
+        "output_format": "PNG",
+    }
+
+    _, result = anyio.run(server.call_tool, "image_output", {"params": arguments})
+
+    assert (result["image_width"], result["image_height"]) == (40, 30)
+    assert result["blurhash"] is not None
+
+
+def test_image_output_measures_derivatives(tmp_path: Path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(settings, "data_dirs", [tmp_path / "data"])
+    monkeypatch.setattr(settings, "image_cache_dir", cache)
+    monkeypatch.setattr(
+        images, "derivatives", Derivatives(DerivativeCache(cache, 2**20), 1)
+    )
+    (tmp_path / "data").mkdir()
+    params = ImageOutput(
+        url=save(tmp_path / "data/a.png"),
+        width=20,
+        channels="RGB",
+        output_format="WEBP",
+    )
+
+    result = anyio.run(image_output, params)
+
+    assert result.url.parent == cache
+    assert (result.image_width, result.image_height) == (20, 15)
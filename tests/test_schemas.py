@@ -0,0 +1,125 @@
+"""Tests for compact tool schemas."""
+
+import json
+import jsonschema
+import pytest
+from mcp.types import Tool
+from ui_mcp_server import snapshot
+from ui_mcp_server.schemas import compact_schema, compact_tool, input_schema
+
+
+SCHEMA = {
+    "$defs": {
+        "Item": {
+            "properties": {
+                "key": {"description": "Identifier.", "title": "Key", "type": "string"},
+                "note": {
+                    "anyOf": [{"type": "string"}, {"type": "null"}],
+                    "default": None,
+                    "title": "Note",
+                },
+            },
+            "title": "Item",
+            "type": "object",
+        },
+        "Shared": {"title": "Shared", "type": "integer"},
+    },
+    "properties": {
+        "item": {"$ref": "#/$defs/Item"},
+        "key": {"description": "Identifier.", "type": "string"},
+        "first": {"$ref": "#/$defs/Shared"},
+        "second": {"$ref": "#/$defs/Shared"},
+    },
+    "title": "Arguments",
+    "type": "object",
+}
+
+
+def test_compact_schema():
+    assert compact_schema(SCHEMA) == {
+        "properties": {
+            "item": {
+                "properties": {
+                    "key": {"description": "Identifier.", "type": "string"},
+                    "note": {"type": "string"},
+                },
+                "type": "object",
+            },
+            "key": {"type": "string"},
+            "first": {"$ref": "#/$defs/Shared"},
+            "second": {"$ref": "#/$defs/Shared"},
+        },
+        "type": "object",
+        "$defs": {"Shared": {"type": "integer"}},
+    }
+    assert SCHEMA["$defs"]["Item"]["title"] == "Item"
+
+
+def test_compact_schema_without_descriptions():
+    schema = compact_schema(SCHEMA, descriptions=False)
+
+    assert "description" not in json.dumps(schema)
+
+
+def test_compact_schema_keeps_nullable_without_default():
+    schema = {"anyOf": [{"type": "string"}, {"type": "null"}]}
+
+    assert compact_schema(schema) == schema
+
+
+@pytest.mark.parametrize("tool", snapshot.load(), ids=lambda tool: tool["name"])
+def test_compact_tool(tool):
+    original = Tool.model_validate(tool)
+
+    compact = compact_tool(original)
+
+    assert "Args:" not in compact.description
+    assert len(compact.model_dump_json()) < len(original.model_dump_json())
+    jsonschema.Draft202012Validator.check_schema(compact.inputSchema)
+
+
+def test_compact_tool_accepts_arguments():
+    tool = next(tool for tool in snapshot.load() if tool["name"] == "render_batch")
+    schema = compact_tool(Tool.model_validate(tool)).inputSchema
+    components = [
+        {"type": "slider", "label": "Age", "max_value": 100},
+        {"type": "radio", "label": "Size", "options": ["S", "M"]},
+        {"type": "line", "data": [1, 2], "x_label": "t", "y_label": "v"},
+    ]
+
+    jsonschema.validate({"params": {"components": components}}, schema)
+    with pytest.raises(jsonschema.ValidationError):
+        jsonschema.validate({"params": {"components": [{"type": "x"}]}}, schema)
+
+
+def test_input_schema():
+    schema = {
+        "$defs": {
+            "Encoded": {
+                "properties": {"data": {"$ref": "#/$defs/Bytes"}},
+                "type": "object",
+            },
+            "Bytes": {"type": "string"},
+            "Label": {"type": "string"},
+        },
+        "properties": {
+            "label": {"$ref": "#/$defs/Label"},
+            "encoded": {
+                "anyOf": [{"$ref": "#/$defs/Encoded"}, {"type": "null"}],
+                "readOnly": True,
+            },
+        },
+        "type": "object",
+    }
+
+    assert input_schema(schema) == {
+        "$defs": {"Label": {"type": "string"}},
+        "properties": {"label": {"$ref": "#/$defs/Label"}},
+        "type": "object",
+    }
+    assert "encoded" in schema["properties"]
+
+
+@pytest.mark.parametrize("tool", snapshot.load(), ids=lambda tool: tool["name"])
+def test_input_schemas_leave_out_server_fields(tool):
+    assert "readOnly" not in json.dumps(tool["inputSchema"])
@@ -0,0 +1,73 @@
+"""Tests for the serialization of tool results."""
+
+import json
+from datetime import date, time
+from pathlib import Path
+import anyio
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+from ui_mcp_server.models import DateInput, ImageOutput, NumberInput, TimeInput
+from ui_mcp_server.serialization import dump_json, tool_result
+from ui_mcp_server.server import server
+
+
+DAY = DateInput(
+    type="date_input", label="Day", format="YYYY/MM/DD", value=date(2024, 2, 29)
+)
+RESULTS = [
+    ("date_input", DAY),
+    ("time_input", TimeInput(type="time_input", label="At", value=time(12, 30, 15))),
+    (
+        "image_output",
+        ImageOutput(
+            type="image",
+            url=Path("images/cat.png"),
+            channels="RGB",
+            output_format="PNG",
+        ),
+    ),
+    ("render_component", NumberInput(type="slider", label="Age", max_value=10)),
+]
+
+
+def call(name: str, arguments: dict) -> dict:
+    handler = server._mcp_server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    return anyio.run(handler, request).root.model_dump(mode="json")
+
+
+def test_dump_json():
+    assert json.loads(dump_json(DAY)) == DAY.model_dump(mode="json")
+    assert dump_json({"path": Path("a/b")}) == b'{"path":"a/b"}'
+
+
+@pytest.mark.parametrize(("name", "result"), RESULTS, ids=[name for name, _ in RESULTS])
+def test_tool_result_matches_fastmcp(name, result):
+    server.register_tools()
+    metadata = server._tool_manager.get_tool(name).fn_metadata
+    content, structured = metadata.convert_result(result)
+
+    converted = tool_result(result, metadata)
+
+    assert converted.structuredContent == structured
+    assert json.loads(converted.content[0].text) == json.loads(content[0].text)
+
+
+def test_call_tool():
+    arguments = {"params": DAY.model_dump(mode="json", exclude={"key"})}
+
+    result = call("date_input", arguments)
+
+    assert not result["isError"]
+    assert result["structuredContent"]["value"] == "2024-02-29"
+    assert json.loads(result["content"][0]["text"]) == result["structuredContent"]
+
+
+def test_call_tool_errors():
+    assert call("unknown", {})["isError"]
+    invalid = call("date_input", {"params": {"type": "date_input"}})
+    assert invalid["isError"]
+    assert "label" in invalid["content"][0]["text"]
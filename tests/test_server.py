@@ -2,9 +2,13 @@
 
 from datetime import date, time
 from pathlib import Path
+import anyio
+import pytest
+from pydantic import ValidationError
 from ui_mcp_server.models import (
     AudioInput,
     AudioOutput,
+    Batch,
     CameraInput,
     Chart,
     Choice,
@@ -12,6 +16,7 @@ from ui_mcp_server.models import (
     DateInput,
     ImageOutput,
     NumberInput,
+    Submission,
     TimeInput,
     VideoOutput,
 )
@@ -23,9 +28,15 @@ from ui_mcp_server.server import (
     choice,
     color_picker,
     date_input,
+    get_component_state,
     image_output,
     number_input,
+    render_batch,
+    render_component,
+    server,
+    set_component_value,
     time_input,
+    validate_values,
     video_output,
 )
 
@@ -106,7 +117,7 @@ def test_chart():
         type="line", data=[1, 2, 3, 4, 5], x_label="X Axis", y_label="Y Axis"
     )
 
-    result = chart(params)
+    result = anyio.run(chart, params)
 
     assert result == params
     assert result.type == "line"
@@ -115,13 +126,41 @@ def test_chart():
     assert result.y_label == "Y Axis"
 
 
+def test_chart_ignores_server_fields():
+    """Test that values sent for server-set fields are dropped."""
+    arguments = {
+        "type": "line",
+        "data": [1, 2, 3],
+        "x_label": "X",
+        "y_label": "Y",
+        "index": [7, 8, 9],
+        "original_length": 1000,
+    }
+
+    _, result = anyio.run(server.call_tool, "chart", {"params": arguments})
+
+    assert result["index"] is None
+    assert result["original_length"] is None
+
+
+def test_chart_input_schema_leaves_out_server_fields():
+    """Test that server-set fields are only in the output schema."""
+    tool = server._tool_manager.get_tool("chart")
+
+    assert tool is not None
+    params = tool.parameters["$defs"]["Chart"]["properties"]
+    assert "index" not in params
+    assert "encoded_data" not in params
+    assert "index" in tool.output_schema["properties"]
+
+
 def test_chart_bar():
     """Test chart function with bar type."""
     params = Chart(
         type="bar", data=[10.5, 20.3, 15.7], x_label="Categories", y_label="Values"
     )
 
-    result = chart(params)
+    result = anyio.run(chart, params)
 
     assert result == params
     assert result.type == "bar"
@@ -131,7 +170,7 @@ def test_chart_scatter():
     """Test chart function with scatter type."""
     params = Chart(type="scatter", data=[1.1, 2.2, 3.3], x_label="X", y_label="Y")
 
-    result = chart(params)
+    result = anyio.run(chart, params)
 
     assert result == params
     assert result.type == "scatter"
@@ -244,7 +283,7 @@ def test_audio_output():
         autoplay=False,
     )
 
-    result = audio_output(params)
+    result = anyio.run(audio_output, params)
 
     assert result == params
     assert result.type == "audio"
@@ -260,7 +299,7 @@ def test_audio_output_path():
     path = Path("/path/to/audio.wav")
     params = AudioOutput(type="audio", url=path, format="audio/wav")
 
-    result = audio_output(params)
+    result = anyio.run(audio_output, params)
 
     assert result == params
     assert result.url == path
@@ -312,7 +351,7 @@ def test_image_output():
         output_format="PNG",
     )
 
-    result = image_output(params)
+    result = anyio.run(image_output, params)
 
     assert result == params
     assert result.type == "image"
@@ -332,7 +371,7 @@ def test_image_output_formats():
         params = ImageOutput(
             type="image", url="test.jpg", channels="RGB", output_format=fmt
         )
-        result = image_output(params)
+        result = anyio.run(image_output, params)
         assert result.output_format == fmt
 
 
@@ -345,7 +384,7 @@ def test_image_output_channels():
         output_format="JPEG",
     )
 
-    result = image_output(params)
+    result = anyio.run(image_output, params)
 
     assert result == params
     assert result.channels == "RGB"
@@ -359,3 +398,103 @@ def test_base_component_key_generation():
     assert comp1.key != comp2.key
     assert len(comp1.key) > 0
     assert len(comp2.key) > 0
+
+
+def test_render_batch():
+    """Test render_batch keeps components in order."""
+    params = Batch(
+        components=[
+            {"type": "number_input", "label": "Age"},
+            {"type": "radio", "label": "Colour", "options": ["red", "blue"]},
+            {"type": "line", "data": [1, 2, 3], "x_label": "X", "y_label": "Y"},
+            {"type": "camera_input", "label": "Photo"},
+        ]
+    )
+
+    result = anyio.run(render_batch, params)
+
+    assert result == params
+    assert result.type == "batch"
+    assert [type(c) for c in result.components] == [
+        NumberInput,
+        Choice,
+        Chart,
+        CameraInput,
+    ]
+    assert len({c.key for c in result.components}) == 4
+
+
+def test_render_batch_reports_all_errors():
+    """Test that invalid components are all reported in one pass."""
+    with pytest.raises(ValidationError) as exc_info:
+        Batch(
+            components=[
+                {"type": "slider"},
+                {"type": "radio", "label": "Colour"},
+                {"type": "unknown"},
+            ]
+        )
+
+    assert exc_info.value.error_count() == 3
+
+
+def test_render_component():
+    """Test render_component returns other components unchanged."""
+    params = Choice(type="radio", label="Size", options=["S", "M"])
+
+    assert anyio.run(render_component, params) is params
+
+
+def test_render_component_chart():
+    """Test render_component renders charts like the chart tool."""
+    params = Chart(
+        type="line", data=list(range(100)), x_label="X", y_label="Y", max_points=10
+    )
+
+    result = anyio.run(render_component, params)
+
+    assert len(result.data) == 10
+    assert result.original_length == 100
+
+
+def test_component_state():
+    """Test the value of a generated input component can be set and read."""
+    params = number_input(NumberInput(type="slider", label="Age"))
+
+    assert get_component_state(params.key).value is None
+    set_component_value(params.key, 42)
+    state = get_component_state(params.key)
+
+    assert state.component == params
+    assert state.value == 42
+
+
+def test_component_state_unknown_key():
+    """Test unknown components are reported."""
+    with pytest.raises(ValueError, match="Unknown component"):
+        get_component_state("unknown")
+    with pytest.raises(ValueError, match="Unknown component"):
+        set_component_value("unknown", 1)
+
+
+def test_validate_values():
+    """Test submitted values are checked against their components."""
+    slider = number_input(NumberInput(type="slider", label="Age", max_value=10))
+    radio = choice(Choice(type="radio", label="Size", options=["S", "M"]))
+
+    validation = validate_values(
+        [
+            Submission(key=slider.key, value=5),
+            Submission(key=slider.key, value=11),
+            Submission(key=radio.key, value="S"),
+            Submission(key="unknown", value=1),
+        ]
+    )
+
+    assert [result.valid for result in validation.results] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert "maximum" in validation.results[1].error
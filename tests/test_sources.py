@@ -0,0 +1,102 @@
+"""Tests for data source readers."""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from ui_mcp_server.models import DataSource
+from ui_mcp_server.settings import settings
+from ui_mcp_server.sources import aggregate, load
+
+
+@pytest.fixture(autouse=True)
+def data_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dirs", [tmp_path])
+
+
+@pytest.fixture
+def table() -> pa.Table:
+    return pa.table({"a": np.arange(10.0), "b": np.arange(10.0) * 2})
+
+
+def test_load_npy(tmp_path):
+    path = tmp_path / "data.npy"
+    np.save(path, np.arange(20.0).reshape(10, 2))
+
+    values = load(DataSource(path=path, column=1, start=2, stop=8, step=2))
+
+    assert values.tolist() == [5.0, 9.0, 13.0]
+
+
+def test_load_structured_npy(tmp_path):
+    path = tmp_path / "data.npy"
+    array = np.zeros(3, dtype=[("t", "i8"), ("v", "f4")])
+    array["v"] = [1.5, 2.5, 3.5]
+    np.save(path, array)
+
+    assert load(DataSource(path=path, column="v")).tolist() == [1.5, 2.5, 3.5]
+
+
+def test_load_csv_with_header(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("time,value\n0,1.5\n1,2.5\n2,3.5\n3,4.5\n")
+
+    values = load(DataSource(path=path, column="value", start=1, stop=3))
+
+    assert values.tolist() == [2.5, 3.5]
+
+
+def test_load_csv_without_header(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("0,1\n1,2\n2,3\n")
+
+    assert load(DataSource(path=path, column=1)).tolist() == [1.0, 2.0, 3.0]
+
+
+def test_load_parquet(tmp_path, table):
+    path = tmp_path / "data.parquet"
+    pq.write_table(table, path)
+
+    assert load(DataSource(path=path, column="b", stop=3)).tolist() == [0, 2, 4]
+    assert load(DataSource(path=path, column=0, start=8)).tolist() == [8, 9]
+
+
+def test_load_arrow(tmp_path, table):
+    path = tmp_path / "data.arrow"
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as w:
+        w.write_table(table)
+
+    values = load(DataSource(path=path, column="b", step=4))
+
+    assert values.tolist() == [0, 8, 16]
+
+
+def test_load_unsupported(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported"):
+        load(DataSource(path=tmp_path / "data.xlsx"))
+
+
+def test_load_outside_data_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dirs", [tmp_path / "allowed"])
+
+    with pytest.raises(ValueError, match="outside"):
+        load(DataSource(path=tmp_path / "data.npy"))
+
+
+@pytest.mark.parametrize(
+    ("method", "expected"),
+    [("mean", [1, 3.5]), ("sum", [3, 7]), ("min", [0, 3]), ("max", [2, 4])],
+)
+def test_aggregate(method, expected):
+    values = np.arange(5.0)
+
+    assert aggregate(values, 3, method).tolist() == expected
+
+
+def test_load_requires_data_dirs(tmp_path, monkeypatch):
+    path = tmp_path / "data.npy"
+    np.save(path, np.arange(3.0))
+    monkeypatch.setattr(settings, "data_dirs", [])
+
+    with pytest.raises(ValueError, match="data_dirs"):
+        load(DataSource(path=path))
@@ -0,0 +1,168 @@
+"""Start-up benchmarks and snapshot tests.
+
+Timings are printed (run with `-s` to see them) and checked against generous
+bounds, so that regressions like an eager import of a heavy module are caught.
+"""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+import anyio
+import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+from ui_mcp_server import snapshot
+from ui_mcp_server.core import UIServer
+from ui_mcp_server.settings import settings
+
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "0"},
+    },
+}
+
+
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_heavy_modules_imported_lazily():
+    loaded = run_python(
+        "import sys, ui_mcp_server.server; "
+        "print([m for m in ('numpy', 'pyarrow') if m in sys.modules])"
+    )
+
+    assert loaded == "[]"
+
+
+def test_import_time():
+    elapsed = float(
+        run_python(
+            "import time; start = time.perf_counter(); "
+            "import ui_mcp_server.server; print(time.perf_counter() - start)"
+        )
+    )
+
+    print(f"\nimport ui_mcp_server.server: {elapsed * 1e3:.0f} ms")
+    assert elapsed < 5
+
+
+def test_time_to_initialize():
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from ui_mcp_server import main; main()"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        process.stdin.write(json.dumps(INITIALIZE) + "\n")
+        process.stdin.flush()
+        response = json.loads(process.stdout.readline())
+        elapsed = time.perf_counter() - start
+    finally:
+        process.stdin.close()
+        process.wait(timeout=10)
+
+    print(f"\ntime to initialize response: {elapsed * 1e3:.0f} ms")
+    assert response["id"] == 1
+    assert response["result"]["serverInfo"]["name"] == "ui-mcp-server"
+    assert elapsed < 10
+
+
+def test_snapshot_up_to_date():
+    assert snapshot.load() == anyio.run(snapshot.build)["tools"], (
+        "Regenerate the snapshot with `python -m ui_mcp_server.snapshot`."
+    )
+
+
+@pytest.mark.parametrize("source", snapshot.SOURCES)
+def test_snapshot_stamp_covers_sources(source, monkeypatch):
+    stamp = snapshot.stamp()
+    path = snapshot.PATH.with_name(source)
+    read_bytes = Path.read_bytes
+    monkeypatch.setattr(
+        Path,
+        "read_bytes",
+        lambda self: read_bytes(self) + b"#" if self == path else read_bytes(self),
+    )
+
+    assert snapshot.stamp() != stamp
+
+
+def test_snapshot_stamp_covers_mcp_version(monkeypatch):
+    stamp = snapshot.stamp()
+    monkeypatch.setattr(snapshot, "version", lambda name: "0")
+
+    assert snapshot.stamp() != stamp
+
+
+def test_list_tools_from_snapshot():
+    names = [tool["name"] for tool in snapshot.load()]
+    server = UIServer("test")
+    for name in names:
+        server.add_tool(lambda: None, name=name)
+
+    tools = anyio.run(server.list_tools)
+
+    assert [tool.name for tool in tools] == names
+    assert server._tool_manager.list_tools() == []
+
+
+def test_list_tools_compact(monkeypatch):
+    monkeypatch.setattr(settings, "compact_schemas", True)
+    names = [tool["name"] for tool in snapshot.load()]
+    server = UIServer("test")
+    for name in names:
+        server.add_tool(lambda: None, name=name)
+
+    tools = anyio.run(server.list_tools)
+
+    assert [tool.name for tool in tools] == names
+    assert all("title" not in tool.inputSchema for tool in tools)
+    assert anyio.run(server.list_tools) == tools
+
+
+def test_disabled_tools():
+    server = UIServer("test")
+    server.add_tool(lambda: "on", name="on")
+    server.add_tool(lambda: "off", name="off")
+    server.disabled_tools.add("off")
+
+    tools = anyio.run(server.list_tools)
+
+    assert [tool.name for tool in tools] == ["on"]
+    assert [tool.name for tool in anyio.run(server.list_all_tools)] == ["on", "off"]
+    with pytest.raises(ToolError, match="Unknown tool: off"):
+        anyio.run(server.call_tool, "off", {})
+
+
+def test_tools_digest(monkeypatch):
+    server = UIServer("test")
+    digest = server.tools_digest()
+
+    assert server.tools_digest() == digest
+    server.disabled_tools.add("off")
+    disabled = server.tools_digest()
+    monkeypatch.setattr(settings, "compact_schemas", True)
+    compact = server.tools_digest()
+
+    assert len({digest, disabled, compact}) == 3
+
+
+def test_list_tools_without_matching_snapshot():
+    server = UIServer("test")
+    server.add_tool(lambda: None, name="other")
+
+    tools = anyio.run(server.list_tools)
+
+    assert [tool.name for tool in tools] == ["other"]
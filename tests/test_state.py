@@ -0,0 +1,116 @@
+"""Tests for the component state store."""
+
+from datetime import UTC, datetime
+from ui_mcp_server.models import Batch, Chart, Choice, ComponentState, NumberInput
+from ui_mcp_server.state import MemoryStateStore
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_store(**kwargs) -> MemoryStateStore:
+    return MemoryStateStore(
+        **{"max_sessions": 10, "session_bytes": 2**20, "ttl": 60} | kwargs
+    )
+
+
+def test_remember_and_get():
+    store = make_store()
+    component = NumberInput(type="slider", label="Age")
+
+    store.remember("a", component)
+
+    state = store.get("a", component.key)
+    assert state.component == component
+    assert state.value is None
+    assert store.get("b", component.key) is None
+    assert store.get("a", "unknown") is None
+
+
+def test_remember_batch_keeps_inputs_only():
+    store = make_store()
+    choice = Choice(type="radio", label="Size", options=["S", "M"])
+    chart = Chart(type="line", data=[1, 2], x_label="X", y_label="Y")
+    batch = Batch(components=[choice, chart])
+
+    store.remember("a", batch)
+
+    assert store.get("a", choice.key).component == choice
+    assert store.get("a", chart.key) is None
+    assert store.get("a", batch.key) is None
+
+
+def test_set_value():
+    store = make_store()
+    component = Choice(type="multiselect", label="Sizes", options=["S", "M"])
+    store.remember("a", component)
+
+    state = store.set_value("a", component.key, ["S"])
+
+    assert state.value == ["S"]
+    assert store.get("a", component.key) == state
+    assert store.set_value("a", "unknown", 1) is None
+
+
+def test_idle_sessions_expire():
+    clock = Clock()
+    store = make_store(ttl=10, clock=clock)
+    first = NumberInput(type="slider", label="First")
+    second = NumberInput(type="slider", label="Second")
+    store.remember("a", first)
+    store.remember("b", second)
+
+    clock.now = 8
+    assert store.get("b", second.key) is not None
+    clock.now = 15
+
+    assert store.get("a", first.key) is None
+    assert store.get("b", second.key) is not None
+    assert len(store) == 1
+
+
+def test_least_recently_used_session_evicted():
+    store = make_store(max_sessions=2)
+    components = [NumberInput(type="slider", label=str(i)) for i in range(3)]
+    store.remember("a", components[0])
+    store.remember("b", components[1])
+    store.get("a", components[0].key)
+
+    store.remember("c", components[2])
+
+    assert store.get("a", components[0].key) is not None
+    assert store.get("b", components[1].key) is None
+    assert len(store) == 2
+
+
+def test_session_bytes_bounded():
+    component = NumberInput(type="slider", label="Age")
+    size = len(
+        ComponentState(
+            component=component, updated_at=datetime.now(UTC)
+        ).model_dump_json()
+    )
+    store = make_store(session_bytes=2 * size)
+    components = [NumberInput(type="slider", label="Age") for _ in range(3)]
+
+    for component in components:
+        store.remember("a", component)
+
+    assert store.get("a", components[0].key) is None
+    assert store.get("a", components[2].key) is not None
+
+
+def test_remember_keeps_existing_state():
+    store = make_store()
+    component = NumberInput(type="slider", label="Age")
+    store.remember("a", component)
+    store.set_value("a", component.key, 3)
+
+    store.remember("a", component)
+
+    assert store.get("a", component.key).value == 3
@@ -0,0 +1,102 @@
+"""Tests for the SQLite component state store."""
+
+import sqlite3
+import time
+import pytest
+from ui_mcp_server.models import Choice, NumberInput
+from ui_mcp_server.state_sqlite import SQLiteStateStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "state.db"
+
+
+@pytest.fixture
+def store(path):
+    store = SQLiteStateStore(path, ttl=60, history=2, flush_interval=60)
+    yield store
+    store.close()
+
+
+def count(path, table: str) -> int:
+    with sqlite3.connect(path) as connection:
+        return connection.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+
+
+def test_wal_mode(store, path):
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_pending_writes_are_read_before_commit(store, path):
+    component = NumberInput(type="slider", label="Age")
+
+    store.remember("a", component)
+    store.set_value("a", component.key, 3)
+
+    assert store.get("a", component.key).value == 3
+    assert count(path, "components") == 0
+
+
+def test_writes_committed_in_groups(path):
+    store = SQLiteStateStore(path, ttl=60, flush_interval=60, batch_size=3)
+    components = [NumberInput(type="slider", label=str(i)) for i in range(3)]
+
+    for component in components[:2]:
+        store.remember("a", component)
+    assert count(path, "components") == 0
+    store.remember("a", components[2])
+
+    assert count(path, "components") == 3
+    store.close()
+
+
+def test_background_flush(path):
+    store = SQLiteStateStore(path, ttl=60, flush_interval=0.01)
+    store.remember("a", NumberInput(type="slider", label="Age"))
+
+    deadline = time.monotonic() + 5
+    while count(path, "components") == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert count(path, "components") == 1
+    store.close()
+
+
+def test_state_survives_restart(store, path):
+    component = Choice(type="radio", label="Size", options=["S", "M"])
+    store.remember("a", component)
+    store.set_value("a", component.key, "M")
+    store.close()
+
+    reopened = SQLiteStateStore(path, ttl=60)
+    state = reopened.get("a", component.key)
+    reopened.close()
+
+    assert state.component == component
+    assert state.value == "M"
+
+
+def test_history_compacted(store):
+    component = NumberInput(type="slider", label="Age")
+    store.remember("a", component)
+    for value in range(4):
+        store.set_value("a", component.key, value)
+
+    assert [value for _, value in store.history("a", component.key)] == [0, 1, 2, 3]
+    store.compact()
+
+    assert [value for _, value in store.history("a", component.key)] == [2, 3]
+
+
+def test_idle_sessions_compacted(store, path):
+    component = NumberInput(type="slider", label="Age")
+    store.remember("a", component)
+    store.set_value("a", component.key, 1)
+    store.ttl = -1
+
+    store.compact()
+
+    assert store.get("a", component.key) is None
+    assert count(path, "history") == 0
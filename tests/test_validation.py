@@ -0,0 +1,86 @@
+"""Tests for the checks of submitted values."""
+
+from datetime import date
+import pytest
+from ui_mcp_server.models import (
+    AudioInput,
+    Choice,
+    ColorPicker,
+    DateInput,
+    NumberInput,
+    TimeInput,
+)
+from ui_mcp_server.validation import check
+
+
+SLIDER = NumberInput(type="slider", label="Age", min_value=0, max_value=10, step=0.5)
+RADIO = Choice(type="radio", label="Size", options=["S", "M"])
+MULTISELECT = Choice(type="multiselect", label="Sizes", options=["S", "M"])
+DAY = DateInput(
+    type="date_input",
+    label="Day",
+    format="YYYY/MM/DD",
+    min_value=date(2024, 1, 1),
+    max_value=date(2024, 12, 31),
+)
+TIME = TimeInput(type="time_input", label="At")
+COLOR = ColorPicker(type="color_picker", label="Color")
+
+
+@pytest.mark.parametrize(
+    ("component", "value"),
+    [
+        (SLIDER, 3.5),
+        (SLIDER, 10),
+        (SLIDER, [0, 2.5]),
+        (NumberInput(type="number_input", label="Any", step=0.1), 0.3),
+        (RADIO, "M"),
+        (RADIO, 1),
+        (MULTISELECT, ["S", "M"]),
+        (DAY, "2024-02-29"),
+        (DAY, ["2024-01-01", "2024-12-31"]),
+        (TIME, "12:45"),
+        (COLOR, "#ff00AA"),
+        (AudioInput(type="audio_input", label="Record"), "anything"),
+        (RADIO, None),
+    ],
+)
+def test_valid(component, value):
+    assert check([component], [value]) == [None]
+
+
+@pytest.mark.parametrize(
+    ("component", "value", "error"),
+    [
+        (SLIDER, -1, "less than the minimum"),
+        (SLIDER, [2, 11], "greater than the maximum"),
+        (SLIDER, 3.2, "multiple of the step"),
+        (SLIDER, "3", "Expected a number"),
+        (SLIDER, True, "Expected a number"),
+        (RADIO, "XL", "Unknown option"),
+        (RADIO, 2, "out of range"),
+        (MULTISELECT, "S", "Expected a list"),
+        (MULTISELECT, ["S", "XL"], "Unknown options"),
+        (DAY, "2023-12-31", "before the minimum"),
+        (DAY, "2025-01-01", "after the maximum"),
+        (DAY, "tomorrow", "Expected an ISO date"),
+        (TIME, "12:40", "multiple of the step"),
+        (COLOR, "red", "Expected a hex color"),
+        (None, 1, "Unknown component"),
+    ],
+)
+def test_invalid(component, value, error):
+    [result] = check([component], [value])
+
+    assert error in result
+
+
+def test_check_many():
+    components = [SLIDER] * 1000 + [RADIO, None]
+    values = [i % 25 / 2 for i in range(1000)] + ["S", 1]
+
+    errors = check(components, values)
+
+    assert sum(error is not None for error in errors) == 160 + 1
+    assert errors[21] is not None
+    assert errors[-2] is None
@@ -1,8 +1,22 @@
 """Server module."""
 
-from .server import server
+from typing import Any
+
+
+__version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import the server on first access, keeping the package import cheap."""
+    if name == "server":
+        from ui_mcp_server.server import server
+
+        return server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:  # pragma: no cover
     """Start the MCP server."""
-    server.run()
+    from ui_mcp_server.cli import main
+
+    main()
@@ -0,0 +1,200 @@
+"""Waveform peaks and metadata of local audio files.
+
+To draw a waveform or show a duration, a frontend would have to download and
+decode the whole file. For audio outputs of local files with
+`waveform_buckets` set, the server decodes the file once instead and adds the
+minimum and maximum sample of each bucket, the duration and the sample rate to
+the component, so that clients can draw it right away and fetch the audio only
+when it is played.
+
+Files are decoded in chunks, so memory stays bounded however long they are,
+and the peaks of each chunk are reduced per bucket with NumPy. PCM WAV files
+are read with the standard library; other formats need the optional
+`soundfile` package. Results are cached by path, modification time and number
+of buckets.
+"""
+
+import asyncio
+import wave
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import NamedTuple
+import numpy as np
+from numpy.typing import NDArray
+from ui_mcp_server.cache import LRUCache
+from ui_mcp_server.models import AudioOutput, BaseComponent, Waveform
+from ui_mcp_server.paths import local_media, resolve_path
+
+
+CHUNK_FRAMES = 2**16
+"""Number of frames decoded at a time."""
+
+PRECISION = 4
+"""Decimals kept of the peaks, which are drawn at pixel resolution anyway."""
+
+Chunks = Iterable[NDArray[np.float32]]
+"""Samples of consecutive frames, one column per channel."""
+
+
+class Analysis(NamedTuple):
+    """Metadata and peaks of an audio file."""
+
+    sample_rate: int
+    """Sample rate of the audio."""
+    duration: float
+    """Duration of the audio in seconds."""
+    waveform: Waveform
+    """Peaks of the audio."""
+
+
+CACHE: LRUCache[tuple[str, int, int], Analysis] = LRUCache(1024)
+"""Analyses of recently used files, by path, modification time and buckets."""
+
+
+def _pcm(data: bytes, width: int) -> NDArray[np.float32]:
+    """Convert little-endian PCM samples to floats between -1 and 1."""
+    if width == 1:
+        return (np.frombuffer(data, np.uint8).astype(np.float32) - 128) / np.float32(
+            128
+        )
+    if width == 3:
+        samples = np.zeros((len(data) // 3, 4), np.uint8)
+        samples[:, 1:] = np.frombuffer(data, np.uint8).reshape(-1, 3)
+        return samples.view("<i4").ravel().astype(np.float32) / np.float32(2**31)
+    dtype = {2: "<i2", 4: "<i4"}[width]
+    return np.frombuffer(data, dtype).astype(np.float32) / np.float32(
+        2 ** (8 * width - 1)
+    )
+
+
+@contextmanager
+def _read_wave(path: Path) -> Iterator[tuple[int, int, Chunks]]:
+    """Open a PCM WAV file as its sample rate, frame count and chunks.
+
+    Raises:
+        wave.Error: If the file is not a PCM WAV file.
+    """
+    with wave.open(str(path)) as audio:
+        channels, width = audio.getnchannels(), audio.getsampwidth()
+
+        def chunks() -> Iterator[NDArray[np.float32]]:
+            while data := audio.readframes(CHUNK_FRAMES):
+                yield _pcm(data, width).reshape(-1, channels)
+
+        yield audio.getframerate(), audio.getnframes(), chunks()
+
+
+@contextmanager
+def _read_soundfile(path: Path) -> Iterator[tuple[int, int, Chunks]]:
+    """Open any audio file libsndfile reads as its rate, frame count and chunks."""
+    try:
+        import soundfile
+    except ImportError as e:
+        raise ImportError(
+            "Install soundfile, e.g. `pip install ui-mcp-server[audio]`, "
+            "to read audio files other than PCM WAV."
+        ) from e
+    with soundfile.SoundFile(path) as audio:
+        chunks = audio.blocks(CHUNK_FRAMES, dtype="float32", always_2d=True)
+        yield audio.samplerate, audio.frames, chunks
+
+
+def peaks(frames: int, chunks: Chunks, buckets: int) -> Waveform:
+    """Reduce audio to the minimum and maximum sample of each bucket.
+
+    Args:
+        frames: Number of frames of the audio. Frames past it are added to the
+            last bucket, and buckets past the end of shorter audio are zero.
+        chunks: Samples of consecutive frames, one column per channel.
+        buckets: Number of buckets, reduced to the number of frames if larger.
+
+    Returns:
+        The peaks.
+    """
+    buckets = max(1, min(buckets, frames))
+    edges = np.linspace(0, frames, buckets + 1).astype(np.intp)
+    lows = np.full(buckets, np.inf)
+    highs = np.full(buckets, -np.inf)
+    start = 0
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        end = start + len(chunk)
+        first, last = np.minimum(
+            np.searchsorted(edges, [start, end - 1], side="right") - 1, buckets - 1
+        )
+        cuts = np.concatenate(([start], edges[first + 1 : last + 1])) - start
+        window = slice(first, last + 1)
+        lows[window] = np.minimum(lows[window], np.minimum.reduceat(chunk.min(1), cuts))
+        highs[window] = np.maximum(
+            highs[window], np.maximum.reduceat(chunk.max(1), cuts)
+        )
+        start = end
+    lows[~np.isfinite(lows)] = 0
+    highs[~np.isfinite(highs)] = 0
+    return Waveform(
+        bucket_size=frames // buckets,
+        min=np.round(lows, PRECISION).tolist(),
+        max=np.round(highs, PRECISION).tolist(),
+    )
+
+
+def analyze_file(path: Path, buckets: int) -> Analysis | None:
+    """Decode an audio file into its metadata and peaks, using the cache.
+
+    Args:
+        path: Path of the file.
+        buckets: Number of buckets of the waveform.
+
+    Returns:
+        The analysis, or None if the file does not exist.
+
+    Raises:
+        ValueError: If the path is outside the allowed data directories.
+    """
+    resolved = resolve_path(path)
+    if not resolved.is_file():
+        return None
+    key = (str(resolved), resolved.stat().st_mtime_ns, buckets)
+    analysis = CACHE.get(key)
+    if analysis is not None:
+        return analysis
+    with ExitStack() as stack:
+        try:
+            sample_rate, frames, chunks = stack.enter_context(_read_wave(resolved))
+        except (wave.Error, EOFError):  # Not a PCM WAV file.
+            sample_rate, frames, chunks = stack.enter_context(_read_soundfile(resolved))
+        waveform = peaks(frames, chunks, buckets)
+    analysis = Analysis(sample_rate, frames / sample_rate, waveform)
+    CACHE.put(key, analysis)
+    return analysis
+
+
+async def analyze[T: BaseComponent](component: T) -> T:
+    """Add the waveform and metadata to audio outputs of local files.
+
+    Only audio outputs with `waveform_buckets` set are analyzed, in a thread.
+    Outputs of files that do not exist are left unchanged.
+
+    Args:
+        component: Component, or batch of components, to update in place.
+
+    Returns:
+        The component.
+    """
+    outputs = [
+        (output, path, output.waveform_buckets)
+        for output, path in local_media(component, AudioOutput)
+        if output.waveform_buckets is not None
+    ]
+    analyses = await asyncio.gather(
+        *(
+            asyncio.to_thread(analyze_file, path, buckets)
+            for _, path, buckets in outputs
+        )
+    )
+    for (output, _, _), analysis in zip(outputs, analyses, strict=True):
+        if analysis is not None:
+            output.sample_rate, output.duration, output.waveform = analysis
+    return component
@@ -0,0 +1,91 @@
+"""Size-bounded caches."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class LRUCache[K: Hashable, V]:
+    """Least-recently-used cache bounded by the total size of its values.
+
+    Args:
+        max_size: Maximum total size of the cached values.
+        sizeof: Function returning the size of a value. Counts entries by default.
+    """
+
+    def __init__(self, max_size: int, sizeof: Callable[[V], int] = lambda _: 1) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.size = 0
+        self._items: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached values."""
+        return len(self._items)
+
+    def __contains__(self, key: K) -> bool:
+        """Check whether a key is cached, without marking it as used."""
+        return key in self._items
+
+    def get(self, key: K) -> V | None:
+        """Get a value and mark it as recently used.
+
+        Args:
+            key: Key of the value.
+
+        Returns:
+            The cached value, or None if the key is not cached.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key: K, value: V) -> None:
+        """Cache a value, evicting least recently used values to make room.
+
+        Values larger than the whole cache are not cached.
+
+        Args:
+            key: Key of the value.
+            value: Value to cache.
+        """
+        size = self.sizeof(value)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_size:
+                return
+            self._items[key] = (value, size)
+            self.size += size
+            while self.size > self.max_size:
+                self._discard(next(iter(self._items)))
+
+    def pop(self, key: K) -> V | None:
+        """Remove a value from the cache.
+
+        Args:
+            key: Key of the value.
+
+        Returns:
+            The removed value, or None if the key is not cached.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            self._discard(key)
+            return None if item is None else item[0]
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def _discard(self, key: K) -> None:
+        """Remove a key if present. The lock must be held."""
+        item = self._items.pop(key, None)
+        if item is not None:
+            self.size -= item[1]
@@ -0,0 +1,217 @@
+"""Index of the media files in the data directories.
+
+Listing files for the user to pick from would otherwise take a directory walk
+per request. The `list_media` tool answers from an index of the audio, image
+and video files in the data directories instead, by MIME type, extension and
+case-insensitive name prefix.
+
+The index is updated incrementally. A directory's modification time changes
+whenever a file is added to it, removed from it or renamed in it, so an update
+only lists the directories whose modification time changed and stats the
+others. Updates happen on queries, at most once per `media_scan_interval`
+seconds.
+"""
+
+import functools
+import itertools
+import mimetypes
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from ui_mcp_server.settings import settings
+
+
+KINDS = frozenset({"audio", "image", "video"})
+"""Top-level MIME types of the indexed files."""
+
+
+@functools.cache
+def _extension_type(extension: str) -> str | None:
+    """Get the MIME type of a media file extension."""
+    guess = mimetypes.guess_type("media" + extension, strict=False)[0]
+    if guess is None or guess.partition("/")[0] not in KINDS:
+        return None
+    return guess
+
+
+def media_type(name: str) -> str | None:
+    """Get the MIME type of a media file from its name.
+
+    Args:
+        name: Name of the file.
+
+    Returns:
+        The MIME type, or None if the file is not audio, an image or a video.
+    """
+    return _extension_type(os.path.splitext(name)[1].lower())
+
+
+class MediaIndex:
+    """Media files of directory trees, by MIME type, extension and name.
+
+    For each scanned directory, the index keeps its modification time, its
+    subdirectories and its media files, so that unchanged directories need not
+    be listed again. Files are kept sorted by lowercase name, for prefix
+    queries, and by extension, MIME type and top-level MIME type.
+
+    Args:
+        roots: Directories to index, with their subdirectories.
+        interval: Minimum number of seconds between two updates.
+    """
+
+    def __init__(self, roots: Sequence[Path], interval: float) -> None:
+        """Initialize an empty index, filled on the first query."""
+        self.roots = [root.expanduser().resolve() for root in roots]
+        self.interval = interval
+        self._updated = -float("inf")
+        self._directories: dict[str, int] = {}
+        self._children: dict[str, list[str]] = {}
+        self._files: dict[str, set[str]] = {}
+        self._names: list[tuple[str, str]] = []
+        self._extensions: defaultdict[str, set[str]] = defaultdict(set)
+        self._types: defaultdict[str, set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of indexed files."""
+        return len(self._names)
+
+    def _index(self, path: str, add: bool) -> None:
+        """Add a file to, or remove it from, the extension and type indexes."""
+        name = os.path.basename(path)
+        kind = media_type(name)
+        if kind is None:
+            return
+        for paths in (
+            self._extensions[os.path.splitext(name)[1].lower()],
+            self._types[kind],
+            self._types[kind.partition("/")[0]],
+        ):
+            if add:
+                paths.add(path)
+            else:
+                paths.discard(path)
+
+    def _scan(self, directory: str, mtime: int) -> tuple[set[str], set[str]]:
+        """List a new or changed directory and update its files.
+
+        Returns:
+            The added and the removed files.
+        """
+        files, children = set(), []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        children.append(entry.path)
+                    elif entry.is_file() and media_type(entry.name) is not None:
+                        files.add(entry.path)
+        except OSError:  # Removed or unreadable since it was stat'ed.
+            pass
+        previous = self._files.get(directory, set())
+        self._directories[directory] = mtime
+        self._children[directory] = children
+        self._files[directory] = files
+        return files - previous, previous - files
+
+    def update(self) -> None:
+        """Scan new and changed directories, and drop removed ones."""
+        added: set[str] = set()
+        removed: set[str] = set()
+        pending = [str(root) for root in self.roots]
+        visited = set()
+        while pending:
+            directory = pending.pop()
+            if directory in visited:
+                continue
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            visited.add(directory)
+            if self._directories.get(directory) != mtime:
+                new, old = self._scan(directory, mtime)
+                added |= new
+                removed |= old
+            pending.extend(self._children[directory])
+        for directory in self._directories.keys() - visited:
+            removed |= self._files.pop(directory)
+            del self._directories[directory], self._children[directory]
+        for path in removed:
+            self._index(path, add=False)
+        for path in added:
+            self._index(path, add=True)
+        if removed:
+            self._names = [entry for entry in self._names if entry[1] not in removed]
+        if added:
+            self._names += ((os.path.basename(path).lower(), path) for path in added)
+            self._names.sort()
+        self._updated = time.monotonic()
+
+    def query(
+        self,
+        kind: str | None = None,
+        extensions: Iterable[str] | None = None,
+        prefix: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Find media files, updating the index first if it is due.
+
+        Args:
+            kind: MIME type, e.g. `image/png`, or top-level MIME type, e.g.
+                `image`, of the files.
+            extensions: Extensions of the files, with or without the dot.
+            prefix: Case-insensitive prefix of the file names.
+            offset: Number of matching files to skip, e.g. to get the next page.
+            limit: Maximum number of files, or None for all of them.
+
+        Returns:
+            The paths of the files, sorted by name.
+        """
+        with self._lock:
+            if time.monotonic() - self._updated >= self.interval:
+                self.update()
+            allowed = self._allowed(kind, extensions)
+            prefix = (prefix or "").lower()
+            start = bisect_left(self._names, (prefix,))
+            end = bisect_left(self._names, (prefix + chr(0x10FFFF),))
+            wanted = end - start if limit is None else offset + limit
+            names = self._names
+            if allowed is None:
+                candidates = (names[i][1] for i in range(start, end))
+            elif len(allowed) < wanted * (end - start) / max(len(allowed), 1):
+                # Sorting the allowed files is cheaper than filtering the names
+                # until enough of them are found.
+                named = ((os.path.basename(path).lower(), path) for path in allowed)
+                candidates = (
+                    path for name, path in sorted(named) if name.startswith(prefix)
+                )
+            else:
+                candidates = (
+                    names[i][1] for i in range(start, end) if names[i][1] in allowed
+                )
+            stop = None if limit is None else offset + limit
+            return list(itertools.islice(candidates, offset, stop))
+
+    def _allowed(
+        self, kind: str | None, extensions: Iterable[str] | None
+    ) -> set[str] | None:
+        """Get the files of a MIME type and extensions, None if unfiltered."""
+        allowed = None if kind is None else self._types.get(kind.lower(), set())
+        if extensions is not None:
+            matching = set[str]().union(
+                *(
+                    self._extensions.get("." + extension.lower().lstrip("."), ())
+                    for extension in extensions
+                )
+            )
+            allowed = matching if allowed is None else allowed & matching
+        return allowed
+
+
+index = MediaIndex(settings.data_dirs, settings.media_scan_interval)
@@ -0,0 +1,286 @@
+"""Helpers for chart components."""
+
+import base64
+from collections.abc import Callable, Sequence
+from typing import Any
+import numpy as np
+from numpy.typing import NDArray
+from ui_mcp_server.cache import LRUCache
+from ui_mcp_server.models import ArrayDtype, Chart, ChartWindow, EncodedArray
+from ui_mcp_server.settings import settings
+from ui_mcp_server.sources import load
+
+
+Downsampler = Callable[
+    [NDArray[np.float64], int], tuple[NDArray[np.intp], NDArray[np.float64]]
+]
+
+
+def _bucket_sums(
+    values: NDArray[np.float64], edges: NDArray[np.intp]
+) -> NDArray[np.float64]:
+    """Sum `values` over the buckets `[edges[i], edges[i + 1])`."""
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    return cumsum[edges[1:]] - cumsum[edges[:-1]]
+
+
+def lttb(
+    values: NDArray[np.float64], max_points: int
+) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+    """Downsample with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The remaining points are split
+    into `max_points - 2` buckets, and from each bucket the point forming the
+    largest triangle with the previously selected point and the average of the
+    next bucket is kept.
+
+    Args:
+        values: Series to downsample.
+        max_points: Number of points to keep. Must be at least 3.
+
+    Returns:
+        Indices of the kept points and their values.
+    """
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n), values
+
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    counts = np.diff(edges)
+    # Averages of every bucket, with the last point acting as the final bucket.
+    avg_x = np.append((edges[:-1] + edges[1:] - 1) / 2, n - 1)
+    avg_y = np.append(_bucket_sums(values, edges) / counts, values[-1])
+
+    positions = np.arange(n, dtype=np.float64)
+    index = np.empty(max_points, dtype=np.intp)
+    index[0], index[-1] = 0, n - 1
+    selected = 0
+    for bucket in range(max_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        sel_y = values[selected]
+        # Doubled triangle area, written as a linear function of (x, y).
+        slope_y = selected - avg_x[bucket + 1]
+        slope_x = avg_y[bucket + 1] - sel_y
+        area = values[start:stop] * slope_y
+        area += positions[start:stop] * slope_x
+        area -= slope_y * sel_y + selected * slope_x
+        selected = start + int(np.abs(area, out=area).argmax())
+        index[bucket + 1] = selected
+    return index, values[index]
+
+
+def min_max(
+    values: NDArray[np.float64], max_points: int
+) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+    """Downsample by keeping the minimum and maximum of each bucket.
+
+    Args:
+        values: Series to downsample.
+        max_points: Maximum number of points to keep. Must be at least 2.
+
+    Returns:
+        Indices of the kept points, in order, and their values.
+    """
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n), values
+
+    size = -(-n // (max_points // 2))
+    buckets = -(-n // size)
+    # Padding with the last value never moves an arg-extremum into the padding,
+    # because the first occurrence of a tie is the real last point.
+    padded = np.pad(values, (0, buckets * size - n), mode="edge")
+    padded = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    argmin = offsets + padded.argmin(axis=1)
+    argmax = offsets + padded.argmax(axis=1)
+    index = np.unique(np.concatenate((argmin, argmax)))
+    return index, values[index]
+
+
+def mean(
+    values: NDArray[np.float64], max_points: int
+) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+    """Downsample by averaging equally sized buckets.
+
+    Args:
+        values: Series to downsample.
+        max_points: Number of buckets.
+
+    Returns:
+        Centre indices of the buckets and their mean values.
+    """
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n), values
+
+    edges = np.linspace(0, n, max_points + 1).astype(np.intp)
+    index = (edges[:-1] + edges[1:] - 1) // 2
+    return index, _bucket_sums(values, edges) / np.diff(edges)
+
+
+DOWNSAMPLERS: dict[str, Downsampler] = {
+    "lttb": lttb,
+    "minmax": min_max,
+    "mean": mean,
+}
+
+
+class Pyramid:
+    """Min/max decimation pyramid of a series.
+
+    Level `k` holds the minimum and maximum of every block of `2**k` points, so
+    any window can be read at a given resolution by slicing a single level.
+
+    Args:
+        values: Series to build the pyramid of.
+    """
+
+    def __init__(self, values: NDArray[np.float64]) -> None:
+        """Build the pyramid."""
+        self.length = len(values)
+        self.levels = [(values, values)]
+        mins = maxs = values
+        while len(mins) > 1:
+            if len(mins) % 2:
+                mins, maxs = np.append(mins, mins[-1]), np.append(maxs, maxs[-1])
+            mins = np.minimum(mins[0::2], mins[1::2])
+            maxs = np.maximum(maxs[0::2], maxs[1::2])
+            self.levels.append((mins, maxs))
+
+    @property
+    def nbytes(self) -> int:
+        """Get the memory used by the pyramid."""
+        return self.levels[0][0].nbytes + sum(
+            mins.nbytes + maxs.nbytes for mins, maxs in self.levels[1:]
+        )
+
+    def window(
+        self, start: int, end: int, pixels: int
+    ) -> tuple[int, NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]]:
+        """Read `[start, end)` with at most about `pixels` buckets.
+
+        Only the returned buckets are touched, so this takes O(pixels) time.
+
+        Args:
+            start: First position of the window.
+            end: Position the window ends before.
+            pixels: Target number of buckets.
+
+        Returns:
+            Bucket size, and the position, minimum and maximum of each bucket.
+        """
+        level = min(
+            max(0, int(np.ceil(np.log2(max(end - start, 1) / pixels)))),
+            len(self.levels) - 1,
+        )
+        mins, maxs = self.levels[level]
+        first, last = start >> level, -(-end >> level)
+        index = np.arange(first, last) << level
+        return 1 << level, index, mins[first:last], maxs[first:last]
+
+
+PYRAMIDS: LRUCache[str, Pyramid] = LRUCache(
+    settings.pyramid_cache_bytes, sizeof=lambda pyramid: pyramid.nbytes
+)
+
+
+def window(key: str, start: int, end: int, pixels: int) -> ChartWindow:
+    """Read a window of a cached chart pyramid.
+
+    Args:
+        key: Key of the chart.
+        start: First position of the window.
+        end: Position the window ends before. Clipped to the series length.
+        pixels: Target number of buckets.
+
+    Raises:
+        ValueError: If the chart has no cached pyramid or the window is empty.
+    """
+    pyramid = PYRAMIDS.get(key)
+    if pyramid is None:
+        raise ValueError(f"No pyramid cached for chart {key}.")
+    start, end = max(start, 0), min(end, pyramid.length)
+    if start >= end or pixels < 1:
+        raise ValueError("The window must be non-empty and `pixels` positive.")
+
+    bucket_size, index, mins, maxs = pyramid.window(start, end, pixels)
+    return ChartWindow(
+        key=key,
+        start=start,
+        end=end,
+        bucket_size=bucket_size,
+        index=index.tolist(),
+        min=mins.tolist(),
+        max=maxs.tolist(),
+    )
+
+
+def encode_array(
+    values: Sequence[int | float] | NDArray,
+    dtype: ArrayDtype,
+) -> EncodedArray:
+    """Encode values as a base64 little-endian typed array.
+
+    Args:
+        values: Values to encode.
+        dtype: Element type of the encoded array.
+    """
+    array = np.asarray(values, dtype=np.dtype(dtype).newbyteorder("<"))
+    return EncodedArray(
+        dtype=dtype,
+        length=len(array),
+        data=base64.b64encode(array.tobytes()).decode("ascii"),
+    )
+
+
+def decode_array(encoded: EncodedArray) -> NDArray:
+    """Decode a typed array produced by `encode_array`.
+
+    Args:
+        encoded: Encoded array.
+    """
+    dtype = np.dtype(encoded.dtype).newbyteorder("<")
+    return np.frombuffer(base64.b64decode(encoded.data), dtype=dtype)
+
+
+def render(chart: Chart) -> Chart:
+    """Prepare a chart for the frontend.
+
+    Values are loaded from `chart.source` if given, downsampled to at most
+    `chart.max_points` points and encoded as requested by `chart.encoding`.
+
+    Args:
+        chart: Chart to prepare.
+
+    Returns:
+        The chart itself if there is nothing to do, otherwise an updated copy.
+    """
+    short = chart.max_points is None or len(chart.data) <= chart.max_points
+    if chart.source is None and chart.encoding == "json" and short:
+        if chart.pyramid:
+            PYRAMIDS.put(chart.key, Pyramid(np.asarray(chart.data, dtype=np.float64)))
+        return chart
+
+    if chart.source is not None:
+        values = load(chart.source)
+    else:
+        values = np.asarray(chart.data, dtype=np.float64)
+    if chart.pyramid:
+        PYRAMIDS.put(chart.key, Pyramid(values))
+    update: dict[str, Any] = {}
+    index = None
+    if chart.max_points is not None and len(values) > chart.max_points:
+        update["original_length"] = len(values)
+        index, values = DOWNSAMPLERS[chart.downsample](values, chart.max_points)
+
+    if chart.encoding == "json":
+        update["data"] = values.tolist()
+        update["index"] = None if index is None else index.tolist()
+    else:
+        update["data"] = []
+        update["encoded_data"] = encode_array(values, chart.encoding)
+        if index is not None:
+            index_dtype: ArrayDtype = "int32" if index[-1] < 2**31 else "int64"
+            update["encoded_index"] = encode_array(index, index_dtype)
+    return chart.model_copy(update=update)
@@ -0,0 +1,143 @@
+"""Command line interface of the server."""
+
+import argparse
+import os
+import secrets
+from collections.abc import Sequence
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        argv: Arguments to parse. Defaults to `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="ui-mcp-server", description="MCP server for UI components."
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "sse", "streamable-http"],
+        default="stdio",
+        help="Transport to serve (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="HTTP host (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000, help="HTTP port (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--stateless",
+        action="store_true",
+        help="Handle every streamable HTTP request without a session.",
+    )
+    parser.add_argument(
+        "--json-response",
+        action="store_true",
+        help="Answer streamable HTTP requests with JSON instead of SSE streams.",
+    )
+    parser.add_argument(
+        "--compact-schemas",
+        action="store_true",
+        help="List tools with compact schemas to save tokens.",
+    )
+    parser.add_argument(
+        "--single-tool",
+        action="store_true",
+        help="Offer one render_component tool instead of a tool per component.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of HTTP worker processes sharing the listening socket. "
+            "More than one requires stateless streamable HTTP and "
+            "UI_MCP_STATE_DATABASE. "
+            "Send SIGHUP to the main process to replace them one by one "
+            "(default: %(default)s)."
+        ),
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=float,
+        default=30,
+        help=(
+            "Seconds a stopping worker waits for open requests to finish "
+            "(default: %(default)s)."
+        ),
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="INFO",
+        help="Log level (default: %(default)s).",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not (
+        args.transport == "streamable-http" and args.stateless
+    ):
+        # Sessions live in the memory of the worker that opened them, and
+        # requests are not routed back to it.
+        parser.error("--workers requires --transport streamable-http --stateless")
+    if args.workers > 1 and not os.environ.get("UI_MCP_STATE_DATABASE"):
+        # Component state kept in memory would only be found by the worker
+        # that generated the component.
+        parser.error("--workers requires UI_MCP_STATE_DATABASE")
+    return args
+
+
+def configure(args: argparse.Namespace) -> None:
+    """Pass the options to the server settings through the environment.
+
+    FastMCP and `ui_mcp_server.settings` read their settings from the
+    environment when they are created, which also makes them reach worker
+    processes. Without a media secret, one is generated here, so that all
+    workers accept the URLs signed by any of them.
+
+    Args:
+        args: Parsed command line arguments.
+    """
+    os.environ.update(
+        {
+            "FASTMCP_HOST": args.host,
+            "FASTMCP_PORT": str(args.port),
+            "FASTMCP_STATELESS_HTTP": str(args.stateless).lower(),
+            "FASTMCP_JSON_RESPONSE": str(args.json_response).lower(),
+            "FASTMCP_LOG_LEVEL": args.log_level,
+            "UI_MCP_COMPACT_SCHEMAS": str(args.compact_schemas).lower(),
+            "UI_MCP_SINGLE_TOOL": str(args.single_tool).lower(),
+        }
+    )
+    if os.environ.get("UI_MCP_MEDIA_URL") and not os.environ.get("UI_MCP_MEDIA_SECRET"):
+        os.environ["UI_MCP_MEDIA_SECRET"] = secrets.token_urlsafe(32)
+
+
+def main(argv: Sequence[str] | None = None) -> None:  # pragma: no cover
+    """Start the MCP server.
+
+    Args:
+        argv: Command line arguments. Defaults to `sys.argv[1:]`.
+    """
+    args = parse_args(argv)
+    configure(args)
+    if args.transport == "stdio":
+        from ui_mcp_server.server import server
+
+        server.run("stdio")
+        return
+
+    import uvicorn
+
+    uvicorn.run(
+        "ui_mcp_server.http:" + args.transport.replace("-", "_") + "_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level=args.log_level.lower(),
+        timeout_graceful_shutdown=args.graceful_timeout,
+    )
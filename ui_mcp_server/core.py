@@ -0,0 +1,196 @@
+"""FastMCP server with deferred tool registration."""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from typing import Any
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool
+from mcp.types import (
+    AnyFunction,
+    CallToolRequest,
+    CallToolResult,
+    ContentBlock,
+    ServerResult,
+    TextContent,
+    ToolAnnotations,
+)
+from mcp.types import Tool as MCPTool
+from ui_mcp_server import snapshot
+from ui_mcp_server.schemas import compact_tool, input_schema
+from ui_mcp_server.serialization import tool_result
+from ui_mcp_server.settings import settings
+
+
+class UIServer(FastMCP):
+    """FastMCP server that builds tool schemas only when they are needed.
+
+    Tools are registered lazily: decorating a function only records it, and
+    its schemas are built on the first tool call. Until then `tools/list` is
+    answered from the precomputed snapshot, if it is up to date.
+
+    With the `compact_schemas` setting, tools are listed with compact schemas.
+    Tools can be disabled, so that a server can offer alternative sets of tools
+    while a single snapshot covers all of them.
+
+    Tool results are serialized once, see `ui_mcp_server.serialization`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the server."""
+        super().__init__(*args, **kwargs)
+        self._pending_tools: list[tuple[AnyFunction, dict[str, Any]]] = []
+        self._compact_tools: dict[str, MCPTool] = {}
+        self.disabled_tools: set[str] = set()
+        """Names of registered tools that are neither listed nor callable."""
+
+    def _setup_handlers(self) -> None:
+        """Set up the MCP handlers, with tool results serialized once."""
+        super()._setup_handlers()
+        self._mcp_server.request_handlers[CallToolRequest] = self._handle_call_tool
+
+    def add_tool(  # noqa: PLR0917
+        self,
+        fn: AnyFunction,
+        name: str | None = None,
+        title: str | None = None,
+        description: str | None = None,
+        annotations: ToolAnnotations | None = None,
+        structured_output: bool | None = None,
+    ) -> None:
+        """Record a tool to be registered when tools are first needed."""
+        self._pending_tools.append(
+            (
+                fn,
+                {
+                    "name": name,
+                    "title": title,
+                    "description": description,
+                    "annotations": annotations,
+                    "structured_output": structured_output,
+                },
+            )
+        )
+
+    def register_tools(self) -> None:
+        """Register all recorded tools, building their schemas."""
+        while self._pending_tools:
+            fn, kwargs = self._pending_tools.pop(0)
+            super().add_tool(fn, **kwargs)
+            tool = self._tool_manager.get_tool(kwargs["name"] or fn.__name__)
+            if tool is not None:
+                tool.parameters = input_schema(tool.parameters)
+
+    def enabled_tools(self) -> list[Tool]:
+        """Register the recorded tools and get the enabled ones."""
+        self.register_tools()
+        return [
+            tool
+            for tool in self._tool_manager.list_tools()
+            if tool.name not in self.disabled_tools
+        ]
+
+    async def list_all_tools(self, use_snapshot: bool = True) -> list[MCPTool]:
+        """List all tools, including the disabled ones.
+
+        Args:
+            use_snapshot: Whether to answer from the snapshot if it is up to date.
+        """
+        tools = self._snapshot_tools() if use_snapshot else None
+        if tools is None:
+            self.register_tools()
+            tools = await super().list_tools()
+        return tools
+
+    async def list_tools(self, compact: bool | None = None) -> list[MCPTool]:
+        """List all available tools.
+
+        Args:
+            compact: Whether to compact the schemas. Defaults to the
+                `compact_schemas` setting.
+        """
+        tools = [
+            tool
+            for tool in await self.list_all_tools()
+            if tool.name not in self.disabled_tools
+        ]
+        if settings.compact_schemas if compact is None else compact:
+            return [self._compact(tool) for tool in tools]
+        return tools
+
+    def _snapshot_tools(self) -> list[MCPTool] | None:
+        """Get the tools from the snapshot if it matches the pending tools."""
+        if not self._pending_tools:
+            return None
+        tools = snapshot.load()
+        pending = {kwargs["name"] or fn.__name__ for fn, kwargs in self._pending_tools}
+        if tools is None or pending != {tool["name"] for tool in tools}:
+            return None
+        return [MCPTool.model_validate(tool) for tool in tools]
+
+    def _compact(self, tool: MCPTool) -> MCPTool:
+        """Get the compact form of a tool, compacting each tool only once."""
+        if tool.name not in self._compact_tools:
+            self._compact_tools[tool.name] = compact_tool(tool)
+        return self._compact_tools[tool.name]
+
+    def tools_digest(self) -> str:
+        """Get a digest of the tool list, which changes whenever the list does.
+
+        Derived from the snapshot stamp and the options affecting the list, so
+        it is available without building any schema.
+        """
+        digest = hashlib.sha256(json.dumps(snapshot.stamp()).encode())
+        digest.update(json.dumps(sorted(self.disabled_tools)).encode())
+        digest.update(str(settings.compact_schemas).encode())
+        return digest.hexdigest()
+
+    def session_id(self) -> str:
+        """Get the ID of the current MCP session.
+
+        Streamable HTTP sessions are identified by their `Mcp-Session-Id`
+        header and SSE sessions by their `session_id` query parameter. Stdio,
+        stateless HTTP and calls outside of a request share the empty ID, and
+        so share their component state: any of their clients can read and set
+        the components of the others, given their keys.
+        """
+        try:
+            request = self.get_context().request_context.request
+        except ValueError:
+            return ""
+        if request is None:
+            return ""
+        return request.headers.get("mcp-session-id") or request.query_params.get(
+            "session_id", ""
+        )
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> Sequence[ContentBlock] | dict[str, Any]:
+        """Call a tool by name with arguments."""
+        if name in self.disabled_tools:
+            raise ToolError(f"Unknown tool: {name}")
+        self.register_tools()
+        return await super().call_tool(name, arguments)
+
+    async def _handle_call_tool(self, request: CallToolRequest) -> ServerResult:
+        """Handle a `tools/call` request."""
+        name = request.params.name
+        try:
+            if name in self.disabled_tools:
+                raise ToolError(f"Unknown tool: {name}")
+            self.register_tools()
+            tool = self._tool_manager.get_tool(name)
+            if tool is None:
+                raise ToolError(f"Unknown tool: {name}")
+            result = await tool.run(
+                request.params.arguments or {}, context=self.get_context()
+            )
+            return ServerResult(tool_result(result, tool.fn_metadata))
+        except Exception as e:
+            return ServerResult(
+                CallToolResult(
+                    content=[TextContent(type="text", text=str(e))], isError=True
+                )
+            )
@@ -0,0 +1,109 @@
+"""ASGI applications for the HTTP transports.
+
+The apps are created by factories, so that `uvicorn --factory` (or the
+`--workers` option of the CLI) can create one in every worker process. Every
+app serves `GET /health` with the health of the worker that answers it, and
+the media files published with signed URLs, see `ui_mcp_server.media`.
+"""
+
+import logging
+import os
+import time
+import anyio
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from ui_mcp_server.media import ROUTE, serve_media
+
+
+class Health:
+    """Health of the current worker process."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.started = time.monotonic()
+        self.requests = 0
+        self.in_flight = 0
+
+    def report(self) -> dict[str, float | int | str]:
+        """Get the health report of the worker."""
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "uptime": round(time.monotonic() - self.started, 3),
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+        }
+
+
+health = Health()
+
+
+class CountRequests:
+    """Middleware counting the HTTP requests handled by the worker."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an app."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        health.requests += 1
+        health.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            health.in_flight -= 1
+
+
+async def report_health(request: Request) -> JSONResponse:
+    """Report the health of the worker answering the request."""
+    return JSONResponse(health.report())
+
+
+def _not_closed_stream(record: logging.LogRecord) -> bool:
+    """Filter out errors caused by writing to a closed stream.
+
+    In stateless mode the streams of a request are closed as soon as it has
+    been answered, so the MCP SDK logs a `ClosedResourceError` with a full
+    traceback for every request. Formatting that traceback costs more than
+    handling the request itself.
+    """
+    return record.exc_info is None or not isinstance(
+        record.exc_info[1], anyio.ClosedResourceError
+    )
+
+
+def quiet_stateless_errors() -> None:
+    """Stop logging the harmless error of every stateless request."""
+    logger = logging.getLogger("mcp.server.streamable_http")
+    if _not_closed_stream not in logger.filters:
+        logger.addFilter(_not_closed_stream)
+
+
+def _with_health(app: Starlette) -> Starlette:
+    """Add the health and media routes and request counting to an app."""
+    app.add_route("/health", report_health, methods=["GET"])
+    app.add_route(ROUTE, serve_media, methods=["GET", "HEAD"])
+    app.add_middleware(CountRequests)
+    return app
+
+
+def streamable_http_app() -> Starlette:
+    """Create the streamable HTTP app, e.g. for `uvicorn --factory`."""
+    from ui_mcp_server.server import server
+
+    if server.settings.stateless_http:
+        quiet_stateless_errors()
+    return _with_health(server.streamable_http_app())
+
+
+def sse_app() -> Starlette:
+    """Create the SSE app, e.g. for `uvicorn --factory`."""
+    from ui_mcp_server.server import server
+
+    return _with_health(server.sse_app())
@@ -0,0 +1,255 @@
+"""Resized and re-encoded derivatives of local images.
+
+Image outputs carry a display `width` and an `output_format`, but a local image
+would be sent as is, so that every client downloads and decodes it at full
+resolution. With the `image_cache_dir` setting, the server creates a
+derivative of each local image instead: scaled down to the width, if it is
+smaller than the image, and encoded in the output format, WEBP for `auto`.
+Images needing neither are left untouched.
+
+Derivatives are created with Pillow, an optional dependency, in a thread pool
+so that large images do not block the server. They are stored in the cache
+directory under a digest of the path, modification time, width and format of
+the source, so that an edited image gets new derivatives. The least recently
+used derivatives are deleted when the directory exceeds `image_cache_bytes`.
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from ui_mcp_server.models import BaseComponent, ImageOutput
+from ui_mcp_server.paths import local_media, resolve_path
+from ui_mcp_server.settings import settings
+
+
+FORMATS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+"""File extension of each derivative format."""
+
+QUALITY = 85
+"""Quality of lossy encodings."""
+
+
+class DerivativeCache:
+    """Directory of derivatives, bounded in bytes, least recently used first.
+
+    Files already in the directory are adopted, oldest first, so that the
+    budget holds across restarts.
+
+    Args:
+        directory: Directory of the derivatives, created if missing.
+        max_bytes: Maximum total size of the derivatives.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        """Open the cache directory."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        directory.mkdir(parents=True, exist_ok=True)
+        files = [(path.stat(), path.name) for path in directory.iterdir()]
+        for stat, name in sorted(files, key=lambda file: file[0].st_mtime):
+            if Path(name).suffix in FORMATS.values():
+                self._files[name] = stat.st_size
+                self.size += stat.st_size
+
+    def __len__(self) -> int:
+        """Get the number of cached derivatives."""
+        return len(self._files)
+
+    def get(self, name: str) -> Path | None:
+        """Get a derivative and mark it as recently used.
+
+        Args:
+            name: File name of the derivative.
+
+        Returns:
+            Its path, or None if it is not cached.
+        """
+        path = self.directory / name
+        with self._lock:
+            if name not in self._files:
+                return None
+            self._files.move_to_end(name)
+        try:
+            os.utime(path)
+        except FileNotFoundError:  # Deleted by another worker.
+            with self._lock:
+                self._discard(name)
+            return None
+        return path
+
+    def add(self, name: str) -> Path:
+        """Record a derivative written to the directory, evicting old ones.
+
+        Args:
+            name: File name of the derivative.
+
+        Returns:
+            Its path.
+        """
+        path = self.directory / name
+        size = path.stat().st_size
+        with self._lock:
+            self._discard(name)
+            self._files[name] = size
+            self.size += size
+            while self.size > self.max_bytes and len(self._files) > 1:
+                oldest, oldest_size = self._files.popitem(last=False)
+                self.size -= oldest_size
+                (self.directory / oldest).unlink(missing_ok=True)
+        return path
+
+    def _discard(self, name: str) -> None:
+        """Forget a derivative. The lock must be held."""
+        size = self._files.pop(name, None)
+        if size is not None:
+            self.size -= size
+
+
+def derivative_name(path: Path, width: int | None, image_format: str) -> str:
+    """Get the file name of a derivative.
+
+    Args:
+        path: Resolved path of the source image.
+        width: Target width, or None to keep the width.
+        image_format: Format of the derivative, a key of `FORMATS`.
+
+    Returns:
+        The name, a digest of the source and the parameters.
+    """
+    key = f"{path}\n{path.stat().st_mtime_ns}\n{width}\n{image_format}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+    return digest + FORMATS[image_format]
+
+
+def create_derivative(
+    source: Path, target: Path, width: int | None, image_format: str
+) -> bool:
+    """Resize and re-encode an image, if it needs either.
+
+    Args:
+        source: Path of the image.
+        target: Path to write the derivative to.
+        width: Width to scale the image down to, or None to keep it.
+        image_format: Format to encode the derivative in.
+
+    Returns:
+        Whether a derivative was written, False if the image already has the
+        width and format.
+    """
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise ImportError(
+            "Install Pillow, e.g. `pip install ui-mcp-server[images]`, "
+            "to create image derivatives."
+        ) from e
+    with Image.open(source) as image:
+        if width is not None and width < image.width:
+            image.thumbnail((width, image.height), Image.Resampling.LANCZOS)
+        elif image.format == image_format:
+            return False
+        derivative: Image.Image = image
+        if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+            derivative = image.convert("RGB")
+        # Unique per thread, as a batch may derive the same image twice at once.
+        partial = target.with_name(
+            f".{target.name}.{os.getpid()}.{threading.get_ident()}"
+        )
+        derivative.save(partial, format=image_format, quality=QUALITY)
+    os.replace(partial, target)
+    return True
+
+
+class Derivatives:
+    """Creates derivatives of local images in a thread pool, with a disk cache.
+
+    Args:
+        cache: Cache of the derivatives.
+        workers: Number of threads creating derivatives.
+    """
+
+    def __init__(self, cache: DerivativeCache, workers: int) -> None:
+        """Initialize the thread pool."""
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="images")
+
+    def get(self, path: Path, width: int | None, image_format: str) -> Path:
+        """Get the derivative of an image, creating it if it is not cached.
+
+        Args:
+            path: Path of the image.
+            width: Width to scale the image down to, or None to keep it.
+            image_format: Format of the derivative, a key of `FORMATS`.
+
+        Returns:
+            The path of the derivative, or of the image if it needs none or
+            does not exist.
+        """
+        source = resolve_path(path)
+        if not source.is_file():
+            return path
+        name = derivative_name(source, width, image_format)
+        cached = self.cache.get(name)
+        if cached is not None:
+            return cached
+        if not create_derivative(
+            source, self.cache.directory / name, width, image_format
+        ):
+            return path
+        return self.cache.add(name)
+
+    async def derive[T: BaseComponent](self, component: T) -> T:
+        """Replace local images with their derivatives.
+
+        Args:
+            component: Component, or batch of components, to update in place.
+                The images of a batch are processed concurrently.
+
+        Returns:
+            The component.
+        """
+        await asyncio.gather(
+            *(
+                self._derive(image, path)
+                for image, path in local_media(component, ImageOutput)
+            )
+        )
+        return component
+
+    async def _derive(self, image: ImageOutput, path: Path) -> None:
+        """Replace a local image with its derivative, in the thread pool."""
+        image_format = "WEBP" if image.output_format == "auto" else image.output_format
+        future = self._executor.submit(self.get, path, image.width, image_format)
+        image.url = await asyncio.wrap_future(future)
+
+
+def create_derivatives() -> Derivatives | None:
+    """Create the derivatives configured by the settings, None if disabled."""
+    if settings.image_cache_dir is None:
+        return None
+    cache = DerivativeCache(settings.image_cache_dir, settings.image_cache_bytes)
+    return Derivatives(cache, settings.image_workers)
+
+
+derivatives = create_derivatives()
+
+
+async def derive[T: BaseComponent](component: T) -> T:
+    """Replace local images with derivatives, if `image_cache_dir` is set.
+
+    Args:
+        component: Component, or batch of components, to update in place.
+
+    Returns:
+        The component.
+    """
+    if derivatives is None:
+        return component
+    return await derivatives.derive(component)
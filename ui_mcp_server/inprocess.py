@@ -0,0 +1,72 @@
+"""Use the server in-process, e.g. embedded in a Python agent.
+
+Talking to the server over stdio costs a subprocess, JSON-RPC framing and
+encoding every message twice. In-process, there are two alternatives:
+
+- `connect` gives an MCP client session connected to the server over memory
+  streams, for code written against MCP, e.g. `load_mcp_tools` of
+  `langchain-mcp-adapters`.
+- `langchain_tools` gives the tools as LangChain tools calling the tool
+  functions directly. Arguments are validated by the same models as over MCP
+  and the result is serialized once.
+"""
+
+import functools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+import anyio
+from mcp import ClientSession
+from mcp.server.fastmcp.tools import Tool
+from mcp.shared.memory import create_connected_server_and_client_session
+from ui_mcp_server.serialization import dump_json
+from ui_mcp_server.server import server
+
+
+if TYPE_CHECKING:
+    from langchain_core.tools import StructuredTool
+
+
+@asynccontextmanager
+async def connect() -> AsyncIterator[ClientSession]:
+    """Connect an initialized MCP client session to the server in-process."""
+    async with create_connected_server_and_client_session(
+        server._mcp_server
+    ) as session:
+        yield session
+
+
+def _to_text(result: Any) -> str:
+    """Serialize a tool result like the text content of MCP results."""
+    return dump_json(result).decode()
+
+
+def _langchain_tool(tool: Tool) -> "StructuredTool":
+    """Wrap a registered tool as a LangChain tool."""
+    from langchain_core.tools import StructuredTool
+
+    def call(**arguments: Any) -> str:
+        if tool.is_async:
+            return _to_text(anyio.run(functools.partial(tool.fn, **arguments)))
+        return _to_text(tool.fn(**arguments))
+
+    async def acall(**arguments: Any) -> str:
+        if tool.is_async:
+            return _to_text(await tool.fn(**arguments))
+        return call(**arguments)  # Avoids a thread hop for the sync tools.
+
+    return StructuredTool(
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.fn_metadata.arg_model,
+        func=call,
+        coroutine=acall,
+    )
+
+
+def langchain_tools() -> list["StructuredTool"]:
+    """Get the enabled tools as LangChain tools.
+
+    Tool results are returned as JSON, like the text content of MCP results.
+    """
+    return [_langchain_tool(tool) for tool in server.enabled_tools()]
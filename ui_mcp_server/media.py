@@ -0,0 +1,172 @@
+"""Serving local media files over HTTP.
+
+Audio, video and image outputs accept a local path as URL, which frontends
+would have to read whole. With the `media_url` setting, the server publishes
+such paths as signed URLs under `/media` of its HTTP app instead, and serves
+them itself:
+
+- The URL carries the path, an expiry time and an HMAC signature of both, so
+  that only files the server published can be requested, until
+  `media_token_ttl` seconds later, and only from the data directories, which
+  must be set, or the image cache of `ui_mcp_server.images`.
+- `Range` requests are answered with the requested bytes only, so that players
+  can seek in large videos without downloading them.
+- Responses carry an `ETag` and a `Last-Modified` header, and revalidation
+  requests with `If-None-Match` or `If-Modified-Since` are answered with
+  `304 Not Modified`.
+- Files are streamed in large chunks, never read whole, and handed to the ASGI
+  server as a path when it supports the zero-copy `pathsend` extension.
+"""
+
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import quote
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from ui_mcp_server.models import AudioOutput, BaseComponent, ImageOutput, VideoOutput
+from ui_mcp_server.paths import local_media, resolve_media
+from ui_mcp_server.settings import settings
+
+
+ROUTE = "/media/{token}/{name}"
+"""Route of the media files in the HTTP app."""
+
+_SECRET = (settings.media_secret or secrets.token_urlsafe(32)).encode()
+_SIGNATURE_BYTES = 16
+
+
+class MediaResponse(FileResponse):
+    """File response streaming in chunks large enough for video."""
+
+    chunk_size = 2**20
+
+
+def _encode(data: bytes) -> str:
+    """Encode bytes for a URL path segment."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _decode(text: str) -> bytes:
+    """Decode bytes encoded by `_encode`."""
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _signature(path: bytes, expires: int) -> bytes:
+    """Sign a path and its expiry time."""
+    message = path + b"\n" + str(expires).encode()
+    return hmac.digest(_SECRET, message, hashlib.sha256)[:_SIGNATURE_BYTES]
+
+
+def _resolve(path: Path) -> Path:
+    """Resolve the path of a file to serve, if the data directories are set.
+
+    With no data directories, any path is allowed, which would let a tool call
+    publish any file of the server.
+    """
+    if not settings.data_dirs:
+        raise ValueError("Set `data_dirs` to serve media files.")
+    return resolve_media(path)
+
+
+def sign(path: Path) -> str:
+    """Get the signed URL of a local file.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The URL under the `media_url` setting.
+
+    Raises:
+        ValueError: If `media_url` or `data_dirs` is unset, or the path is
+            outside the data directories and the image cache.
+    """
+    if settings.media_url is None:
+        raise ValueError("Set `media_url` to serve media files.")
+    data = str(_resolve(path)).encode()
+    expires = int(time.time() + settings.media_token_ttl)
+    token = f"{_encode(data)}.{expires}.{_encode(_signature(data, expires))}"
+    return f"{settings.media_url.rstrip('/')}/media/{token}/{quote(path.name)}"
+
+
+def verify(token: str) -> Path:
+    """Get the path of a signed URL token.
+
+    Args:
+        token: Token of the URL, made of the encoded path, the expiry time and
+            their signature.
+
+    Raises:
+        ValueError: If the signature does not match, the token expired or the
+            path is outside the data directories and the image cache.
+    """
+    try:
+        encoded, expiry, signature = token.split(".")
+        data, expires, expected = _decode(encoded), int(expiry), _decode(signature)
+    except ValueError as e:
+        raise ValueError("Malformed media token.") from e
+    if not hmac.compare_digest(_signature(data, expires), expected):
+        raise ValueError("Invalid media signature.")
+    if expires < time.time():
+        raise ValueError("Expired media token.")
+    return _resolve(Path(data.decode()))
+
+
+def publish[T: BaseComponent](component: T) -> T:
+    """Replace the local paths of media outputs with signed URLs.
+
+    Args:
+        component: Component, or batch of components.
+
+    Returns:
+        A copy of the component with signed URLs, or the component itself if
+        it has no local media or `media_url` is unset.
+    """
+    kinds = (AudioOutput, VideoOutput, ImageOutput)
+    if settings.media_url is None or not local_media(component, kinds):
+        return component
+    component = component.model_copy(deep=True)
+    for output, path in local_media(component, kinds):
+        output.url = sign(path)
+    return component
+
+
+def _not_modified(response: Headers, request: Headers) -> bool:
+    """Tell whether the client's copy of a file is still valid."""
+    if (tags := request.get("if-none-match")) is not None:
+        etag = response["etag"]
+        return tags.strip() == "*" or etag in (tag.strip() for tag in tags.split(","))
+    if (since := request.get("if-modified-since")) is not None:
+        try:
+            return parsedate_to_datetime(response["last-modified"]) <= (
+                parsedate_to_datetime(since)
+            )
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def serve_media(request: Request) -> Response:
+    """Serve a media file published with a signed URL."""
+    try:
+        path = verify(request.path_params["token"])
+    except ValueError as e:
+        return PlainTextResponse(str(e), status_code=403)
+    if not path.is_file():
+        return PlainTextResponse("Not found.", status_code=404)
+    response = MediaResponse(
+        path, stat_result=path.stat(), headers={"cache-control": "private, no-cache"}
+    )
+    if _not_modified(response.headers, request.headers):
+        headers = {
+            name: response.headers[name]
+            for name in ("etag", "last-modified", "cache-control")
+        }
+        return Response(status_code=304, headers=headers)
+    return response
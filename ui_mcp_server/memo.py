@@ -0,0 +1,113 @@
+"""Content-addressed component keys and memoized rendering.
+
+By default every component gets a random key, so that a retried or repeated
+tool call produces a new component, which frontends mount from scratch, with
+new state. With the `content_keys` setting, keys are derived from the session
+and the content of the component instead: identical requests in a session get
+the same key, and the components of a batch get keys derived from the batch
+key and their position. Calls without a session ID keep random keys, as all
+their clients share the empty ID.
+
+Rendered components are memoized by their key in an LRU cache bounded in bytes.
+An identical request then returns the cached component without rendering it
+again, e.g. without downsampling a chart, and frontends can tell from the key
+that they already rendered it. Charts reading a data source, and batches with
+such charts, are not memoized, as the file may have changed.
+"""
+
+import uuid
+from collections.abc import Callable
+from typing import Any, cast
+from ui_mcp_server.cache import LRUCache
+from ui_mcp_server.models import BaseComponent, Batch, Chart
+
+
+NAMESPACE = uuid.UUID("5d0c5b0e-7f55-4b8e-9a4c-6f0d3c1e2a71")
+"""Namespace of the content keys, which are UUIDs like the random keys."""
+
+_KEYS: Any = {"key": True, "components": {"__all__": {"key"}}}
+"""Fields excluded from the content of a component or batch."""
+
+
+def content_key(session: str, component: BaseComponent) -> str:
+    """Derive the key of a component from its content.
+
+    Args:
+        session: ID of the session the key is scoped to.
+        component: Component, whose current key is ignored.
+
+    Returns:
+        The key, the same for components of equal content in a session.
+    """
+    content = component.model_dump_json(exclude=_KEYS)
+    return str(uuid.uuid5(NAMESPACE, f"{session}\n{content}"))
+
+
+def set_keys(component: BaseComponent, key: str) -> None:
+    """Set the key of a component and derive those of the components of a batch.
+
+    Args:
+        component: Component to update.
+        key: Key of the component.
+    """
+    component.key = key
+    if isinstance(component, Batch):
+        for position, child in enumerate(component.components):
+            child.key = str(uuid.uuid5(NAMESPACE, f"{key}/{position}"))
+
+
+def _reads_source(component: BaseComponent) -> bool:
+    """Tell whether a component, or a component of a batch, reads a data source."""
+    if isinstance(component, Batch):
+        return any(_reads_source(child) for child in component.components)
+    return isinstance(component, Chart) and component.source is not None
+
+
+def _sizeof(component: BaseComponent) -> int:
+    """Estimate the memory taken by a component by its JSON size."""
+    return len(component.model_dump_json())
+
+
+class Memo:
+    """Rendered components by content key, least recently used evicted first.
+
+    Args:
+        max_bytes: Memory budget of the cached components, in bytes.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty memo."""
+        self._components: LRUCache[str, BaseComponent] = LRUCache(
+            max_bytes, sizeof=_sizeof
+        )
+
+    def __len__(self) -> int:
+        """Get the number of cached components."""
+        return len(self._components)
+
+    def render[T: BaseComponent](
+        self, session: str, component: T, render: Callable[[T], T]
+    ) -> T:
+        """Render a component with its content key, or get it from the cache.
+
+        Args:
+            session: ID of the session.
+            component: Requested component. Its keys are replaced.
+            render: Function rendering the component, called on cache misses.
+
+        Returns:
+            The rendered component, the cached one if it was rendered before.
+        """
+        key = content_key(session, component)
+        cached = self._components.get(key)
+        if cached is not None:
+            return cast(T, cached)
+        set_keys(component, key)
+        rendered = render(component)
+        if not _reads_source(rendered):
+            self._components.put(key, rendered)
+        return rendered
+
+    def clear(self) -> None:
+        """Remove all cached components."""
+        self._components.clear()
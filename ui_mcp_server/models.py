@@ -1,10 +1,19 @@
 """Models for UI components."""
 
 import uuid
-from datetime import date, time
+from datetime import date, datetime, time
 from pathlib import Path
-from typing import Any, Literal
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Literal
+from pydantic import BaseModel, Field, JsonValue, model_validator
+
+
+SERVER_SET: dict[str, JsonValue] = {"readOnly": True}
+"""Schema extra of the fields set by the server, left out of input schemas."""
+
+
+def server_set() -> Any:
+    """Declare an optional field that only the server sets."""
+    return Field(default=None, json_schema_extra=SERVER_SET)
 
 
 class BaseComponent(BaseModel, use_attribute_docstrings=True):
@@ -15,6 +24,15 @@ class BaseComponent(BaseModel, use_attribute_docstrings=True):
     key: str = Field(default_factory=lambda: str(uuid.uuid4()), init=False)
     """Unique identifier for the component."""
 
+    def clear_server_fields(self) -> None:
+        """Unset the fields only the server sets, e.g. if a client sent them."""
+        for name, field in type(self).model_fields.items():
+            if (
+                field.json_schema_extra == SERVER_SET
+                and getattr(self, name) is not None
+            ):
+                setattr(self, name, None)
+
 
 class InputComponent(BaseComponent):
     """Configuration for user input components."""
@@ -104,21 +122,112 @@ class AudioInput(InputComponent):
 class CameraInput(InputComponent):
     """Configuration for camera input components."""
 
-    type: str = "camera_input"
+    type: Literal["camera_input"] = "camera_input"
     """UI component type."""
 
 
+ArrayDtype = Literal["float32", "float64", "int32", "int64"]
+"""Element types supported by `EncodedArray`."""
+
+
+class EncodedArray(BaseModel, use_attribute_docstrings=True):
+    """Typed array encoded as base64 little-endian bytes."""
+
+    dtype: ArrayDtype
+    """Element type of the array."""
+    length: int
+    """Number of elements in the array."""
+    data: str
+    """Base64 encoding of the little-endian array bytes."""
+
+
+class DataSource(BaseModel, use_attribute_docstrings=True):
+    """Reference to a column of a local data file."""
+
+    path: Path
+    """Path of a `.csv`, `.npy`, `.parquet`, `.arrow` or `.feather` file."""
+    column: str | int | None = None
+    """Name or position of the column to read. Defaults to the first column."""
+    start: int | None = Field(default=None, ge=0)
+    """First row to read."""
+    stop: int | None = Field(default=None, ge=0)
+    """Row to stop reading before."""
+    step: int | None = Field(default=None, ge=1)
+    """Read every `step`-th row."""
+    group_size: int = Field(default=1, ge=1)
+    """Number of consecutive rows aggregated into one value."""
+    aggregate: Literal["mean", "sum", "min", "max"] = "mean"
+    """How rows in a group are aggregated."""
+
+
 class Chart(OutputComponent):
     """Parameters for chart components."""
 
     type: Literal["line", "bar", "scatter"]
     """UI component type."""
-    data: list[int | float]
+    data: list[int | float] = Field(default_factory=list)
     """List of values for the component."""
+    source: DataSource | None = None
+    """Local file to read the values from, instead of listing them in `data`."""
     x_label: str
     """Label of the x-axis."""
     y_label: str
     """Label of the y-axis."""
+    max_points: int | None = Field(default=None, ge=3)
+    """Maximum number of points to send. Longer data is downsampled."""
+    downsample: Literal["lttb", "minmax", "mean"] = "lttb"
+    """Algorithm used to downsample data longer than `max_points`."""
+    index: list[int] | None = server_set()
+    """Positions of the data points in the original series. Set by the server."""
+    original_length: int | None = server_set()
+    """Length of the data before downsampling. Set by the server."""
+    pyramid: bool = False
+    """Whether to cache a multi-resolution pyramid of the full data, so that
+    `chart_window` can zoom into it."""
+    encoding: Literal["json", "float32", "float64"] = "json"
+    """Encoding of the data. Binary encodings move `data` and `index` into
+    `encoded_data` and `encoded_index`."""
+    encoded_data: EncodedArray | None = server_set()
+    """Data as a typed array. Set by the server for binary encodings."""
+    encoded_index: EncodedArray | None = server_set()
+    """Index as a typed array. Set by the server for binary encodings."""
+
+    @model_validator(mode="after")
+    def check_data_or_source(self) -> "Chart":
+        """Make sure the values are given only once."""
+        if self.data and self.source is not None:
+            raise ValueError("Provide either `data` or `source`, not both.")
+        return self
+
+
+class ChartWindow(BaseModel, use_attribute_docstrings=True):
+    """Window of a chart series at a reduced resolution."""
+
+    key: str
+    """Key of the chart."""
+    start: int
+    """First position of the window in the original series."""
+    end: int
+    """Position the window ends before in the original series."""
+    bucket_size: int
+    """Number of original points summarised by each bucket."""
+    index: list[int]
+    """Position of the first point of each bucket."""
+    min: list[float]
+    """Minimum value of each bucket."""
+    max: list[float]
+    """Maximum value of each bucket."""
+
+
+class Waveform(BaseModel, use_attribute_docstrings=True):
+    """Peaks of an audio file, to draw its waveform without decoding it."""
+
+    bucket_size: int
+    """Number of frames summarised by each bucket."""
+    min: list[float]
+    """Minimum sample of each bucket over all channels, between -1 and 1."""
+    max: list[float]
+    """Maximum sample of each bucket over all channels, between -1 and 1."""
 
 
 class AudioOutput(OutputComponent):
@@ -131,7 +240,15 @@ class AudioOutput(OutputComponent):
     format: Literal["audio/mp3", "audio/wav", "audio/ogg"]
     """Format of the audio."""
     sample_rate: int | None = None
-    """Sample rate of the audio."""
+    """Sample rate of the audio. Set by the server along with the waveform."""
+    waveform_buckets: int | None = Field(default=None, ge=1)
+    """Number of waveform buckets to compute for a local file, e.g. the width of
+    the waveform in pixels."""
+    waveform: Waveform | None = server_set()
+    """Peaks of the audio. Set by the server when `waveform_buckets` is set."""
+    duration: float | None = server_set()
+    """Duration of the audio in seconds. Set by the server along with the
+    waveform."""
     loop: bool = False
     """Whether to loop the audio."""
     autoplay: bool = False
@@ -141,7 +258,7 @@ class AudioOutput(OutputComponent):
 class VideoOutput(OutputComponent):
     """Configuration for video output components."""
 
-    type: str = "video"
+    type: Literal["video"] = "video"
     """UI component type."""
     url: str | Path
     """URL or path of the video."""
@@ -160,7 +277,7 @@ class VideoOutput(OutputComponent):
 class ImageOutput(OutputComponent):
     """Configuration for image output components."""
 
-    type: str = "image"
+    type: Literal["image"] = "image"
     """UI component type."""
     url: str | Path
     """URL or path of the image."""
@@ -174,3 +291,79 @@ class ImageOutput(OutputComponent):
     """Channels of the image."""
     output_format: Literal["auto", "JPEG", "PNG", "WEBP"]
     """Output format of the image."""
+    image_width: int | None = server_set()
+    """Width of the image file in pixels. Set by the server for local files."""
+    image_height: int | None = server_set()
+    """Height of the image file in pixels. Set by the server for local files."""
+    blurhash: str | None = server_set()
+    """BlurHash of the image, to show as a placeholder while it loads. Set by
+    the server for local files."""
+
+
+Component = Annotated[
+    NumberInput
+    | Choice
+    | ColorPicker
+    | DateInput
+    | TimeInput
+    | AudioInput
+    | CameraInput
+    | Chart
+    | AudioOutput
+    | VideoOutput
+    | ImageOutput,
+    Field(discriminator="type"),
+]
+"""Any UI component, discriminated by its `type`."""
+
+
+class Batch(BaseComponent):
+    """Configuration for an ordered group of components, e.g. a form."""
+
+    type: Literal["batch"] = "batch"
+    """UI component type."""
+    components: list[Component]
+    """Components to render, in display order."""
+
+    def clear_server_fields(self) -> None:
+        """Unset the fields only the server sets in every component."""
+        for component in self.components:
+            component.clear_server_fields()
+
+
+class ComponentState(BaseModel, use_attribute_docstrings=True):
+    """State of an input component generated in the current session."""
+
+    component: Component
+    """The component as generated."""
+    value: JsonValue = None
+    """Value submitted by the user, or None if none was submitted yet."""
+    updated_at: datetime
+    """When the component was generated or its value was last set."""
+
+
+class Submission(BaseModel, use_attribute_docstrings=True):
+    """Value submitted for an input component."""
+
+    key: str
+    """Key of the component."""
+    value: JsonValue
+    """Submitted value."""
+
+
+class SubmissionCheck(BaseModel, use_attribute_docstrings=True):
+    """Result of checking a submitted value against its component."""
+
+    key: str
+    """Key of the component."""
+    valid: bool
+    """Whether the value satisfies the constraints of the component."""
+    error: str | None = None
+    """Why the value is invalid, if it is."""
+
+
+class Validation(BaseModel, use_attribute_docstrings=True):
+    """Results of checking submitted values."""
+
+    results: list[SubmissionCheck]
+    """Result of each submission, in order."""
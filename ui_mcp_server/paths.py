@@ -0,0 +1,95 @@
+"""Local files referenced by components."""
+
+import os
+from pathlib import Path
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+from ui_mcp_server.models import (
+    AudioOutput,
+    BaseComponent,
+    Batch,
+    ImageOutput,
+    VideoOutput,
+)
+from ui_mcp_server.settings import settings
+
+
+MediaOutput = AudioOutput | VideoOutput | ImageOutput
+"""Output components whose `url` may point to a local file."""
+
+
+def resolve_path(path: Path) -> Path:
+    """Resolve a path, making sure it is inside the allowed data directories.
+
+    Args:
+        path: Path to resolve.
+
+    Raises:
+        ValueError: If the path is outside `settings.data_dirs`.
+    """
+    resolved = path.expanduser().resolve()
+    if settings.data_dirs and not any(
+        resolved.is_relative_to(directory.expanduser().resolve())
+        for directory in settings.data_dirs
+    ):
+        raise ValueError(f"{path} is outside the allowed data directories.")
+    return resolved
+
+
+def resolve_media(path: Path) -> Path:
+    """Resolve the path of a media file, allowing the image cache as well.
+
+    Args:
+        path: Path to resolve.
+
+    Raises:
+        ValueError: If the path is outside `settings.data_dirs` and
+            `settings.image_cache_dir`.
+    """
+    cache = settings.image_cache_dir
+    if cache is not None and path.resolve().is_relative_to(cache.resolve()):
+        return path.resolve()
+    return resolve_path(path)
+
+
+def local_path(url: str | Path) -> Path | None:
+    """Get the local file a media URL points to.
+
+    Args:
+        url: Path, `file:` URL, or absolute path or URL as a string. Tools
+            receive paths as strings, since JSON has no path type.
+
+    Returns:
+        The path, or None if the URL is remote or relative.
+    """
+    if isinstance(url, Path):
+        return url
+    if os.path.isabs(url):
+        return Path(url)
+    parts = urlsplit(url)
+    if parts.scheme == "file" and parts.netloc in ("", "localhost"):
+        return Path(url2pathname(parts.path))
+    return None
+
+
+def local_media[M: MediaOutput](
+    component: BaseComponent, kind: type[M] | tuple[type[M], ...]
+) -> list[tuple[M, Path]]:
+    """Find the media outputs of a component tree that point to local files.
+
+    Args:
+        component: Component, or batch of components.
+        kind: Type, or types, of the outputs to find.
+
+    Returns:
+        Each output, in display order, with the path of its file.
+    """
+    if isinstance(component, Batch):
+        return [
+            found
+            for child in component.components
+            for found in local_media(child, kind)
+        ]
+    if isinstance(component, kind) and (path := local_path(component.url)):
+        return [(component, path)]
+    return []
@@ -0,0 +1,271 @@
+"""Dimensions and placeholders of local images.
+
+Until an image is loaded, a frontend does not know its size, so the layout
+jumps when it arrives. For image outputs of local files, the server adds the
+dimensions of the image and a BlurHash of it to the component, so that
+frontends can reserve the space and show a blurred placeholder right away.
+
+Dimensions are read from the file header, without decoding the image, for
+PNG, GIF, WEBP, BMP and JPEG, taking the EXIF orientation of JPEG into
+account. The BlurHash, a string of about 30 characters, is computed from a
+thumbnail decoded at reduced scale, with Pillow if it is installed. Both are
+cached by path, modification time and size.
+"""
+
+import asyncio
+import math
+import struct
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+import numpy as np
+from numpy.typing import NDArray
+from ui_mcp_server.cache import LRUCache
+from ui_mcp_server.models import BaseComponent, ImageOutput
+from ui_mcp_server.paths import local_media, resolve_media
+
+
+BASE83 = (
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    "#$%*+,-.:;=?@[]^_{|}~"
+)
+"""Digits of the base 83 encoding of BlurHash."""
+
+THUMBNAIL_PIXELS = 32
+"""Size of the thumbnail the BlurHash is computed from."""
+
+_JPEG_FRAMES = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+"""JPEG start of frame markers, which carry the dimensions."""
+
+_ROTATED = frozenset(range(5, 9))
+"""EXIF orientations that swap width and height."""
+
+
+class ImageInfo(NamedTuple):
+    """Dimensions and placeholder of an image."""
+
+    width: int | None
+    """Width of the image in pixels, if its format is known."""
+    height: int | None
+    """Height of the image in pixels, if its format is known."""
+    blurhash: str | None
+    """BlurHash of the image, if Pillow could decode it."""
+
+
+CACHE: LRUCache[tuple[str, int, int], ImageInfo] = LRUCache(4096)
+"""Information of recently used files, by path, modification time and size."""
+
+
+def _exif_rotated(segment: bytes) -> bool:
+    """Tell whether an EXIF segment orients the image a quarter turn."""
+    if not segment.startswith(b"Exif\0\0") or len(segment) < 16:
+        return False
+    tiff = segment[6:]
+    order = "<" if tiff[:2] == b"II" else ">"
+    (offset,) = struct.unpack(order + "I", tiff[4:8])
+    if offset + 2 > len(tiff):
+        return False
+    (count,) = struct.unpack(order + "H", tiff[offset : offset + 2])
+    for entry in range(offset + 2, min(offset + 2 + 12 * count, len(tiff) - 11), 12):
+        tag, _, _, value = struct.unpack(order + "HHIH", tiff[entry : entry + 10])
+        if tag == 0x0112:
+            return value in _ROTATED
+    return False
+
+
+def _jpeg_size(file: BinaryIO) -> tuple[int, int] | None:
+    """Read the dimensions of a JPEG image, skipping from segment to segment."""
+    rotated = False
+    file.seek(2)
+    while (marker := file.read(2))[:1] == b"\xff" and len(marker) == 2:
+        kind = marker[1]
+        while kind == 0xFF:  # Fill bytes.
+            kind = file.read(1)[0]
+        (length,) = struct.unpack(">H", file.read(2))
+        if kind in _JPEG_FRAMES:
+            height, width = struct.unpack(">xHH", file.read(5))
+            return (height, width) if rotated else (width, height)
+        if kind == 0xE1:
+            rotated = rotated or _exif_rotated(file.read(length - 2))
+        else:
+            file.seek(length - 2, 1)
+    return None
+
+
+def _png_size(head: bytes) -> tuple[int, int] | None:
+    """Read the dimensions of a PNG image from its first bytes."""
+    if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+        return struct.unpack(">II", head[16:24])
+    return None
+
+
+def _gif_size(head: bytes) -> tuple[int, int] | None:
+    """Read the dimensions of a GIF image from its first bytes."""
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return struct.unpack("<HH", head[6:10])
+    return None
+
+
+def _webp_size(head: bytes) -> tuple[int, int] | None:
+    """Read the dimensions of a lossy, lossless or extended WEBP image."""
+    if not head.startswith(b"RIFF") or head[8:12] != b"WEBP":
+        return None
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, (bits >> 14 & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        return width, int.from_bytes(head[27:30], "little") + 1
+    return None
+
+
+def _bmp_size(head: bytes) -> tuple[int, int] | None:
+    """Read the dimensions of a BMP image from its first bytes."""
+    if head.startswith(b"BM") and len(head) >= 26:
+        width, height = struct.unpack("<ii", head[18:26])
+        return width, abs(height)
+    return None
+
+
+def image_size(path: Path) -> tuple[int, int] | None:
+    """Read the dimensions of an image from its header.
+
+    Args:
+        path: Path of the image.
+
+    Returns:
+        The width and height as displayed, or None if the format is unknown.
+    """
+    with path.open("rb") as file:
+        head = file.read(32)
+        for read_size in (_png_size, _gif_size, _webp_size, _bmp_size):
+            if (size := read_size(head)) is not None:
+                return size
+        if head.startswith(b"\xff\xd8"):
+            try:
+                return _jpeg_size(file)
+            except (struct.error, IndexError):  # Truncated file.
+                return None
+    return None
+
+
+def _encode83(value: int, length: int) -> str:
+    """Encode an integer in base 83."""
+    return "".join(
+        BASE83[value // 83 ** (length - position) % 83]
+        for position in range(1, length + 1)
+    )
+
+
+def _to_srgb(value: float) -> int:
+    """Convert a linear color channel to an sRGB byte."""
+    value = min(max(value, 0.0), 1.0)
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(pixels: NDArray[np.uint8], x_components: int, y_components: int) -> str:
+    """Compute the BlurHash of an image.
+
+    Args:
+        pixels: RGB pixels of the image, e.g. a thumbnail, as rows.
+        x_components: Number of horizontal components, from 1 to 9.
+        y_components: Number of vertical components, from 1 to 9.
+
+    Returns:
+        The BlurHash.
+    """
+    height, width = pixels.shape[:2]
+    srgb = pixels[..., :3] / 255
+    linear = np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+    basis_x = np.cos(
+        np.pi * np.outer(np.arange(x_components), np.arange(width)) / width
+    )
+    basis_y = np.cos(
+        np.pi * np.outer(np.arange(y_components), np.arange(height)) / height
+    )
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (width * height)
+    factors *= 2
+    factors[0, 0] /= 2
+    dc, ac = factors[0, 0], factors.reshape(-1, 3)[1:]
+    encoded = _encode83(x_components - 1 + (y_components - 1) * 9, 1)
+    if len(ac):
+        quantised = int(max(0, min(82, math.floor(np.abs(ac).max() * 166 - 0.5))))
+        maximum = (quantised + 1) / 166
+        encoded += _encode83(quantised, 1)
+    else:
+        maximum = 1.0
+        encoded += _encode83(0, 1)
+    red, green, blue = (_to_srgb(channel) for channel in dc)
+    encoded += _encode83((red << 16) + (green << 8) + blue, 4)
+    scaled = np.sign(ac) * np.abs(ac / maximum) ** 0.5
+    quantised_ac = np.clip(np.floor(scaled * 9 + 9.5), 0, 18).astype(int)
+    for red, green, blue in quantised_ac:
+        encoded += _encode83(red * 19 * 19 + green * 19 + blue, 2)
+    return encoded
+
+
+def _placeholder(path: Path) -> str | None:
+    """Compute the BlurHash of an image, if Pillow can decode it."""
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return None
+    try:
+        with Image.open(path) as image:
+            image.draft("RGB", (THUMBNAIL_PIXELS * 2, THUMBNAIL_PIXELS * 2))
+            thumbnail = ImageOps.exif_transpose(image).convert("RGB")
+    except OSError:
+        return None
+    thumbnail.thumbnail((THUMBNAIL_PIXELS, THUMBNAIL_PIXELS))
+    landscape = thumbnail.width >= thumbnail.height
+    return blurhash(np.asarray(thumbnail), 4 if landscape else 3, 3 if landscape else 4)
+
+
+def describe(path: Path) -> ImageInfo:
+    """Get the dimensions and placeholder of an image, using the cache.
+
+    Args:
+        path: Path of the image.
+
+    Returns:
+        The information, all None if the file does not exist.
+
+    Raises:
+        ValueError: If the path is outside the allowed data directories and
+            the image cache.
+    """
+    resolved = resolve_media(path)
+    if not resolved.is_file():
+        return ImageInfo(None, None, None)
+    stat = resolved.stat()
+    key = (str(resolved), stat.st_mtime_ns, stat.st_size)
+    info = CACHE.get(key)
+    if info is None:
+        size = image_size(resolved)
+        width, height = (None, None) if size is None else size
+        info = ImageInfo(width, height, _placeholder(resolved))
+        CACHE.put(key, info)
+    return info
+
+
+async def measure[T: BaseComponent](component: T) -> T:
+    """Add dimensions and placeholders to image outputs of local files.
+
+    Args:
+        component: Component, or batch of components, to update in place.
+
+    Returns:
+        The component.
+    """
+    images = local_media(component, ImageOutput)
+    infos = await asyncio.gather(
+        *(asyncio.to_thread(describe, path) for _, path in images)
+    )
+    for (image, _), info in zip(images, infos, strict=True):
+        image.image_width, image.image_height, image.blurhash = info
+    return component
@@ -0,0 +1,183 @@
+"""Compact tool schemas.
+
+The JSON schemas of the tools carry every field docstring, titles and
+indirections that help humans more than models, and they are sent to the model
+on every turn. The compact form keeps what a model needs to call the tools:
+
+- `title` keywords and the `discriminator` hints are removed.
+- Definitions referenced only once are inlined, and the rest stay in `$defs`.
+- Optional fields accept their type instead of `anyOf` it or null.
+- A field description is kept only the first time it appears for a field name.
+- Output schemas have no descriptions, as they are only used to validate
+  results.
+- The `Args:` section of tool descriptions is removed.
+"""
+
+import re
+from collections import Counter
+from typing import Any
+from mcp.types import Tool
+
+
+_DROPPED_KEYWORDS = ("title", "discriminator")
+_ARGS_SECTION = re.compile(r"\n\s*Args:\n.*", re.DOTALL)
+
+
+def _refs(node: Any, counts: Counter[str]) -> Counter[str]:
+    """Count the `$ref` targets in a schema."""
+    if isinstance(node, dict):
+        if isinstance(ref := node.get("$ref"), str):
+            counts[ref] += 1
+        for key, value in node.items():
+            if key not in _DROPPED_KEYWORDS:
+                _refs(value, counts)
+    elif isinstance(node, list):
+        for item in node:
+            _refs(item, counts)
+    return counts
+
+
+class _Compactor:
+    """Compacts one schema."""
+
+    def __init__(self, schema: dict[str, Any], descriptions: bool) -> None:
+        """Prepare compacting a schema."""
+        self.dropped = _DROPPED_KEYWORDS + (() if descriptions else ("description",))
+        self.defs: dict[str, Any] = schema.get("$defs", {})
+        self.counts = _refs(schema, Counter())
+        self.descriptions: set[tuple[str, str]] = set()
+
+    def inlined(self, ref: str) -> bool:
+        """Tell whether a reference is replaced by its definition."""
+        return self.counts[ref] == 1 and ref.startswith("#/$defs/")
+
+    def node(self, node: Any) -> Any:
+        """Compact a schema node."""
+        if isinstance(node, list):
+            return [self.node(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        ref = node.get("$ref")
+        if isinstance(ref, str) and self.inlined(ref):
+            rest = {key: value for key, value in node.items() if key != "$ref"}
+            node = self.defs[ref.removeprefix("#/$defs/")] | rest
+        compact = {}
+        for key, value in node.items():
+            if key in self.dropped or key == "$defs":
+                continue
+            if key == "properties":
+                compact[key] = {
+                    name: self.property(name, schema) for name, schema in value.items()
+                }
+            else:
+                compact[key] = self.node(value)
+        return self.optional(compact)
+
+    def property(self, name: str, schema: dict[str, Any]) -> Any:
+        """Compact the schema of a property, dropping repeated descriptions."""
+        description = schema.get("description")
+        if description is not None:
+            if (name, description) in self.descriptions:
+                schema = {k: v for k, v in schema.items() if k != "description"}
+            self.descriptions.add((name, description))
+        return self.node(schema)
+
+    @staticmethod
+    def optional(node: dict[str, Any]) -> dict[str, Any]:
+        """Replace `anyOf` a type or null, defaulting to null, with the type."""
+        variants = node.get("anyOf")
+        if "default" not in node or node["default"] is not None or not variants:
+            return node
+        types = [variant for variant in variants if variant != {"type": "null"}]
+        if len(types) == len(variants):
+            return node
+        node = {key: value for key, value in node.items() if key != "default"}
+        if len(types) == 1:
+            del node["anyOf"]
+            return types[0] | node
+        node["anyOf"] = types
+        return node
+
+    def schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Compact a whole schema."""
+        compact = self.node(schema)
+        defs = {
+            name: self.node(definition)
+            for name, definition in self.defs.items()
+            if self.counts[f"#/$defs/{name}"] > 1
+        }
+        if defs:
+            compact["$defs"] = defs
+        return compact
+
+
+def compact_schema(schema: dict[str, Any], descriptions: bool = True) -> dict[str, Any]:
+    """Compact a JSON schema.
+
+    Args:
+        schema: Schema to compact. It is not modified.
+        descriptions: Whether to keep the descriptions.
+
+    Returns:
+        The compact schema.
+    """
+    return _Compactor(schema, descriptions).schema(schema)
+
+
+def compact_tool(tool: Tool) -> Tool:
+    """Compact the description and schemas of a tool.
+
+    Args:
+        tool: Tool to compact. It is not modified.
+
+    Returns:
+        The compact tool.
+    """
+    update: dict[str, Any] = {"inputSchema": compact_schema(tool.inputSchema)}
+    if tool.description is not None:
+        update["description"] = _ARGS_SECTION.sub("", tool.description).strip()
+    if tool.outputSchema is not None:
+        update["outputSchema"] = compact_schema(tool.outputSchema, descriptions=False)
+    return tool.model_copy(update=update)
+
+
+def _without_read_only(node: Any) -> Any:
+    """Remove the read-only properties from a schema node."""
+    if isinstance(node, list):
+        return [_without_read_only(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    stripped = {key: _without_read_only(value) for key, value in node.items()}
+    if isinstance(properties := node.get("properties"), dict):
+        stripped["properties"] = {
+            name: _without_read_only(schema)
+            for name, schema in properties.items()
+            if not schema.get("readOnly")
+        }
+    return stripped
+
+
+def input_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Remove the fields set by the server from the input schema of a tool.
+
+    Fields marked `readOnly` are only set by the server, so they are left out
+    of input schemas, along with the definitions only they used. Output
+    schemas keep them.
+
+    Args:
+        schema: Schema to strip. It is not modified.
+
+    Returns:
+        The schema without read-only properties.
+    """
+    stripped = _without_read_only(schema)
+    defs = stripped.get("$defs", {})
+    body = {key: value for key, value in stripped.items() if key != "$defs"}
+    while unused := defs.keys() - {
+        ref.removeprefix("#/$defs/") for ref in _refs([body, defs], Counter())
+    }:
+        for name in unused:
+            del defs[name]
+    if "$defs" in stripped and not defs:
+        del stripped["$defs"]
+    return stripped
@@ -0,0 +1,59 @@
+"""Serialization of tool results.
+
+By default, FastMCP serializes the result of a tool three times: to indented
+JSON for the text content, to a dict for the structured content, and the
+lowlevel server then validates that dict against the output schema with
+`jsonschema`, checking the schema itself on every call. Tools returning
+pydantic models cannot produce invalid output, so `tool_result` serializes the
+result to JSON once, with the serializer pydantic compiled for its model, and
+reuses the bytes: decoded as the text content and parsed as the structured
+content. Dates, times and paths are serialized natively by these serializers.
+"""
+
+from typing import Any
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata
+from mcp.types import CallToolResult, TextContent
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+
+def dump_json(result: Any) -> bytes:
+    """Serialize a tool result to compact JSON.
+
+    Args:
+        result: Value returned by a tool.
+
+    Returns:
+        The JSON, with field aliases like the structured content.
+    """
+    if isinstance(result, BaseModel):
+        return result.__pydantic_serializer__.to_json(result, by_alias=True)
+    return to_json(result, by_alias=True)
+
+
+def tool_result(result: Any, metadata: FuncMetadata) -> CallToolResult:
+    """Build the MCP result of a tool call.
+
+    Args:
+        result: Value returned by the tool.
+        metadata: Metadata of the tool function, which tells whether it has
+            structured output and whether it is wrapped in a `result` field.
+
+    Returns:
+        The result with text content and, for tools with an output schema,
+        structured content.
+    """
+    if metadata.output_schema is None or not isinstance(result, BaseModel):
+        converted = metadata.convert_result(result)
+        if isinstance(converted, tuple):
+            content, structured = converted
+            return CallToolResult(content=list(content), structuredContent=structured)
+        return CallToolResult(content=list(converted))
+    data = dump_json(result)
+    structured = from_json(data)
+    if metadata.wrap_output:
+        structured = {"result": structured}
+    return CallToolResult(
+        content=[TextContent(type="text", text=data.decode())],
+        structuredContent=structured,
+    )
@@ -1,22 +1,86 @@
 """Tools for UI components."""
 
-from mcp.server.fastmcp import FastMCP
+import asyncio
+from collections.abc import Callable
+from typing import Annotated
+from pydantic import Field, JsonValue
+from ui_mcp_server.core import UIServer
+from ui_mcp_server.images import derive
+from ui_mcp_server.media import publish
+from ui_mcp_server.memo import Memo
 from ui_mcp_server.models import (
     AudioInput,
     AudioOutput,
+    BaseComponent,
+    Batch,
     CameraInput,
     Chart,
+    ChartWindow,
     Choice,
     ColorPicker,
+    Component,
+    ComponentState,
     DateInput,
     ImageOutput,
     NumberInput,
+    Submission,
+    SubmissionCheck,
     TimeInput,
+    Validation,
     VideoOutput,
 )
+from ui_mcp_server.settings import settings
+from ui_mcp_server.state import store
 
 
-server = FastMCP("ui-mcp-server")
+server = UIServer("ui-mcp-server")
+memo = Memo(settings.memo_bytes)
+
+
+async def prepare[T: BaseComponent](component: T) -> T:
+    """Derive and measure local images and analyze local audio of media outputs."""
+    component.clear_server_fields()
+    if isinstance(component, AudioOutput | Batch):
+        from ui_mcp_server.audio import analyze  # Defers importing NumPy.
+
+        component = await analyze(component)
+    if isinstance(component, ImageOutput | Batch):
+        from ui_mcp_server.placeholders import measure
+
+        component = await measure(await derive(component))
+    return component
+
+
+def render_contents(batch: Batch) -> Batch:
+    """Render the charts of a batch."""
+    from ui_mcp_server.charts import render  # Defers importing NumPy.
+
+    batch.components = [
+        render(component) if isinstance(component, Chart) else component
+        for component in batch.components
+    ]
+    return batch
+
+
+def remember[T: BaseComponent](
+    component: T, render: Callable[[T], T] | None = None
+) -> T:
+    """Render a component, publish its media and keep its state for the session.
+
+    With the `content_keys` setting, the component gets a key derived from
+    its content and an identical component rendered before is reused. Calls
+    without a session ID, e.g. over stdio or stateless HTTP, get random keys,
+    since their clients cannot be told apart. Components are memoized before
+    their media is published, so every call gets URLs signed afresh.
+    """
+    session = server.session_id()
+    if settings.content_keys and session:
+        component = memo.render(session, component, render or (lambda c: c))
+    elif render is not None:
+        component = render(component)
+    component = publish(component)
+    store.remember(session, component)
+    return component
 
 
 @server.prompt()
@@ -25,6 +89,16 @@ def ui_component_prompt() -> str:  # pragma: no cover
     return "Use the tools from the ui-mcp-server to generate a UI components, which will be used in a frontend application. When tools are called, the next response should be something very short and concise."  # noqa: E501
 
 
+@server.resource("ui://tools/digest", mime_type="text/plain")
+def tools_digest() -> str:
+    """Digest of the tool list, for clients caching it.
+
+    The digest changes whenever `tools/list` would return something else, so
+    clients only need to list the tools again when it changed.
+    """
+    return server.tools_digest()
+
+
 @server.tool()
 def number_input(params: NumberInput) -> NumberInput:
     """Generate a number input component.
@@ -32,7 +106,7 @@ def number_input(params: NumberInput) -> NumberInput:
     Args:
         params: Parameters for the number input component.
     """
-    return params
+    return remember(params)
 
 
 @server.tool()
@@ -42,17 +116,38 @@ def choice(params: Choice) -> Choice:
     Args:
         params: Parameters for the choice input component.
     """
-    return params
+    return remember(params)
 
 
 @server.tool()
-def chart(params: Chart) -> Chart:
+async def chart(params: Chart) -> Chart:
     """Generate a chart component.
 
     Args:
         params: Parameters for the chart component.
     """
-    return params
+    from ui_mcp_server.charts import render  # Defers importing NumPy.
+
+    params.clear_server_fields()
+    # Reading a source and downsampling would block the event loop.
+    return await asyncio.to_thread(remember, params, render)
+
+
+@server.tool()
+def chart_window(key: str, start: int, end: int, pixels: int) -> ChartWindow:
+    """Get a window of a chart at a reduced resolution, e.g. to zoom in.
+
+    Only available for charts generated with `pyramid` enabled.
+
+    Args:
+        key: Key of the chart.
+        start: First position of the window in the original series.
+        end: Position the window ends before in the original series.
+        pixels: Target number of points, e.g. the width of the chart in pixels.
+    """
+    from ui_mcp_server.charts import window
+
+    return window(key, start, end, pixels)
 
 
 @server.tool()
@@ -62,7 +157,7 @@ def color_picker(params: ColorPicker) -> ColorPicker:
     Args:
         params: Parameters for the color picker component.
     """
-    return params
+    return remember(params)
 
 
 @server.tool()
@@ -72,7 +167,7 @@ def date_input(params: DateInput) -> DateInput:
     Args:
         params: Parameters for the date input component.
     """
-    return params
+    return remember(params)
 
 
 @server.tool()
@@ -82,7 +177,7 @@ def time_input(params: TimeInput) -> TimeInput:
     Args:
         params: Parameters for the time input component.
     """
-    return params
+    return remember(params)
 
 
 @server.tool()
@@ -92,7 +187,7 @@ def audio_input(params: AudioInput) -> AudioInput:
     Args:
         params: Parameters for the audio input component.
     """
-    return params
+    return remember(params)
 
 
 @server.tool()
@@ -102,17 +197,17 @@ def camera_input(params: CameraInput) -> CameraInput:
     Args:
         params: Parameters for the camera input component.
     """
-    return params
+    return remember(params)
 
 
 @server.tool()
-def audio_output(params: AudioOutput) -> AudioOutput:
+async def audio_output(params: AudioOutput) -> AudioOutput:
     """Generate an audio output component.
 
     Args:
         params: Parameters for the audio output component.
     """
-    return params
+    return remember(await prepare(params))
 
 
 @server.tool()
@@ -122,17 +217,160 @@ def video_output(params: VideoOutput) -> VideoOutput:
     Args:
         params: Parameters for the video output component.
     """
-    return params
+    return remember(params)
 
 
 @server.tool()
-def image_output(params: ImageOutput) -> ImageOutput:
+async def image_output(params: ImageOutput) -> ImageOutput:
     """Generate an image output component.
 
     Args:
         params: Parameters for the image output component.
     """
-    return params
+    return remember(await prepare(params))
+
+
+@server.tool()
+async def render_component(params: Component) -> Component:
+    """Generate a UI component of any type.
+
+    Args:
+        params: Parameters of the component, whose `type` selects the component.
+    """
+    if isinstance(params, Chart):
+        return await chart(params)
+    return remember(await prepare(params))
+
+
+@server.tool()
+async def render_batch(params: Batch) -> Batch:
+    """Generate several components at once, e.g. all fields of a form.
+
+    Prefer this tool over calling the single-component tools repeatedly.
+
+    Args:
+        params: Components to render, in display order.
+    """
+    # Charts are rendered like with the chart tool, off the event loop.
+    return await asyncio.to_thread(remember, await prepare(params), render_contents)
+
+
+@server.tool()
+def get_component_state(key: str) -> ComponentState:
+    """Get an input component generated in this session and its submitted value.
+
+    Args:
+        key: Key of the component.
+    """
+    state = store.get(server.session_id(), key)
+    if state is None:
+        raise ValueError(f"Unknown component: {key}")
+    return state
+
+
+@server.tool()
+def set_component_value(key: str, value: JsonValue) -> ComponentState:
+    """Set the value the user submitted for an input component.
+
+    Args:
+        key: Key of the component.
+        value: Submitted value.
+    """
+    state = store.set_value(server.session_id(), key, value)
+    if state is None:
+        raise ValueError(f"Unknown component: {key}")
+    return state
+
+
+@server.tool()
+def validate_values(submissions: list[Submission]) -> Validation:
+    """Check values submitted for input components against their parameters.
+
+    Checks number bounds and steps, choice options, date bounds, time steps and
+    color formats of many values in one call, e.g. all fields of a form.
+
+    Args:
+        submissions: Keys of the components and the values submitted for them.
+    """
+    from ui_mcp_server.validation import check  # Defers importing NumPy.
+
+    session = server.session_id()
+    states = [store.get(session, submission.key) for submission in submissions]
+    errors = check(
+        [None if state is None else state.component for state in states],
+        [submission.value for submission in submissions],
+    )
+    return Validation(
+        results=[
+            SubmissionCheck(key=submission.key, valid=error is None, error=error)
+            for submission, error in zip(submissions, errors, strict=True)
+        ]
+    )
+
+
+@server.tool()
+async def list_media(
+    label: str,
+    *,
+    kind: str | None = None,
+    extensions: list[str] | None = None,
+    prefix: str | None = None,
+    offset: Annotated[int, Field(ge=0)] = 0,
+    limit: Annotated[int, Field(ge=1)] = 50,
+    multiselect: bool = False,
+) -> Choice:
+    """Generate a choice component listing media files of the data directories.
+
+    Files come from an index kept up to date with the data directories, so
+    prefer this tool over listing directories. Options are the full paths of
+    the files, sorted by name, to display with the output tools.
+
+    Args:
+        label: Label of the choice component.
+        kind: `audio`, `image`, `video`, or a MIME type like `image/png`.
+        extensions: File extensions, e.g. `[".mp3", ".wav"]`.
+        prefix: Case-insensitive prefix of the file names.
+        offset: Number of matching files to skip, to list the next page.
+        limit: Maximum number of files.
+        multiselect: Whether the user may select several files.
+    """
+    from ui_mcp_server.catalogue import index
+
+    if not index.roots:
+        raise ValueError("Set `data_dirs` to list media files.")
+    paths = await asyncio.to_thread(
+        index.query,
+        kind=kind,
+        extensions=extensions,
+        prefix=prefix,
+        offset=offset,
+        limit=limit,
+    )
+    component = Choice(
+        type="multiselect" if multiselect else "radio", label=label, options=paths
+    )
+    return remember(component)
+
+
+COMPONENT_TOOLS = (
+    number_input,
+    choice,
+    chart,
+    color_picker,
+    date_input,
+    time_input,
+    audio_input,
+    camera_input,
+    audio_output,
+    video_output,
+    image_output,
+)
+"""Tools replaced by `render_component` with the `single_tool` setting."""
+
+if settings.single_tool:
+    server.disabled_tools.update(tool.__name__ for tool in COMPONENT_TOOLS)
+else:
+    server.disabled_tools.add(render_component.__name__)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,65 @@
+"""Settings for the server."""
+
+from pathlib import Path
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings, use_attribute_docstrings=True):
+    """Server settings.
+
+    All settings can be set with environment variables prefixed with `UI_MCP_`,
+    e.g. `UI_MCP_DATA_DIRS='["/srv/data"]'`.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="UI_MCP_", extra="ignore")
+
+    data_dirs: list[Path] = []
+    """Directories data files may be read from. Data sources, media URLs and the
+    media catalogue require them; local images and audio may be anywhere when
+    empty."""
+    pyramid_cache_bytes: int = 256 * 2**20
+    """Memory budget of the cached chart pyramids, in bytes."""
+    compact_schemas: bool = False
+    """Whether to list tools with compact schemas, see `ui_mcp_server.schemas`."""
+    state_database: Path | None = None
+    """SQLite database to keep component state in. Kept in memory when unset."""
+    state_history: int = 100
+    """Number of submitted values kept per component in the database."""
+    state_flush_interval: float = 0.05
+    """Seconds writes to the database may wait, to be committed in groups."""
+    state_max_sessions: int = 1000
+    """Maximum number of sessions whose component state is kept."""
+    state_session_bytes: int = 2**20
+    """Memory budget of the component state of a session, in bytes."""
+    state_ttl: float = 3600
+    """Seconds after which the component state of an idle session is evicted."""
+    content_keys: bool = False
+    """Whether component keys are derived from the session and the content, so
+    that identical requests get the same component, see `ui_mcp_server.memo`.
+    Only applies to streamable HTTP and SSE sessions, which have an ID."""
+    memo_bytes: int = 16 * 2**20
+    """Memory budget of the components cached with `content_keys`, in bytes."""
+    media_url: str | None = None
+    """Base URL of the HTTP server, e.g. `http://localhost:8000`. When set, local
+    paths of media outputs are served as signed URLs, see `ui_mcp_server.media`.
+    Requires `data_dirs`."""
+    media_token_ttl: float = 24 * 3600
+    """Seconds the signed media URLs stay valid."""
+    media_secret: str | None = None
+    """Key signing media URLs. Random when unset: the command line generates
+    one shared by its workers, other processes each get their own."""
+    image_cache_dir: Path | None = None
+    """Directory to cache resized and re-encoded local images in, see
+    `ui_mcp_server.images`. Images are sent as they are when unset."""
+    image_cache_bytes: int = 2**30
+    """Disk budget of the cached images, in bytes."""
+    image_workers: int = 4
+    """Number of threads resizing and re-encoding images."""
+    media_scan_interval: float = 2.0
+    """Seconds between updates of the index of media files, see
+    `ui_mcp_server.catalogue`."""
+    single_tool: bool = False
+    """Whether to offer one `render_component` tool instead of a tool per component."""
+
+
+settings = Settings()
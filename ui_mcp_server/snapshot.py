@@ -0,0 +1,75 @@
+"""Precomputed snapshot of the tool list.
+
+Building the JSON schemas of all tools takes a noticeable part of the server
+start-up time, so `tools/list` is answered from a snapshot shipped with the
+package. The snapshot is stamped with the package version and a digest of the
+sources the schemas are generated from and of the pydantic and MCP versions
+generating them, and is ignored when the stamp does not match. Regenerate it
+with `python -m ui_mcp_server.snapshot`.
+"""
+
+import hashlib
+import json
+from functools import cache
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+import pydantic
+from ui_mcp_server import __version__
+
+
+PATH = Path(__file__).with_name("tools.json")
+SOURCES = ("core.py", "models.py", "schemas.py", "server.py")
+"""Modules the tool schemas are generated from."""
+
+
+def stamp() -> dict[str, str]:
+    """Get the stamp identifying the current tool schemas."""
+    digest = hashlib.sha256(f"{pydantic.VERSION}\n{version('mcp')}".encode())
+    for source in SOURCES:
+        digest.update(PATH.with_name(source).read_bytes())
+    return {"version": __version__, "digest": digest.hexdigest()}
+
+
+@cache
+def load() -> list[dict[str, Any]] | None:
+    """Load the snapshot.
+
+    Returns:
+        The tools in the snapshot, or None if it is missing or out of date.
+    """
+    try:
+        snapshot = json.loads(PATH.read_text())
+    except FileNotFoundError:
+        return None
+    if snapshot["stamp"] != stamp():
+        return None
+    return snapshot["tools"]
+
+
+async def build() -> dict[str, Any]:
+    """Build a snapshot from the live tool registrations."""
+    from ui_mcp_server.server import server
+
+    server.register_tools()
+    tools = await server.list_all_tools(use_snapshot=False)
+    return {
+        "stamp": stamp(),
+        "tools": [
+            tool.model_dump(mode="json", by_alias=True, exclude_none=True)
+            for tool in tools
+        ],
+    }
+
+
+async def write() -> None:  # pragma: no cover
+    """Write a fresh snapshot next to this module."""
+    snapshot = await build()
+    PATH.write_text(json.dumps(snapshot, indent=2) + "\n")
+    load.cache_clear()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import anyio
+
+    anyio.run(write)
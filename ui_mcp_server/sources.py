@@ -0,0 +1,153 @@
+"""Readers for chart data stored in local files."""
+
+import csv
+import itertools
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+import numpy as np
+from numpy.typing import NDArray
+from ui_mcp_server.models import DataSource
+from ui_mcp_server.paths import resolve_path
+from ui_mcp_server.settings import settings
+
+
+Reader = Callable[[Path, DataSource], NDArray[np.float64]]
+
+AGGREGATES = {
+    "sum": np.add,
+    "min": np.minimum,
+    "max": np.maximum,
+}
+
+
+def _rows(source: DataSource) -> slice:
+    """Get the row slice of a source."""
+    return slice(source.start, source.stop, source.step)
+
+
+def _read_npy(path: Path, source: DataSource) -> NDArray[np.float64]:
+    """Read a `.npy` file through a memory map, copying only the selected rows."""
+    array = np.load(path, mmap_mode="r")
+    if array.dtype.names is not None:
+        field = source.column if source.column is not None else 0
+        name = field if isinstance(field, str) else array.dtype.names[field]
+        array = array[name]
+    elif array.ndim == 2:
+        if isinstance(source.column, str):
+            raise ValueError("Columns of unstructured arrays are selected by position.")
+        array = array[:, source.column or 0]
+    elif array.ndim != 1:
+        raise ValueError(f"Expected a 1D or 2D array, got {array.ndim} dimensions.")
+    return np.asarray(array[_rows(source)], dtype=np.float64)
+
+
+def _read_csv(path: Path, source: DataSource) -> NDArray[np.float64]:
+    """Stream a CSV file, parsing only the selected column of the selected rows."""
+    with path.open(newline="") as file:
+        reader = csv.reader(file)
+        first = next(reader, None)
+        if first is None:
+            return np.empty(0)
+        if isinstance(source.column, str):
+            if source.column not in first:
+                raise ValueError(f"Column {source.column!r} not found in {path}.")
+            column = first.index(source.column)
+            rows: Any = reader
+        else:
+            column = source.column or 0
+            try:
+                float(first[column])
+                rows = itertools.chain([first], reader)
+            except ValueError:  # The first row is a header.
+                rows = reader
+        rows = itertools.islice(rows, source.start, source.stop, source.step)
+        return np.fromiter((float(row[column]) for row in rows), dtype=np.float64)
+
+
+def _arrow_column(table: Any, source: DataSource) -> NDArray[np.float64]:
+    """Select and slice a column of an Arrow table."""
+    column = source.column if source.column is not None else 0
+    array = table.column(column)
+    start = source.start or 0
+    stop = len(array) if source.stop is None else min(source.stop, len(array))
+    array = array.slice(start, max(stop - start, 0)).to_numpy()
+    return np.asarray(array[:: source.step], dtype=np.float64)
+
+
+def _read_parquet(path: Path, source: DataSource) -> NDArray[np.float64]:
+    """Read a single column of a Parquet file."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pragma: no cover
+        raise ImportError("Reading Parquet files requires pyarrow.") from e
+
+    columns = None
+    if isinstance(source.column, str):
+        columns = [source.column]
+    elif source.column is not None:
+        columns = [pq.read_schema(path).names[source.column]]
+    table = pq.read_table(path, columns=columns, memory_map=True)
+    return _arrow_column(table, source.model_copy(update={"column": 0}))
+
+
+def _read_arrow(path: Path, source: DataSource) -> NDArray[np.float64]:
+    """Read a column of an Arrow IPC (Feather v2) file through a memory map."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:  # pragma: no cover
+        raise ImportError("Reading Arrow files requires pyarrow.") from e
+
+    with pa.memory_map(str(path)) as file:
+        return _arrow_column(pa.ipc.open_file(file).read_all(), source)
+
+
+READERS: dict[str, Reader] = {
+    ".npy": _read_npy,
+    ".csv": _read_csv,
+    ".parquet": _read_parquet,
+    ".arrow": _read_arrow,
+    ".feather": _read_arrow,
+}
+
+
+def aggregate(
+    values: NDArray[np.float64], group_size: int, method: str
+) -> NDArray[np.float64]:
+    """Aggregate consecutive groups of values.
+
+    Args:
+        values: Values to aggregate.
+        group_size: Number of values per group. The last group may be smaller.
+        method: One of `mean`, `sum`, `min` or `max`.
+    """
+    if group_size == 1 or len(values) == 0:
+        return values
+    starts = np.arange(0, len(values), group_size)
+    if method == "mean":
+        counts = np.diff(np.append(starts, len(values)))
+        return np.add.reduceat(values, starts) / counts
+    return AGGREGATES[method].reduceat(values, starts)
+
+
+def load(source: DataSource) -> NDArray[np.float64]:
+    """Load the values a data source refers to.
+
+    Args:
+        source: Data source to load.
+
+    Raises:
+        ValueError: If the file type is not supported or the path is not allowed.
+    """
+    if not settings.data_dirs:
+        # Any path would be allowed, letting a tool call read any file.
+        raise ValueError("Set `data_dirs` to read data sources.")
+    path = resolve_path(source.path)
+    reader = READERS.get(path.suffix.lower())
+    if reader is None:
+        raise ValueError(
+            f"Unsupported file type {path.suffix!r}. "
+            f"Supported types are {', '.join(READERS)}."
+        )
+    values = reader(path, source)
+    return aggregate(values, source.group_size, source.aggregate)
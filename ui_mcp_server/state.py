@@ -0,0 +1,191 @@
+"""Store of the state of input components.
+
+The server remembers the input components its tools generate, so that clients
+can submit values with `set_component_value` and agents can read them back
+with `get_component_state`, by key and without replaying the conversation.
+State is kept per MCP session. By default it is kept in memory: each session
+holds its components in an LRU cache bounded in bytes, and sessions are evicted
+when idle for too long or when there are too many of them. With the
+`state_database` setting it is kept in SQLite instead, see
+`ui_mcp_server.state_sqlite`, which survives restarts and is shared by workers.
+"""
+
+import atexit
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pydantic import JsonValue
+from ui_mcp_server.cache import LRUCache
+from ui_mcp_server.models import BaseComponent, Batch, ComponentState, InputComponent
+from ui_mcp_server.settings import settings
+
+
+def _sizeof(state: ComponentState) -> int:
+    """Estimate the memory taken by a state by its JSON size."""
+    return len(state.model_dump_json())
+
+
+class _Session:
+    """Components of one session."""
+
+    def __init__(self, max_bytes: int, now: float) -> None:
+        """Initialize an empty session."""
+        self.components: LRUCache[str, ComponentState] = LRUCache(
+            max_bytes, sizeof=_sizeof
+        )
+        self.last_used = now
+
+
+class StateStore(ABC):
+    """Store of component state, by session and component key."""
+
+    @abstractmethod
+    def get(self, session: str, key: str) -> ComponentState | None:
+        """Get the state of a component.
+
+        Args:
+            session: ID of the session.
+            key: Key of the component.
+
+        Returns:
+            The state, or None if the component is unknown or was evicted.
+        """
+
+    @abstractmethod
+    def put(self, session: str, state: ComponentState) -> None:
+        """Store the state of a component, replacing any previous state.
+
+        Args:
+            session: ID of the session.
+            state: State to store.
+        """
+
+    def remember(self, session: str, component: BaseComponent) -> None:
+        """Store the input components generated by a tool.
+
+        Output components have no state and are ignored. The input components
+        of a batch are stored individually. Components already stored keep
+        their state, e.g. the value submitted for a component whose identical
+        request got the same content key.
+
+        Args:
+            session: ID of the session.
+            component: Generated component.
+        """
+        if isinstance(component, Batch):
+            for child in component.components:
+                self.remember(session, child)
+        elif (
+            isinstance(component, InputComponent)
+            and self.get(session, component.key) is None
+        ):
+            state = {"component": component, "updated_at": datetime.now(UTC)}
+            self.put(session, ComponentState.model_validate(state))
+
+    def set_value(
+        self, session: str, key: str, value: JsonValue
+    ) -> ComponentState | None:
+        """Set the value submitted for a component.
+
+        Args:
+            session: ID of the session.
+            key: Key of the component.
+            value: Submitted value.
+
+        Returns:
+            The updated state, or None if the component is unknown or was evicted.
+        """
+        state = self.get(session, key)
+        if state is None:
+            return None
+        state = state.model_copy(
+            update={"value": value, "updated_at": datetime.now(UTC)}
+        )
+        self.put(session, state)
+        return state
+
+
+class MemoryStateStore(StateStore):
+    """Component state in memory, bounded per session.
+
+    Args:
+        max_sessions: Maximum number of sessions kept.
+        session_bytes: Memory budget of the components of a session, in bytes.
+        ttl: Seconds after which an idle session is evicted.
+        clock: Monotonic clock in seconds.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int,
+        session_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the store."""
+        self.max_sessions = max_sessions
+        self.session_bytes = session_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of live sessions."""
+        return len(self._sessions)
+
+    def _session(self, session: str, create: bool) -> _Session | None:
+        """Get a session, marking it as used and evicting expired sessions."""
+        now = self.clock()
+        with self._lock:
+            while self._sessions:
+                oldest = next(iter(self._sessions.values()))
+                if now - oldest.last_used <= self.ttl:
+                    break
+                self._sessions.popitem(last=False)
+            state = self._sessions.get(session)
+            if state is None:
+                if not create:
+                    return None
+                state = self._sessions[session] = _Session(self.session_bytes, now)
+                if len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session)
+            state.last_used = now
+            return state
+
+    def get(self, session: str, key: str) -> ComponentState | None:
+        """Get the state of a component."""
+        state = self._session(session, create=False)
+        return None if state is None else state.components.get(key)
+
+    def put(self, session: str, state: ComponentState) -> None:
+        """Store the state of a component, replacing any previous state."""
+        components = self._session(session, create=True)
+        assert components is not None
+        components.components.put(state.component.key, state)
+
+
+def create_store() -> StateStore:
+    """Create the store configured by the settings."""
+    if settings.state_database is not None:
+        from ui_mcp_server.state_sqlite import SQLiteStateStore
+
+        store = SQLiteStateStore(
+            settings.state_database,
+            ttl=settings.state_ttl,
+            history=settings.state_history,
+            flush_interval=settings.state_flush_interval,
+        )
+        atexit.register(store.close)
+        return store
+    return MemoryStateStore(
+        settings.state_max_sessions, settings.state_session_bytes, settings.state_ttl
+    )
+
+
+store = create_store()
@@ -0,0 +1,219 @@
+"""Component state persisted in SQLite.
+
+The database runs in WAL mode, so that the workers of an HTTP server can share
+it: readers do not block the writer and the other way round. Writes are
+buffered and committed in groups, either when enough are pending or after a
+short interval, by a background thread; reads see the pending writes of their
+own process immediately and those of other processes once committed.
+
+Submitted values are also appended to a history table. Compaction, run
+periodically by the same thread, removes sessions that have been idle for
+longer than the TTL and keeps only the latest values of each component.
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from pydantic import JsonValue
+from pydantic_core import from_json, to_json
+from ui_mcp_server.models import ComponentState
+from ui_mcp_server.state import StateStore
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS components (
+    session TEXT NOT NULL,
+    key TEXT NOT NULL,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (session, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    session TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_component ON history (session, key, id);
+"""
+
+COMPACT = (
+    """
+    DELETE FROM components WHERE session IN (
+        SELECT session FROM components GROUP BY session HAVING max(updated_at) < :idle
+    )
+    """,
+    """
+    DELETE FROM history WHERE (session, key) NOT IN (
+        SELECT session, key FROM components
+    )
+    """,
+    """
+    DELETE FROM history WHERE id IN (
+        SELECT id FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY session, key ORDER BY id DESC
+            ) AS position
+            FROM history
+        )
+        WHERE position > :history
+    )
+    """,
+)
+"""Statements removing idle sessions and old values, in order."""
+
+
+class SQLiteStateStore(StateStore):
+    """Component state and value history in a SQLite database.
+
+    Args:
+        path: Path of the database file, created if missing.
+        ttl: Seconds after which the state of a session without writes is removed.
+        history: Number of submitted values kept per component.
+        flush_interval: Seconds writes may wait before they are committed.
+        batch_size: Number of pending writes that triggers a commit right away.
+        compact_interval: Seconds between compactions.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float,
+        *,
+        history: int = 100,
+        flush_interval: float = 0.05,
+        batch_size: int = 256,
+        compact_interval: float = 60,
+    ) -> None:
+        """Open the database and start the background writer."""
+        self.ttl = ttl
+        self.history_size = history
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.compact_interval = compact_interval
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str], ComponentState] = {}
+        self._pending_history: list[tuple[str, str, str, float]] = []
+        self._compacted = time.monotonic()
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def get(self, session: str, key: str) -> ComponentState | None:
+        """Get the state of a component."""
+        with self._lock:
+            state = self._pending.get((session, key))
+            if state is not None:
+                return state
+            row = self._connection.execute(
+                "SELECT state FROM components WHERE session = ? AND key = ?",
+                (session, key),
+            ).fetchone()
+        return None if row is None else ComponentState.model_validate_json(row[0])
+
+    def put(self, session: str, state: ComponentState) -> None:
+        """Store the state of a component, replacing any previous state."""
+        with self._lock:
+            self._pending[session, state.component.key] = state
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def set_value(
+        self, session: str, key: str, value: JsonValue
+    ) -> ComponentState | None:
+        """Set the value submitted for a component, recording it in the history."""
+        state = super().set_value(session, key, value)
+        if state is not None:
+            with self._lock:
+                self._pending_history.append(
+                    (
+                        session,
+                        key,
+                        to_json(value).decode(),
+                        state.updated_at.timestamp(),
+                    )
+                )
+        return state
+
+    def history(self, session: str, key: str) -> list[tuple[datetime, JsonValue]]:
+        """Get the values submitted for a component, oldest first.
+
+        Args:
+            session: ID of the session.
+            key: Key of the component.
+
+        Returns:
+            The submission times and values, including pending ones.
+        """
+        self.flush()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT updated_at, value FROM history"
+                " WHERE session = ? AND key = ? ORDER BY id",
+                (session, key),
+            ).fetchall()
+        return [
+            (datetime.fromtimestamp(updated_at, UTC), from_json(value))
+            for updated_at, value in rows
+        ]
+
+    def flush(self) -> None:
+        """Commit the pending writes in one transaction."""
+        with self._lock:
+            if not self._pending and not self._pending_history:
+                return
+            components = [
+                (session, key, state.model_dump_json(), state.updated_at.timestamp())
+                for (session, key), state in self._pending.items()
+            ]
+            with self._transaction():
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO components VALUES (?, ?, ?, ?)", components
+                )
+                self._connection.executemany(
+                    "INSERT INTO history (session, key, value, updated_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    self._pending_history,
+                )
+            self._pending.clear()
+            self._pending_history.clear()
+
+    def compact(self) -> None:
+        """Remove idle sessions and all but the latest values of each component."""
+        self.flush()
+        parameters = {"idle": time.time() - self.ttl, "history": self.history_size}
+        with self._lock, self._transaction():
+            for statement in COMPACT:
+                self._connection.execute(statement, parameters)
+        self._compacted = time.monotonic()
+
+    def close(self) -> None:
+        """Commit the pending writes, stop the background writer and close."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._writer.join()
+        self.flush()
+        self._connection.close()
+
+    def _transaction(self) -> sqlite3.Connection:
+        """Wrap statements in a transaction. The lock must be held."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        return self._connection
+
+    def _write_loop(self) -> None:
+        """Commit pending writes and compact periodically until closed."""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+            if time.monotonic() - self._compacted >= self.compact_interval:
+                self.compact()
@@ -0,0 +1,188 @@
+"""Checks of the values submitted for input components.
+
+Values are checked against the component they were submitted for: numbers
+against the bounds and step of number inputs and sliders, choices against the
+options, dates against the bounds of date inputs, times against the step of
+time inputs and colors against the hex format. Audio and camera inputs have no
+constraints. A missing value, None, is always valid.
+
+Numbers, the bulk of high-rate form traffic, are checked together: the values
+of all number inputs of a call, including both ends of range sliders, are
+compared with their bounds and steps in one pass with NumPy.
+"""
+
+import re
+from collections.abc import Callable, Sequence
+from datetime import date, time
+from typing import Any
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import JsonValue
+from ui_mcp_server.models import (
+    BaseComponent,
+    Choice,
+    ColorPicker,
+    DateInput,
+    NumberInput,
+    TimeInput,
+)
+
+
+_COLOR = re.compile(r"#(?:[0-9a-fA-F]{3}){1,2}")
+_STEP_TOLERANCE = 1e-9
+"""Relative tolerance of the step check, for steps like 0.1 that floats round."""
+
+
+def _as_list(value: JsonValue) -> list[JsonValue]:
+    """Wrap a single value in a list, e.g. to check ranges and values alike."""
+    return value if isinstance(value, list) else [value]
+
+
+def _check_choice(component: Choice, value: JsonValue) -> str | None:
+    """Check that a value is one of the options, or a subset of them."""
+    if component.type == "multiselect":
+        if not isinstance(value, list):
+            return "Expected a list of options."
+        unknown = [option for option in value if option not in component.options]
+        return f"Unknown options: {unknown}." if unknown else None
+    if isinstance(value, int) and not isinstance(value, bool):
+        valid = 0 <= value < len(component.options)
+        return None if valid else f"Option index {value} is out of range."
+    return None if value in component.options else f"Unknown option: {value!r}."
+
+
+def _check_date(component: DateInput, value: JsonValue) -> str | None:
+    """Check that a date, or both ends of a range, are within the bounds."""
+    for item in _as_list(value):
+        try:
+            day = date.fromisoformat(item)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return f"Expected an ISO date, got {item!r}."
+        if component.min_value is not None and day < component.min_value:
+            return f"{day} is before the minimum {component.min_value}."
+        if component.max_value is not None and day > component.max_value:
+            return f"{day} is after the maximum {component.max_value}."
+    return None
+
+
+def _check_time(component: TimeInput, value: JsonValue) -> str | None:
+    """Check that a time is a multiple of the step after midnight."""
+    try:
+        moment = time.fromisoformat(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return f"Expected an ISO time, got {value!r}."
+    seconds = moment.hour * 3600 + moment.minute * 60 + moment.second
+    if component.step > 0 and (seconds % component.step or moment.microsecond):
+        return f"{moment} is not a multiple of the step of {component.step} s."
+    return None
+
+
+def _check_color(component: ColorPicker, value: JsonValue) -> str | None:
+    """Check that a color is in hex format."""
+    if isinstance(value, str) and _COLOR.fullmatch(value):
+        return None
+    return f"Expected a hex color like #ff0000, got {value!r}."
+
+
+CHECKS: dict[type[BaseComponent], Callable[[Any, JsonValue], str | None]] = {
+    Choice: _check_choice,
+    DateInput: _check_date,
+    TimeInput: _check_time,
+    ColorPicker: _check_color,
+}
+"""Check of the values of each component type, except number inputs."""
+
+
+class _Numbers:
+    """Values of number inputs, collected to be checked in one pass."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collection."""
+        self.owners: list[int] = []
+        self.values: list[float] = []
+        self.components: list[NumberInput] = []
+
+    def add(self, owner: int, component: NumberInput, value: JsonValue) -> bool:
+        """Collect a number, or both ends of a range.
+
+        Returns:
+            Whether the value was made of numbers.
+        """
+        items = _as_list(value)
+        if not items or not all(
+            isinstance(item, int | float) and not isinstance(item, bool)
+            for item in items
+        ):
+            return False
+        for item in items:
+            self.owners.append(owner)
+            self.values.append(float(item))  # type: ignore[arg-type]
+            self.components.append(component)
+        return True
+
+    def _field(self, name: str) -> NDArray[np.float64]:
+        """Get a field of the component of every value, NaN where unset."""
+        fields = (getattr(component, name) for component in self.components)
+        return np.array(
+            [np.nan if field is None else field for field in fields], dtype=np.float64
+        )
+
+    def check(self) -> list[tuple[int, str]]:
+        """Check all values against the bounds and steps of their components.
+
+        Returns:
+            The owner and error of each invalid value.
+        """
+        if not self.values:
+            return []
+        values = np.array(self.values)
+        lows = self._field("min_value")
+        highs = self._field("max_value")
+        steps = self._field("step")
+        below = values < lows
+        above = values > highs
+        steps[steps <= 0] = np.nan
+        quotients = (values - np.nan_to_num(lows)) / steps
+        off_step = np.abs(quotients - np.round(quotients)) > _STEP_TOLERANCE * (
+            np.maximum(1, np.abs(quotients))
+        )
+        errors = []
+        for position in np.flatnonzero(below | above | off_step):
+            value = self.values[position]
+            if below[position]:
+                error = f"{value:g} is less than the minimum {lows[position]:g}."
+            elif above[position]:
+                error = f"{value:g} is greater than the maximum {highs[position]:g}."
+            else:
+                error = f"{value:g} is not a multiple of the step {steps[position]:g}."
+            errors.append((self.owners[position], error))
+        return errors
+
+
+def check(
+    components: Sequence[BaseComponent | None], values: Sequence[JsonValue]
+) -> list[str | None]:
+    """Check values submitted for components.
+
+    Args:
+        components: Component of each value, or None if it is unknown.
+        values: Submitted values.
+
+    Returns:
+        The error of each value, or None if it is valid.
+    """
+    errors: list[str | None] = [None] * len(values)
+    numbers = _Numbers()
+    for position, (component, value) in enumerate(zip(components, values, strict=True)):
+        if component is None:
+            errors[position] = "Unknown component."
+        elif value is None:
+            continue
+        elif isinstance(component, NumberInput):
+            if not numbers.add(position, component, value):
+                errors[position] = f"Expected a number or a range, got {value!r}."
+        elif (check_value := CHECKS.get(type(component))) is not None:
+            errors[position] = check_value(component, value)
+    for position, error in numbers.check():
+        errors[position] = errors[position] or error
+    return errors